@@ -1,21 +1,28 @@
 from turbine_data import TurbineData
-import csv
+from hill_chart_csv import dataset_registry
 import numpy as np
-import matplotlib
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-from scipy.interpolate import griddata
-from scipy.interpolate import PchipInterpolator
-from matplotlib import path as mpath
+from scipy.interpolate import CloughTocher2DInterpolator, RegularGridInterpolator, LinearNDInterpolator
 import copy
-import matplotlib.backends.backend_agg as agg
-import matplotlib.figure as figure
+from marching_squares import find_iso_lines
+from surface_fitting import SurfaceFitter
+from grouped_pchip import GroupedPchip
 
 
 class HillChart:
     def __init__(self):        
         self.data = TurbineData()    
         
+        # Blade angle lookup, rebuilt only when the fitted blade angle grid changes
+        self.blade_angle_interpolator = None
+        self.blade_angle_interpolator_grid = None
+        self.blade_angle_fallback = None  # Cubic interpolator of the valid points, built for edge queries
+
+        # Triangulations of the fitted and plotted points, shared with views of this hill chart
+        self.surface_fitters = {}
+
+        # Grid of the fitted surfaces: points per axis, uniform or refined near the BEP
+        self.grid_resolution = 101
+        self.adaptive_grid = False
 
         self.message_callback = None  # To store the callback function
 
@@ -40,26 +47,26 @@ class HillChart:
                 print(message)
 
 
-    def read_hill_chart_values(self, filename):
-        try:
-            with open(filename, newline='', encoding='utf-8-sig') as csvfile:
-                reader = csv.DictReader(csvfile)                
-                
-                self.data.blade_angle = []
-                self.data.Q11 = []
-                self.data.n11 = []
-                self.data.efficiency = []
-                
+    def read_hill_chart_values(self, filename, use_sidecar=False):
+        """
+        Read the measured hill chart points of a CSV file into self.data.
 
-                for row in reader:
-                    self.data.blade_angle.append(float(row['Blade Angle'].strip()))
-                    self.data.Q11.append(float(row['Q11'].strip()))
-                    self.data.n11.append(float(row['n11'].strip()))  # Use strip() to handle any spaces
-                    self.data.efficiency.append(float(row['Efficiency'].strip()))
+        Files already parsed by this process are reused from the dataset registry
+        until they change on disk; the shared arrays are read-only.
+
+        Args:
+            filename (str): Path of the CSV file (Blade Angle, n11, Q11 and Efficiency columns).
+            use_sidecar (bool): Reuse / write a memory-mapped binary copy of the columns next to the file.
+        """
+        try:
+            columns = dataset_registry.load(filename, use_sidecar=use_sidecar)
+            for name, values in columns.items():
+                setattr(self.data, name, values)
 
         except Exception as e:
             self.emit_message(f"Error reading BEP values from CSV: {e}")
-            raise       
+            raise
+
     def get_data(self, data):
         self.data = data    
 
@@ -68,142 +75,83 @@ class HillChart:
 
     def extrapolate_along_n11(self, min_n11 = None, max_n11 = None, n_n11 = 10):
         n_n11 = max(3, int(round(n_n11)))
-        
-        # Convert lists to numpy arrays for easier manipulation
-        blade_angles = np.array(self.data.blade_angle)
-        n11 = np.array(self.data.n11)
-        Q11 = np.array(self.data.Q11)
-        efficiency = np.array(self.data.efficiency)
-
-        new_blade_angle = []
-        new_n11 = []
-        new_Q11 = []
-        new_efficiency = []
-
-        # Get unique blade angles
-        unique_blade_angles = np.unique(blade_angles)
-
-        for angle in unique_blade_angles:
-            # Filter data by current blade angle
-            mask = blade_angles == angle
-            n11_subset = n11[mask]
-            Q11_subset = Q11[mask]
-            efficiency_subset = efficiency[mask]
-
-            # Sort the subsets based on n11 to ensure proper interpolation
-            sorted_indices = np.argsort(n11_subset)
-            n11_subset = n11_subset[sorted_indices]
-            Q11_subset = Q11_subset[sorted_indices]
-            efficiency_subset = efficiency_subset[sorted_indices]
-
-            # Generate 10 evenly spaced new n11 values within the range of the original data
-            #new_n11_values = np.linspace(n11_subset.min(), n11_subset.max(), num=10)
-
-            if min_n11 is None:
-                min_n11 = n11_subset.min()
-            if max_n11 is None:
-                max_n11 = n11_subset.max()
-            
-            # Generate 10 evenly spac   ed new blade_angle values within the range of the original data
-            new_n11_values = np.linspace(min_n11, max_n11, n_n11)            
-
-            # Perform cubic interpolation for Q11 and efficiency
-            #Q11_interpolator = Polynomial.fit(n11_subset, Q11_subset, 2)
-            #efficiency_interpolator = Polynomial.fit(n11_subset, efficiency_subset, 2)
-            Q11_interpolator = PchipInterpolator(n11_subset, Q11_subset)
-            efficiency_interpolator = PchipInterpolator(n11_subset, efficiency_subset)
-
-            new_Q11_values = Q11_interpolator(new_n11_values)
-            new_efficiency_values = efficiency_interpolator(new_n11_values)
-
-            # Append new values to the lists
-            new_blade_angle.extend([angle] * len(new_n11_values))
-            new_n11.extend(new_n11_values)
-            new_Q11.extend(new_Q11_values)
-            new_efficiency.extend(new_efficiency_values)
-
-        # Update the data with the new interpolated points
-        self.data.blade_angle = new_blade_angle
-        self.data.n11 = new_n11
-        self.data.Q11 = new_Q11
-        self.data.efficiency = new_efficiency
+
+        # PCHIP curves of Q11 and efficiency over n11, one per blade angle
+        curves = GroupedPchip(self.data.blade_angle, self.data.n11, self.data.Q11, self.data.efficiency)
+
+        # Missing limits default to the n11 range of the first (smallest) blade angle
+        if min_n11 is None:
+            min_n11 = curves.x[0, 0]
+        if max_n11 is None:
+            max_n11 = curves.x[0, curves.counts[0] - 1]
+        new_n11_values = np.linspace(min_n11, max_n11, n_n11)
+
+        new_Q11, new_efficiency = curves(new_n11_values)
+
+        # Update the data with the new interpolated points, grouped by blade angle
+        self.data.blade_angle = np.repeat(curves.keys, n_n11)
+        self.data.n11 = np.tile(new_n11_values, len(curves.keys))
+        self.data.Q11 = new_Q11.ravel()
+        self.data.efficiency = new_efficiency.ravel()
 
     def extrapolate_along_blade_angles(self, min_angle = None, max_angle = None, n_angle = 2):
         n_angle = max(3, int(round(n_angle)))
 
-        # Convert lists to numpy arrays for easier manipulation
-        blade_angles = np.array(self.data.blade_angle)
-        n11 = np.array(self.data.n11)
-        Q11 = np.array(self.data.Q11)
-        efficiency = np.array(self.data.efficiency)
-
-        new_blade_angle = []
-        new_n11 = []
-        new_Q11 = []
-        new_efficiency = []
-
-        # Get unique n11 values
-        unique_n11_values = np.unique(n11)
-
-        for n in unique_n11_values:
-            # Filter data by current n11 value
-            mask = n11 == n
-            blade_angles_subset = blade_angles[mask]
-            Q11_subset = Q11[mask]
-            efficiency_subset = efficiency[mask]
-
-            # Ensure that n11 values are identical for each blade angle
-            if len(np.unique(n11[mask])) != 1:
-                self.emit_message(f"Inconsistent n11 values found for n11={n}")
-                continue
-
-            # Sort the subsets based on blade_angle to ensure proper interpolation
-            sorted_indices = np.argsort(blade_angles_subset)
-            blade_angles_subset = blade_angles_subset[sorted_indices]
-            Q11_subset = Q11_subset[sorted_indices]
-            efficiency_subset = efficiency_subset[sorted_indices]
-
-            if min_angle is None:
-                min_angle = blade_angles_subset.min()
-            if max_angle is None:
-                max_angle = blade_angles_subset.max()
-            
-            # Generate evenly spaced new blade_angle values within the range of the original data
-            new_blade_angle_values = np.linspace(min_angle, max_angle, n_angle)
-            
-
-            # Perform cubic interpolation for Q11 and efficiency
-            #Q11_interpolator = Polynomial.fit(blade_angles_subset, Q11_subset, 2)
-            #efficiency_interpolator = Polynomial.fit(blade_angles_subset, efficiency_subset, 2)
-            Q11_interpolator = PchipInterpolator(blade_angles_subset, Q11_subset)
-            efficiency_interpolator = PchipInterpolator(blade_angles_subset, efficiency_subset)
+        # PCHIP curves of Q11 and efficiency over blade angle, one per n11 value
+        curves = GroupedPchip(self.data.n11, self.data.blade_angle, self.data.Q11, self.data.efficiency)
 
-            new_Q11_values = Q11_interpolator(new_blade_angle_values)
-            new_efficiency_values = efficiency_interpolator(new_blade_angle_values)
+        # Missing limits default to the blade angle range of the first (smallest) n11 value
+        if min_angle is None:
+            min_angle = curves.x[0, 0]
+        if max_angle is None:
+            max_angle = curves.x[0, curves.counts[0] - 1]
+        new_blade_angle_values = np.linspace(min_angle, max_angle, n_angle)
 
-            # Append new values to the lists
-            new_blade_angle.extend(new_blade_angle_values)
-            new_n11.extend([n] * len(new_blade_angle_values))
-            new_Q11.extend(new_Q11_values)
-            new_efficiency.extend(new_efficiency_values)
+        new_Q11, new_efficiency = curves(new_blade_angle_values)
 
-        # Combine original data with new interpolated data
-        self.data.blade_angle = new_blade_angle
-        self.data.n11 = new_n11
-        self.data.Q11 = new_Q11
-        self.data.efficiency = new_efficiency
+        # Replace the data with the new interpolated points, grouped by n11
+        self.data.blade_angle = np.tile(new_blade_angle_values, len(curves.keys))
+        self.data.n11 = np.repeat(curves.keys, n_angle)
+        self.data.Q11 = new_Q11.ravel()
+        self.data.efficiency = new_efficiency.ravel()
 
-        return new_blade_angle, new_n11, new_Q11, new_efficiency
+        return self.data.blade_angle, self.data.n11, self.data.Q11, self.data.efficiency
         
+    def get_surface_fitter(self, x, y, name='fit', values=None, match_values=True):
+        """
+        Return the surface fitter of the (x, y) points, triangulating them only if they changed.
+
+        The grid follows self.grid_resolution and self.adaptive_grid; an adaptive grid is
+        refined around the maximum and the steep regions of values, and is then shared by
+        every field fitted with the same fitter.
+
+        Args:
+            x (array): x coordinates of the scattered points.
+            y (array): y coordinates of the scattered points.
+            name (str): Purpose of the fitter, so fits and plots keep separate triangulations.
+            values (array, optional): Values guiding an adaptive grid (e.g. efficiency).
+            match_values (bool): Only reuse an adaptive grid refined from the same values;
+                False reuses the grid of the points whatever guided it, and uses values
+                only if a new fitter is built.
+
+        Returns:
+            SurfaceFitter: Fitter for the points.
+        """
+        fitter = self.surface_fitters.get(name)
+        if fitter is None or not fitter.matches(x, y, num=self.grid_resolution, adaptive=self.adaptive_grid,
+                                                values=values if match_values else None):
+            fitter = SurfaceFitter(x, y, num=self.grid_resolution, adaptive=self.adaptive_grid, values=values)
+            self.surface_fitters[name] = fitter
+        return fitter
+
     def fit_efficiency(self,x,y,z, min_efficiency_limit = 0.5):               
 
         # Create grid coordinates for the surface
-        x_grid = np.linspace(x.min(), x.max(), num=101)
-        y_grid = np.linspace(y.min(), y.max(), num=101)
-        self.data.n11, self.data.Q11 = np.meshgrid(x_grid, y_grid)
+        fitter = self.get_surface_fitter(x, y, values=z)
+        self.data.n11, self.data.Q11 = fitter.x_grid.copy(), fitter.y_grid.copy()
 
         # Interpolate unstructured 3-dimensional data
-        self.data.efficiency = griddata((x, y), z, (self.data.n11, self.data.Q11), method='cubic')
+        self.data.efficiency = fitter.fit(z)
 
         # Apply threshold filtering after interpolation        
         self.data.efficiency[self.data.efficiency < min_efficiency_limit] = np.nan
@@ -211,45 +159,115 @@ class HillChart:
         return self.data.n11, self.data.Q11, self.data.efficiency
     
     def fit_blade_angle(self,x,y,z):        
-        x_grid = np.linspace(x.min(), x.max(), num=101)
-        y_grid = np.linspace(y.min(), y.max(), num=101)
-        self.data.n11, self.data.Q11 = np.meshgrid(x_grid, y_grid)
+        # Share the grid of the efficiency fit, which guides an adaptive grid
+        fitter = self.get_surface_fitter(x, y, values=z, match_values=False)
+        self.data.n11, self.data.Q11 = fitter.x_grid.copy(), fitter.y_grid.copy()
 
         # Interpolate unstructured 3-dimensional data
-        self.data.blade_angle = griddata((x, y), z, (self.data.n11, self.data.Q11), method='cubic')        
+        self.data.blade_angle = fitter.fit(z)
+        self.build_blade_angle_interpolator()
 
         return self.data.n11, self.data.Q11, self.data.blade_angle
     
-    def get_blade_angle(self, Q11_value, n11_value):
-        """Interpolate the blade angle based on Q11 and n11, handling NaN values."""
+    def build_blade_angle_interpolator(self):
+        """
+        Build the blade angle lookup of the fitted grids.
+
+        The fitted surfaces lie on a regular meshgrid (Q11 along rows, n11 along columns),
+        so a linear RegularGridInterpolator is used; other layouts fall back to a
+        Delaunay triangulation of the valid points. Points outside the fitted area give NaN,
+        as do grid cells with a NaN corner; get_blade_angle resolves the latter with
+        build_blade_angle_fallback.
+
+        Returns:
+            callable: Interpolator taking an (..., 2) array of (Q11, n11) points.
+        """
         if self.data.Q11 is None or self.data.n11 is None or self.data.blade_angle is None:
             raise ValueError("Blade angle data not prepared. Ensure hill chart data is loaded and prepared.")
 
-        # Flatten and filter out NaN values
-        Q11_flat = self.data.Q11.flatten()
-        n11_flat = self.data.n11.flatten()
-        blade_angles_flat = self.data.blade_angle.flatten()
+        Q11 = np.asarray(self.data.Q11, dtype=float)
+        n11 = np.asarray(self.data.n11, dtype=float)
+        blade_angle = np.asarray(self.data.blade_angle, dtype=float)
+
+        Q11_axis = Q11[:, 0] if Q11.ndim == 2 else None
+        n11_axis = n11[0, :] if n11.ndim == 2 else None
+        regular = (Q11_axis is not None and n11_axis is not None and blade_angle.shape == Q11.shape == n11.shape
+                   and np.all(np.diff(Q11_axis) > 0) and np.all(np.diff(n11_axis) > 0)
+                   and np.array_equal(Q11, np.broadcast_to(Q11_axis[:, None], Q11.shape))
+                   and np.array_equal(n11, np.broadcast_to(n11_axis, n11.shape)))
 
+        if regular:
+            interpolator = RegularGridInterpolator((Q11_axis, n11_axis), blade_angle, method='linear',
+                                                   bounds_error=False, fill_value=np.nan)
+        else:
+            # Flatten and filter out NaN values
+            Q11_flat, n11_flat, blade_angles_flat = Q11.ravel(), n11.ravel(), blade_angle.ravel()
+            valid_mask = ~np.isnan(blade_angles_flat) & ~np.isnan(Q11_flat) & ~np.isnan(n11_flat)
+            points = np.column_stack((Q11_flat[valid_mask], n11_flat[valid_mask]))
+            interpolator = LinearNDInterpolator(points, blade_angles_flat[valid_mask])
+
+        self.blade_angle_interpolator = interpolator
+        self.blade_angle_interpolator_grid = self.data.blade_angle
+        self.blade_angle_fallback = None
+        return interpolator
+
+    def build_blade_angle_fallback(self):
+        """
+        Build the cubic interpolator of the valid blade angle points, for queries near the
+        edge of the fitted area.
+
+        This is the same interpolation as griddata(..., method='cubic') over the valid
+        points, so edge queries inside their convex hull still get a blade angle.
+
+        Returns:
+            CloughTocher2DInterpolator: Interpolator taking an (n, 2) array of (Q11, n11) points.
+        """
+        Q11_flat = np.asarray(self.data.Q11, dtype=float).ravel()
+        n11_flat = np.asarray(self.data.n11, dtype=float).ravel()
+        blade_angles_flat = np.asarray(self.data.blade_angle, dtype=float).ravel()
         valid_mask = ~np.isnan(blade_angles_flat) & ~np.isnan(Q11_flat) & ~np.isnan(n11_flat)
+        points = np.column_stack((Q11_flat[valid_mask], n11_flat[valid_mask]))
+        self.blade_angle_fallback = CloughTocher2DInterpolator(points, blade_angles_flat[valid_mask])
+        return self.blade_angle_fallback
 
-        # Only use valid points
-        points = np.array(list(zip(Q11_flat[valid_mask], n11_flat[valid_mask])))
-        values = blade_angles_flat[valid_mask]
+    def get_blade_angle(self, Q11_value, n11_value):
+        """
+        Interpolate the blade angle at given Q11 and n11 values.
 
-        # Interpolate blade angle
-        blade_angle = griddata(points, values, (Q11_value, n11_value), method='cubic')
+        Args:
+            Q11_value (float or array): Unit discharge(s).
+            n11_value (float or array): Unit speed(s), broadcast against Q11_value.
 
-        return float(blade_angle)
+        Returns:
+            float or np.ndarray: Blade angle(s), NaN outside the fitted area.
+        """
+        if self.blade_angle_interpolator is None or self.blade_angle_interpolator_grid is not self.data.blade_angle:
+            self.build_blade_angle_interpolator()
+
+        Q11_value, n11_value = np.broadcast_arrays(np.asarray(Q11_value, dtype=float), np.asarray(n11_value, dtype=float))
+        points = np.column_stack((Q11_value.ravel(), n11_value.ravel()))
+        blade_angle = self.blade_angle_interpolator(points)
+
+        # Cells with a NaN corner at the edge of the fitted area: use the cubic fallback
+        missing = np.isnan(blade_angle) & ~np.isnan(points).any(axis=1)
+        if missing.any() and isinstance(self.blade_angle_interpolator, RegularGridInterpolator):
+            fallback = self.blade_angle_fallback or self.build_blade_angle_fallback()
+            blade_angle[missing] = fallback(points[missing])
+        blade_angle = blade_angle.reshape(Q11_value.shape)
+
+        if blade_angle.ndim == 0:
+            return float(blade_angle)
+        return blade_angle
     
     def filter_for_maximum_efficiency(self, remove = True):
         try:
-            # Check if efficiency list is not empty
-            if not self.data.efficiency:
+            # Check if efficiency data is not empty
+            if len(self.data.efficiency) == 0:
                 self.emit_message("No efficiency data available.")
                 return
 
-            # Find the index of the maximum efficiency
-            max_eff_index = self.data.efficiency.index(max(self.data.efficiency))
+            # Find the index of the maximum efficiency (first one on ties)
+            max_eff_index = int(np.argmax(self.data.efficiency))
             
             # Retrieve the values from each list at the index of the maximum efficiency
             max_Q11 = self.data.Q11[max_eff_index]
@@ -261,17 +279,14 @@ class HillChart:
                 # Clear existing lists and append only the max values
                 self.data.clear_data()
 
-                self.data.Q11 = [max_Q11]
-                self.data.n11 = [max_n11]
-                self.data.efficiency = [max_efficiency]
-                self.data.blade_angle = [max_blade_angle]
+                self.data.Q11 = np.array([max_Q11], dtype=float)
+                self.data.n11 = np.array([max_n11], dtype=float)
+                self.data.efficiency = np.array([max_efficiency], dtype=float)
+                self.data.blade_angle = np.array([max_blade_angle], dtype=float)
 
             else:
-                self.BEP_data = TurbineData()
-                self.BEP_data.Q11 = [max_Q11]
-                self.BEP_data.n11 = [max_n11]
-                self.BEP_data.efficiency = [max_efficiency]
-                self.BEP_data.blade_angle = [max_blade_angle]
+                self.BEP_data = TurbineData.from_columns(
+                    Q11=[max_Q11], n11=[max_n11], efficiency=[max_efficiency], blade_angle=[max_blade_angle])
 
             #self.emit_message("Filtered to maximum efficiency data.")
         except Exception as e:
@@ -279,6 +294,18 @@ class HillChart:
             raise
 
     def calculate_cases(self, selected_values, var1, var2):
+        """
+        Compute H, Q, n, D, power and Ns of every point from two given quantities.
+
+        The given pair is selected by index (1 - H, 2 - Q, 3 - n, 4 - D); the other two
+        follow from the n11 and Q11 of each point. Whole arrays are processed at once,
+        var1 and var2 may be scalars or arrays broadcastable against the data (e.g. a
+        vector of heads for a single point), and the results take the broadcast shape.
+
+        Args:
+            selected_values (list): Indices of the two given quantities, e.g. [1, 4] for H and D.
+            var1, var2 (float or array): Values of the given quantities, in the order of selected_values.
+        """
         try:
             #self.read_hill_chart_values()
             if not self.data:
@@ -289,61 +316,72 @@ class HillChart:
             if selected_values[0] > selected_values[1]:
                 selected_values = [selected_values[1], selected_values[0]]
                 var1, var2 = var2, var1  # Swap var1 and var2 accordingly
-            
-            for i in range(len(self.data.Q11)):
+
+            n11 = np.asarray(self.data.n11, dtype=float)
+            Q11 = np.asarray(self.data.Q11, dtype=float)
+            efficiency = np.asarray(self.data.efficiency, dtype=float)
+            var1 = np.asarray(var1, dtype=float)
+            var2 = np.asarray(var2, dtype=float)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
                 if selected_values == [1, 2]:  # H, Q provided
                     H = var1
                     Q = var2
-                    D = (Q / (self.data.Q11[i] * (H)**0.5))**0.5
-                    n = (H**0.5) * self.data.n11[i] / D
-                
+                    D = (Q / (Q11 * (H)**0.5))**0.5
+                    n = (H**0.5) * n11 / D
+
                 elif selected_values == [1, 3]:  # H, n provided
                     H = var1
                     n = var2
-                    D = (H**0.5) * self.data.n11[i] / n
-                    Q = D**2 * self.data.Q11[i] * (H**0.5)
-                    
+                    D = (H**0.5) * n11 / n
+                    Q = D**2 * Q11 * (H**0.5)
+
                 elif selected_values == [1, 4]:  # H, D provided
                     H = var1
                     D = var2
-                    n = (H**0.5) * self.data.n11[i] / D
-                    Q = D**2 * self.data.Q11[i] * (H**0.5)
+                    n = (H**0.5) * n11 / D
+                    Q = D**2 * Q11 * (H**0.5)
 
                 elif selected_values == [2, 3]:  # Q, n provided
                     Q = var1
                     n = var2
-                    D = (Q * self.data.n11[i] / (self.data.Q11[i] * n))**(1/3)
-                    H = (n * D / self.data.n11[i])**2
+                    D = (Q * n11 / (Q11 * n))**(1/3)
+                    H = (n * D / n11)**2
 
                 elif selected_values == [2, 4]:  # Q, D provided
                     Q = var1
                     D = var2
-                    H = (Q / (self.data.Q11[i] * (D**2)))**2
-                    n = (H**0.5) * self.data.n11[i] / D
+                    H = (Q / (Q11 * (D**2)))**2
+                    n = (H**0.5) * n11 / D
 
                 elif selected_values == [3, 4]:  # n, D provided
                     n = var1
                     D = var2
-                    H = (n * D / self.data.n11[i])**2
-                    Q = D**2 * self.data.Q11[i] * (H**0.5)
+                    H = (n * D / n11)**2
+                    Q = D**2 * Q11 * (H**0.5)
 
                 else:
                     self.emit_message("Invalid selected values, no calculation performed.")
-                    continue
-                
-                self.data.H.append(H)
-                self.data.Q.append(Q)
-                self.data.n.append(n)
-                self.data.D.append(D)
-                power = Q * H * 1000 * 9.8 * self.data.efficiency[i]
-                self.data.power.append(power)
+                    return
+
+                power = Q * H * 1000 * 9.8 * efficiency
                 Ns = (n*Q**0.5)/H**0.75
-                self.data.Ns.append(Ns)
+
+            # Give every result the full broadcast shape, so constants are repeated per point
+            shape = np.broadcast_shapes(H.shape, Q.shape, n.shape, D.shape, power.shape)
+            for name, values in (('H', H), ('Q', Q), ('n', n), ('D', D), ('power', power), ('Ns', Ns)):
+                setattr(self.data, name, np.broadcast_to(values, shape).copy())
 
         except Exception as e:
             self.emit_message(f"Error in case calculations: {e}")
             raise    
     
+    def view(self):
+        """Return a shallow copy of the hill chart working on a copy-on-write view of its data."""
+        view = copy.copy(self)
+        view.data = self.data.view()
+        return view
+
     def normalize(self, attribute_name, norm_value):
         norm_value = np.array(norm_value)
         setattr(self.data, attribute_name, getattr(self.data, attribute_name) / norm_value)
@@ -351,7 +389,19 @@ class HillChart:
     def return_values(self):
         return self.data 
     
-    def prepare_hill_chart_data(self, min_efficiency_limit = 0.5): 
+    def prepare_hill_chart_data(self, min_efficiency_limit = 0.5, grid_resolution = 101, adaptive_grid = False): 
+        """
+        Fit the efficiency and blade angle surfaces of the measured points.
+
+        Args:
+            min_efficiency_limit (float): Fitted efficiencies below this value are discarded.
+            grid_resolution (int): Number of grid points along each axis of the fitted surfaces.
+            adaptive_grid (bool): Refine the grid near the BEP and high-gradient regions and
+                coarsen it elsewhere, instead of spacing it uniformly.
+        """
+        self.grid_resolution = int(grid_resolution)
+        self.adaptive_grid = bool(adaptive_grid)
+
         x = np.array(self.data.n11)
         y = np.array(self.data.Q11)
         z_efficiency = np.array(self.data.efficiency)
@@ -385,36 +435,21 @@ class HillChart:
         else:
             target_angles = [target_angles]
         
-        # Create an off-screen figure using Agg backend without global backend switch
-        fig = figure.Figure()  # Create a figure without pyplot
-        canvas = agg.FigureCanvasAgg(fig)  # Attach Agg canvas to the figure
-        ax = fig.add_subplot(111)  # Add a subplot to this figure
-
-        # Plot contours on the off-screen axis
-        contour = ax.contour(n, Q, blade_angle, levels=target_angles)
-
-        # Initialize dictionary to store contour coordinates for each target angle
-        contours_dict = {angle: ([], []) for angle in target_angles}
-
-        # Extract paths from each contour collection
-        for collection, level in zip(contour.collections, contour.levels):
-            for path in collection.get_paths():
-                if isinstance(path, mpath.Path):
-                    vertices = path.vertices
-                    for angle in target_angles:
-                        if np.isclose(level, angle):
-                            contours_dict[angle][0].extend(vertices[:, 0])
-                            contours_dict[angle][1].extend(vertices[:, 1])
-
-        # Clear and delete the figure to free memory
-        fig.clf()
-        plt.close(fig)  # Close the figure completely
-        del fig, ax, canvas  # Delete all references to ensure garbage collection
-        
+        # Extract all iso-lines in one pass without creating a matplotlib figure
+        iso_lines = find_iso_lines(n, Q, blade_angle, target_angles)
+
+        # Join the lines of each target angle into a single coordinate list
+        contours_dict = {}
+        for angle, level in zip(target_angles, np.asarray(target_angles, dtype=float).tolist()):
+            lines = iso_lines[level]
+            if lines:
+                vertices = np.concatenate(lines)
+                contours_dict[angle] = (vertices[:, 0], vertices[:, 1])
+            else:
+                contours_dict[angle] = (np.array([]), np.array([]))
 
         # Return a dictionary with contour coordinates for each target angle
-        return {angle: (np.array(n11_contour), np.array(Q11_contour)) 
-                for angle, (n11_contour, Q11_contour) in contours_dict.items()}
+        return contours_dict
     
     
     def plot_contour_lines(self, ax, line_coords):
@@ -477,6 +512,9 @@ class HillChart:
             self.emit_message(f"Error in plotting 3D scatter plot: {e}")
 
     def plot_hill_chart_contour(self, ax=None, n_contours=35, data_type='default'):
+        # Imported here, so that fitting and slicing (e.g. in pool workers) never load pyplot
+        import matplotlib.pyplot as plt
+
         try:
             if ax is None:
                 fig, ax = plt.subplots()
@@ -497,7 +535,7 @@ class HillChart:
                 z = np.array(self.data.efficiency)
                 xlabel = 'n [rpm]'
                 ylabel = 'Q [$m^3$/s]'
-                title = f'Hill Chart for constant H = {self.data.H[0]:.2f} [m], D = {self.data.D[0]:.2f} [m]'
+                title = f'Hill Chart for constant H = {np.ravel(self.data.H)[0]:.2f} [m], D = {np.ravel(self.data.D)[0]:.2f} [m]'
             elif data_type == 'normalized':
                 x = np.array(self.data.n11)
                 y = np.array(self.data.Q11)
@@ -514,13 +552,12 @@ class HillChart:
             y = y[valid_mask]
             z = z[valid_mask]
 
-            # Create grid coordinates for the contour plot
-            x_grid = np.linspace(x.min(), x.max(), num=101)
-            y_grid = np.linspace(y.min(), y.max(), num=101)
-            x_grid, y_grid = np.meshgrid(x_grid, y_grid)
+            # Create grid coordinates for the contour plot, reusing the triangulation of earlier plots
+            fitter = self.get_surface_fitter(x, y, name=f'contour_{data_type}', values=z)
+            x_grid, y_grid = fitter.x_grid, fitter.y_grid
 
             # Interpolate unstructured data
-            z_grid = griddata((x, y), z, (x_grid, y_grid), method='cubic')
+            z_grid = fitter.fit(z)
 
             # Create the contour plot
             levels = np.round(np.linspace(np.nanmin(z_grid), np.nanmax(z_grid), num=n_contours), 3)
@@ -1,18 +1,19 @@
 from HillChart import HillChart
 from PerformanceCurve import PerformanceCurve 
-import matplotlib.pyplot as plt
-import copy
-import tkinter as tk
+from surface_cache import cache_key
 import numpy as np
 import matplotlib.pyplot as plt
-from PyQt6.QtWidgets import QTextEdit
 
 
 class HillChartProcessor:
-    def __init__(self):
-        # Initialize the Tkinter root window (you can hide it if necessary)
-        self.root_window = tk.Tk()
-        self.root_window.withdraw()  # Hide the root window as it's not needed
+    def __init__(self, surface_cache=None):
+        """
+        Args:
+            surface_cache (SurfaceCache, optional): On-disk cache of fitted surfaces; None always refits.
+        """
+        # Tkinter root window, only created when a Tk text window is shown (see get_root_window)
+        self.root_window = None
+        self.message_callback = None
 
         # Attributes to hold core data
         self.raw_data = HillChart()
@@ -24,6 +25,11 @@ class HillChartProcessor:
         self.datapath = None
         self.extrapolate_blade = None
         self.extrapolate_n11 = None
+        self.grid_resolution = 101
+        self.adaptive_grid = False
+
+        # On-disk cache of fitted surfaces, opt-in (None always refits)
+        self.surface_cache = surface_cache
 
         #self.raw_data.set_message_callback(self.emit_message)
 
@@ -39,27 +45,28 @@ class HillChartProcessor:
         else:
             print(message)  # Default to console output
 
-    def deepcopy_with_callback(self, instance):
+    def view_with_callback(self, instance):
         """
-        Perform a deepcopy while avoiding issues with non-pickleable objects.
-        Temporarily removes message_callback before copying and restores it afterward.
+        Return a copy-on-write view of a HillChart instance that reports through this processor.
+
+        The view shares the instance's grids read-only (see HillChart.view), so it can be
+        sliced, normalized and scaled without modifying or cloning the original.
         """
-        # Check if instance has message_callback
-        deleted = False
-        
-        if hasattr(instance, "message_callback"):
-            temp_message_callback = instance.message_callback
-            del instance.message_callback
-            deleted = True
-        
-        # Perform deepcopy
-        copied_instance = copy.deepcopy(instance)
-        copied_instance.set_message_callback(self.emit_message)
-        # Restore the original instance's callback if it was deleted
-        if deleted:
-            instance.set_message_callback(temp_message_callback)
+        view = instance.view()
+        view.set_message_callback(self.emit_message)
+        return view
 
-        return copied_instance
+    def get_root_window(self):
+        """
+        Return the hidden Tkinter root window, creating it on first use.
+
+        Tkinter is only imported here, so the processor itself runs without a display.
+        """
+        if self.root_window is None:
+            import tkinter as tk
+            self.root_window = tk.Tk()
+            self.root_window.withdraw()  # Hide the root window as it's not needed
+        return self.root_window
 
     def set_file_path(self, file_path):
         self.datapath = file_path
@@ -69,9 +76,11 @@ class HillChartProcessor:
         self.var1 = var1
         self.var2 = var2  
 
-    def set_plot_parameters(self, n_contours, extrapolation_options_vars,extrapolation_values_n11,extrapolation_values_blade_angles, min_efficiency_limit = 0.5):
+    def set_plot_parameters(self, n_contours, extrapolation_options_vars,extrapolation_values_n11,extrapolation_values_blade_angles, min_efficiency_limit = 0.5, grid_resolution = 101, adaptive_grid = False):
         self.n_contours = n_contours        
         self.min_efficiency_limit = min_efficiency_limit
+        self.grid_resolution = grid_resolution
+        self.adaptive_grid = adaptive_grid
         
         self.extrapolate_n11 = extrapolation_options_vars[0]
         if self.extrapolate_n11:
@@ -94,6 +103,8 @@ class HillChartProcessor:
         """
         # Set common parameters
         self.min_efficiency_limit = params.get("min_efficiency_limit", 0.5)
+        self.grid_resolution = int(params.get("grid_resolution", 101))
+        self.adaptive_grid = bool(params.get("adaptive_grid", False))
 
         # Handle n11 extrapolation
         self.extrapolate_n11 = params.get("checkBox_extrapolate_n11", False)
@@ -122,17 +133,42 @@ class HillChartProcessor:
         return self.raw_data
     
     def prepare_BEP_data(self):        
-        BEP_values = self.deepcopy_with_callback(self.raw_data)
+        BEP_values = self.view_with_callback(self.raw_data)
         BEP_values.filter_for_maximum_efficiency()
         BEP_values.calculate_cases(self.selected_values, self.var1, self.var2)
         BEP_data = BEP_values.return_values()
         self.BEP_data = BEP_data
         return BEP_data
     
+    def surface_fit_parameters(self):
+        """Return the fit and extrapolation parameters that determine the fitted surface."""
+        parameters = {
+            "min_efficiency_limit": self.min_efficiency_limit,
+            "grid_resolution": int(self.grid_resolution),
+            "adaptive_grid": bool(self.adaptive_grid),
+            "extrapolate_n11": bool(self.extrapolate_n11),
+            "extrapolate_blade": bool(self.extrapolate_blade),
+        }
+        if self.extrapolate_n11:
+            parameters.update(n11_min=self.n11_min, n11_max=self.n11_max, n_n11=self.n_n11)
+        if self.extrapolate_blade:
+            parameters.update(min_angle=self.min_angle, max_angle=self.max_angle, n_angle=self.n_angle)
+        return parameters
+
     def prepare_core_data(self):
         self.read_raw_data()
         self.prepare_BEP_data()
-        hill_values = self.deepcopy_with_callback(self.raw_data)
+        hill_values = self.view_with_callback(self.raw_data)
+        hill_values.grid_resolution = int(self.grid_resolution)
+        hill_values.adaptive_grid = bool(self.adaptive_grid)
+
+        # Reuse the fitted surface of a known file and parameter set
+        key = None
+        if self.surface_cache is not None:
+            key = cache_key(self.datapath, **self.surface_fit_parameters())
+            if self.surface_cache.load_into(key, hill_values.data):
+                self.hill_values = hill_values
+                return hill_values
 
         if self.extrapolate_n11:
             hill_values.extrapolate_along_n11(min_n11=self.n11_min, max_n11=self.n11_max, n_n11=self.n_n11)
@@ -140,7 +176,10 @@ class HillChartProcessor:
         if self.extrapolate_blade:
             hill_values.extrapolate_along_blade_angles(min_angle=self.min_angle, max_angle=self.max_angle, n_angle=self.n_angle)
 
-        hill_values.prepare_hill_chart_data(min_efficiency_limit = self.min_efficiency_limit)
+        hill_values.prepare_hill_chart_data(min_efficiency_limit = self.min_efficiency_limit, grid_resolution = self.grid_resolution, adaptive_grid = self.adaptive_grid)
+
+        if key is not None:
+            self.surface_cache.save(key, hill_values.data)
         
         self.hill_values = hill_values        
 
@@ -219,10 +258,8 @@ class HillChartProcessor:
         # Plot the hill chart
         hill_values.plot_hill_chart(ax=ax1)
 
-        # Read and overlay raw data as a scatter plot
-        
-        self.raw_data.read_hill_chart_values(self.datapath)
-        raw_data = self.deepcopy_with_callback(self.raw_data)
+        # Overlay raw data as a scatter plot (already parsed by prepare_core_data)
+        raw_data = self.view_with_callback(self.read_raw_data())
         raw_data.plot_3d_scatter(ax=ax1)
 
         # Show standalone if requested, otherwise return the figure
@@ -244,7 +281,7 @@ class HillChartProcessor:
         Returns:
             fig, ax (if show_standalone=False)
         """
-        hill_values = self.deepcopy_with_callback(self.hill_values)  # Make a copy to avoid modifying original data
+        hill_values = self.view_with_callback(self.hill_values)  # View to avoid modifying original data
         BEP_data = self.BEP_data
 
         if data_type == 'nD':  # Case for nD
@@ -303,8 +340,8 @@ class HillChartProcessor:
         else:
             fig = ax.figure
 
-        # Make a deep copy of hill values
-        slice_values = self.deepcopy_with_callback(hill_values)
+        # Work on a view of hill values
+        slice_values = self.view_with_callback(hill_values)
         slice_values = PerformanceCurve(slice_values)
 
         # Determine slicing method by explicitly passing the correct argument
@@ -432,7 +469,8 @@ class HillChartProcessor:
         for index in range(num_sets):
             results.append("Best Efficiency Point (BEP) values:\n")
             for attr in ['H', 'Q', 'n', 'D', 'efficiency', 'power', 'Ns']:
-                value = getattr(BEP_data, attr)[index] if getattr(BEP_data, attr) else 'N/A'
+                values = getattr(BEP_data, attr)
+                value = values[index] if len(values) > 0 else 'N/A'
                 if isinstance(value, float):
                     # Format value with varying decimals
                     num_decimals = decimals.get(attr, 2)
@@ -451,6 +489,8 @@ class HillChartProcessor:
         Returns:
             QTextEdit: A PyQt6 text widget containing the results.
         """
+        from PyQt6.QtWidgets import QTextEdit
+
         prepared_text = self.prepare_text_results()  # Prepare the text content
 
         # Create a QTextEdit widget
@@ -618,8 +658,8 @@ class HillChartProcessor:
         else:
             fig = ax.figure
 
-        # Make a deep copy of raw data
-        fixed_hillchart_point = self.deepcopy_with_callback(raw_data)
+        # Work on a view of raw data
+        fixed_hillchart_point = self.view_with_callback(raw_data)
         fixed_hillchart_point = PerformanceCurve(fixed_hillchart_point) 
 
         # Filter for maximum efficiency
@@ -630,11 +670,10 @@ class HillChartProcessor:
         H_min = H_nom * 0.2
         H_max = H_nom * 3
         H_step = H_nom * 0.2
-        H_var = list(np.arange(H_min, H_max, H_step))                        
+        H_var = np.arange(H_min, H_max, H_step)
 
-        # Iterate over H variations and calculate cases
-        for i in H_var:
-            fixed_hillchart_point.calculate_cases([1, 4], i, BEP_data.D[0])
+        # Calculate all H variations at once
+        fixed_hillchart_point.calculate_cases([1, 4], H_var, BEP_data.D[0])
 
         # Normalize if required
         if normalize:
@@ -682,11 +721,12 @@ class HillChartProcessor:
         """
         DEPRECATED: This method is kept for backwards compatibility with Calculator.py
         """
-        
+        import tkinter as tk
+
         prepared_text = self.prepare_text_results()
 
         # Create a new top-level window
-        result_window = tk.Toplevel(self.root_window)
+        result_window = tk.Toplevel(self.get_root_window())
         result_window.title("BEP Results")
         result_window.geometry("400x300")
 
@@ -57,37 +57,8 @@ class PerformanceCurve(HillChart):
             if len(n11_array) != len(Q11_array):
                 raise ValueError("n11_array and Q11_array must have the same length")
 
-            # Prepare arrays to store interpolated values
-            interpolated_efficiency = []
-
-            # Iterate over the custom path
-            for n11_val, Q11_val in zip(n11_array, Q11_array):
-                # Find indices around the target n11 value for interpolation
-                n11_indices = np.searchsorted(self.data.n11[0, :], n11_val) - 1
-                Q11_indices = np.searchsorted(self.data.Q11[:, 0], Q11_val) - 1
-
-                # Ensure indices are within bounds
-                n11_indices = np.clip(n11_indices, 0, self.data.n11.shape[1] - 2)
-                Q11_indices = np.clip(Q11_indices, 0, self.data.Q11.shape[0] - 2)
-
-                # Get the four surrounding points for bilinear interpolation
-                x1, x2 = self.data.n11[0, n11_indices], self.data.n11[0, n11_indices + 1]
-                y1, y2 = self.data.Q11[Q11_indices, 0], self.data.Q11[Q11_indices + 1, 0]
-                Q11_values = self.data.Q11[Q11_indices:Q11_indices+2, n11_indices:n11_indices+2]
-                efficiency_values = self.data.efficiency[Q11_indices:Q11_indices+2, n11_indices:n11_indices+2]
-
-                # Perform bilinear interpolation for efficiency
-                if (x2 - x1) == 0 or (y2 - y1) == 0:
-                    interp_efficiency = efficiency_values.mean()  # Handle edge cases where division by zero could occur
-                else:
-                    # Linear interpolation in n11 direction
-                    f1 = (x2 - n11_val) / (x2 - x1) * efficiency_values[0, 0] + (n11_val - x1) / (x2 - x1) * efficiency_values[0, 1]
-                    f2 = (x2 - n11_val) / (x2 - x1) * efficiency_values[1, 0] + (n11_val - x1) / (x2 - x1) * efficiency_values[1, 1]
-
-                    # Linear interpolation in Q11 direction
-                    interp_efficiency = (y2 - Q11_val) / (y2 - y1) * f1 + (Q11_val - y1) / (y2 - y1) * f2
-
-                interpolated_efficiency.append(interp_efficiency)
+            # Interpolate efficiency along the whole custom path at once
+            interpolated_efficiency = self.bilinear_interpolate(self.data.efficiency, n11_array, Q11_array)
 
             n11_slice = np.array(n11_array)
             Q11_slice = np.array(Q11_array)
@@ -104,6 +75,61 @@ class PerformanceCurve(HillChart):
         else:
             raise ValueError("Both n11_array and Q11_array must be provided")
     
+    def bilinear_interpolate(self, values, n11_array, Q11_array):
+        """
+        Bilinearly interpolate a gridded field at many (n11, Q11) points at once.
+
+        Cell lookups use one searchsorted per grid axis. Points outside the grid are
+        extrapolated from the nearest edge cell. A NaN corner only propagates to the
+        result when it carries a non-zero weight, so points lying exactly on the
+        border of the valid region keep a finite value.
+
+        Args:
+            values (array): 2D field defined on the self.data.n11 / self.data.Q11 grid.
+            n11_array (array-like): n11 coordinates of the query points.
+            Q11_array (array-like): Q11 coordinates of the query points.
+
+        Returns:
+            array: Interpolated values, one per query point.
+        """
+        n11_axis = self.data.n11[0, :]
+        Q11_axis = self.data.Q11[:, 0]
+        n11_array = np.asarray(n11_array, dtype=float)
+        Q11_array = np.asarray(Q11_array, dtype=float)
+
+        # Indices of the lower-left grid corner of each cell, kept within bounds
+        col = np.clip(np.searchsorted(n11_axis, n11_array) - 1, 0, len(n11_axis) - 2)
+        row = np.clip(np.searchsorted(Q11_axis, Q11_array) - 1, 0, len(Q11_axis) - 2)
+
+        x1, x2 = n11_axis[col], n11_axis[col + 1]
+        y1, y2 = Q11_axis[row], Q11_axis[row + 1]
+        corners = np.stack([
+            values[row, col], values[row, col + 1],
+            values[row + 1, col], values[row + 1, col + 1]
+        ])
+
+        # Linear weights in the n11 and Q11 directions
+        with np.errstate(divide='ignore', invalid='ignore'):
+            wx1 = (x2 - n11_array) / (x2 - x1)
+            wx2 = (n11_array - x1) / (x2 - x1)
+            wy1 = (y2 - Q11_array) / (y2 - y1)
+            wy2 = (Q11_array - y1) / (y2 - y1)
+        weights = np.stack([wy1 * wx1, wy1 * wx2, wy2 * wx1, wy2 * wx2])
+
+        # Zero-weight corners must not contribute, even when they are NaN
+        contributions = np.where(weights == 0, 0.0, weights * corners)
+        interpolated = contributions.sum(axis=0)
+
+        # Handle edge cases where division by zero could occur
+        degenerate = (x2 == x1) | (y2 == y1)
+        if np.any(degenerate):
+            finite_corners = np.isfinite(corners)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corner_mean = np.where(finite_corners, corners, 0.0).sum(axis=0) / finite_corners.sum(axis=0)
+            interpolated = np.where(degenerate, corner_mean, interpolated)
+
+        return interpolated
+
     def plot_2D_chart(self, x_var, y_var, ax=None, title_type = 'default', label_type = 'default'):
                
         try:
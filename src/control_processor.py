@@ -1,59 +1,111 @@
 from control_simulator import ControlSimulator
-from collections import deque
 import os
+import threading
+import time
+import warnings
+import numpy as np
 import matplotlib.pyplot as plt
 from control_PID import ControlPID  # Import the PID controller
+from surface_cache import cache_key
+from ring_buffer import RingBuffer
+from plot_envelope import PlotEnvelope
+
+
+# Live plot series, one subplot each: (data attribute, label)
+PLOT_SERIES = (
+    ("H", "H [m]"),
+    ("Q", "Q [m³/s]"),
+    ("blade_angle", "Blade Angle [°]"),
+    ("n", "n [rpm]"),
+    ("power", "Power [W]"),
+)
+
+# Channels of the simulation history, one ring buffer column each: the time and the plotted series
+HISTORY_COLUMNS = ("time_data",) + tuple(attribute for attribute, _ in PLOT_SERIES)
+
+# Time series returned by the headless simulation, besides the time: operation point attributes
+SIMULATION_OUTPUTS = ("Q", "H", "n", "blade_angle", "power", "efficiency")
+
+# Time units of the live plot x axis: (name, seconds per unit, shown above this many seconds)
+PLOT_TIME_UNITS = (
+    ("Hours", 3600, 300 * 60),
+    ("Minutes", 60, 300),
+    ("Seconds", 1, -np.inf),
+)
+
+# Default controller settings, copied by each ControlProcessor
+DEFAULT_CONTROL_SETTINGS = {
+    "Kp": 1.2,              # PID control coefficient for proportional control
+    "Ki": 0.1,              # PID control coefficient for integral control
+    "Kd": 0.05,             # PID control coefficient for derivative control
+    "H_tolerance": 0.05,    # Tolerance for head control
+    "n_min": 30,            # Minimum rotational speed limit
+    "n_max": 150,           # Maximum rotational speed limit
+    "blade_angle_min": 3.5,   # Minimum blade angle
+    "blade_angle_max": 28.5   # Maximum blade angle
+}
 
 class ControlProcessor:
-    def __init__(self, refresh_rate_physical=1, time_scale_factor=1, max_duration=14400):
+    def __init__(self, refresh_rate_physical=1, time_scale_factor=None, max_duration=14400, frame_rate=10, real_time_factor=1.0,
+                 surface_cache=None):
         """
         Initialize the ControlProcessor with simulation parameters.
 
         Args:
             refresh_rate_physical (int): Physical time step for simulation updates (in seconds).
-            time_scale_factor (float): Factor to scale real time to simulation time.
+            time_scale_factor (float, optional): Deprecated alias of real_time_factor.
             max_duration (int): Maximum simulation duration in seconds (default: 4 hours).
+            frame_rate (float): Snapshots per second published by the background simulation.
+            real_time_factor (float, optional): Simulated seconds per wall-clock second of the
+                background simulation (default: real time); None runs it as fast as possible.
+            surface_cache (SurfaceCache, optional): On-disk cache of fitted surfaces used by
+                load_data; None always refits.
         """
-        self.time_scale_factor = time_scale_factor  # Scale real time to simulation time
+        if time_scale_factor is not None:
+            warnings.warn("time_scale_factor is deprecated, use real_time_factor", DeprecationWarning, stacklevel=2)
+            real_time_factor = time_scale_factor
         self.refresh_rate_physical = refresh_rate_physical  # Time step for updates
+        self.frame_rate = frame_rate
+        self.real_time_factor = real_time_factor
 
         # Initialize the simulator instance
         self.simulator = ControlSimulator()
 
-        self.settings = {
-            "Kp": 1.2,              # PID control coefficient for proportional control
-            "Ki": 0.1,              # PID control coefficient for integral control
-            "Kd": 0.05,             # PID control coefficient for derivative control
-            "H_tolerance": 0.05,    # Tolerance for head control
-            "n_min": 30,            # Minimum rotational speed limit
-            "n_max": 150,           # Maximum rotational speed limit
-            "blade_angle_min": 3.5,   # Minimum blade angle
-            "blade_angle_max": 28.5   # Maximum blade angle
-        }
+        # On-disk cache of fitted surfaces, opt-in (None always refits)
+        self.surface_cache = surface_cache
+
+        self.settings = dict(DEFAULT_CONTROL_SETTINGS)
 
         self.continue_simulation = False
 
-        # Initialize the PID controller with predefined coefficients and constraints
-        self.controller = ControlPID(
-            Kp=self.settings["Kp"],
-            Ki=self.settings["Ki"],
-            Kd=self.settings["Kd"],
-            H_tolerance=self.settings["H_tolerance"],
-            n_min=self.settings["n_min"],
-            n_max=self.settings["n_max"],
-            blade_angle_min=self.settings["blade_angle_min"],
-            blade_angle_max=self.settings["blade_angle_max"]
-        )
+        # Time-varying inflow (see flow_scenarios); None keeps Q at its ramped target
+        self.flow_scenario = None
 
+        # Background simulation: worker thread, its control parameters and the latest published snapshot
+        self.simulation_thread = None
+        self.control_parameters = None
+        self.snapshot = None
+        self.snapshot_taken = None
+        self.simulation_error = None
 
-        # Initialize data storage for live plotting, with maximum length based on simulation duration
-        maxlen = int(max_duration / self.refresh_rate_physical)
-        self.time_data = deque(maxlen=maxlen)
-        self.H = deque(maxlen=maxlen)
-        self.Q = deque(maxlen=maxlen)
-        self.blade_angle = deque(maxlen=maxlen)
-        self.n = deque(maxlen=maxlen)
-        self.power = deque(maxlen=maxlen)
+        # Initialize the PID controller with predefined coefficients and constraints
+        self.reset_controller()
+
+        # Initialize data storage for live plotting, with maximum length based on simulation duration;
+        # written by the simulation thread and read by the GUI without a lock
+        maxlen = max(int(max_duration / self.refresh_rate_physical), 1)
+        self.history = RingBuffer(HISTORY_COLUMNS, maxlen)
+
+        # Live plot state: persistent lines, blitting background, draw event connection, and the
+        # min/max envelope with the running extremes of each series, both extended only by new samples
+        self.plot_lines = None
+        self.plot_background = None
+        self.plot_draw_connection = None
+        self.plot_limits = None
+        self.plot_time_unit = None
+        self.plot_envelope = None
+        self.plot_extremes = None
+        self.plot_sample_count = 0
 
         # Initialize time variables for simulation
         self.start_time = 0
@@ -64,9 +116,26 @@ class ControlProcessor:
         self.cached_H_t = None
         self.cached_n_t = None
         
+    @property
+    def sample_count(self):
+        """Samples recorded so far, including those dropped from the history."""
+        return self.history.count
+
     def update_control_settings(self, control_settings):
         self.settings = control_settings        
-        
+
+    def reset_controller(self):
+        """Create a new PID controller from the settings, discarding the integral and derivative state of the previous one."""
+        self.controller = ControlPID(
+            Kp=self.settings["Kp"],
+            Ki=self.settings["Ki"],
+            Kd=self.settings["Kd"],
+            H_tolerance=self.settings["H_tolerance"],
+            n_min=self.settings["n_min"],
+            n_max=self.settings["n_max"],
+            blade_angle_min=self.settings["blade_angle_min"],
+            blade_angle_max=self.settings["blade_angle_max"]
+        )
 
     def initialize_simulation(self, hill_data, BEP_data, initial_conditions=None, max_duration=14400):
         """
@@ -78,6 +147,29 @@ class ControlProcessor:
             initial_conditions (dict): Initial conditions for the turbine (e.g., blade angle, speed).
             max_duration (int): Maximum duration of the simulation in seconds.
         """
+        # Load hill chart and BEP data into the simulator (resets its blade-angle slice cache)
+        self.simulator.get_data(hill_data)
+        self.simulator.get_BEP_data(BEP_data)
+        self.max_duration = max_duration
+
+        # Build the slice of the starting blade angle now; the controller moves the angle
+        # continuously, so the other slices are cached as the run reaches them
+        initial_blade_angle = (initial_conditions or {}).get("blade_angle", BEP_data.blade_angle)
+        self.simulator.prewarm_slice_cache(np.ravel(initial_blade_angle))
+
+        self.restart_simulation(initial_conditions)
+
+    def restart_simulation(self, initial_conditions=None):
+        """
+        Return to the start of the simulation with the loaded hill chart data.
+
+        The fitted data and the slice cache of the simulator are kept, so repeated runs
+        (e.g. of a PID ensemble) only pay for the time steps. The controller is kept too;
+        see reset_controller.
+
+        Args:
+            initial_conditions (dict): Initial conditions for the turbine (e.g., blade angle, speed).
+        """
         # Initialize current simulation parameters
         self.current_values = {
             'Q': None,
@@ -85,18 +177,16 @@ class ControlProcessor:
             'blade_angle': None,
             'n': None
         }
+        self.cached_H_t = None
+        self.cached_n_t = None
 
-        # Load hill chart and BEP data into the simulator
-        self.simulator.get_data(hill_data)
-        self.simulator.get_BEP_data(BEP_data)
-
-        # Reset simulation timing and duration
+        # Reset simulation timing
         self.start_time = 0
         self.elapsed_physical_time = self.start_time
-        self.max_duration = max_duration
 
         # If no initial conditions are provided, use defaults from BEP data
         if not initial_conditions:
+            BEP_data = self.simulator.BEP_data
             initial_conditions = {
                 "blade_angle": BEP_data.blade_angle,
                 "n": BEP_data.n,
@@ -110,80 +200,232 @@ class ControlProcessor:
 
         # Precompute initial outputs to ensure readiness for simulation
         self.compute_outputs()
-    
+
     def set_continue_simulation(self, continue_simulation):
         self.continue_simulation = continue_simulation
 
-    def run_simulation(self, control_parameters, axs=None, log_callback=None):
+    def ramp_control_parameters(self, control_parameters):
+        """
+        Move the current control values one time step towards their targets.
+
+        Args:
+            control_parameters (dict): Target values and their '<name>_rate' adjustment rates.
+
+        Returns:
+            dict: The control parameters with the targets replaced by the current values.
+        """
+        for param, value in control_parameters.items():
+            if not param.endswith("_rate"):  # Skip rate-related parameters
+                rate_param = f"{param}_rate"
+                target_value = value
+                rate_value = control_parameters.get(rate_param)
+
+                if target_value is not None and rate_value is not None:
+                    # Initialize the current value if not already set
+                    if self.current_values[param] is None:
+                        self.current_values[param] = target_value
+
+                    # Increment or decrement the current value towards the target
+                    delta = rate_value * self.refresh_rate_physical
+                    if self.current_values[param] < target_value:
+                        self.current_values[param] = min(self.current_values[param] + delta, target_value)
+                    elif self.current_values[param] > target_value:
+                        self.current_values[param] = max(self.current_values[param] - delta, target_value)
+
+        current_control_parameters = control_parameters.copy()
+        current_control_parameters.update(self.current_values)
+        return current_control_parameters
+
+    def simulate(self, duration, scenario):
+        """
+        Run the simulation headless for a duration, as fast as possible.
+
+        Steps the same control and operation point model as start_simulation, from the
+        current state, but without plotting, logging or filling the live plot history;
+        the outputs are written straight into preallocated arrays. The flow follows the
+        flow scenario if one is set (see set_flow_scenario).
+
+        Args:
+            duration (float): Simulated time in seconds.
+            scenario (dict or callable): Control parameters (targets and rates, as for
+                start_simulation), or a function of the elapsed physical time returning them.
+
+        Returns:
+            dict: {"time": 1D array, attribute: 1D array} for the attributes of
+            SIMULATION_OUTPUTS, one sample per time step of refresh_rate_physical.
+        """
+        num_steps = int(round(duration / self.refresh_rate_physical))
+        results = {name: np.empty(num_steps) for name in ("time",) + SIMULATION_OUTPUTS}
+        outputs = [(results[name], name) for name in SIMULATION_OUTPUTS]
+        time_data = results["time"]
+        control_parameters = scenario if not callable(scenario) else None
+        operation_point = self.simulator.operation_point
+
+        for step in range(num_steps):
+            if control_parameters is None:
+                current_control_parameters = self.ramp_control_parameters(scenario(self.elapsed_physical_time))
+            else:
+                current_control_parameters = self.ramp_control_parameters(control_parameters)
+            self.step_simulation(current_control_parameters, self.settings, record=False)
+
+            # Record the operation point at the time of the step
+            time_data[step] = self.elapsed_physical_time
+            for values, name in outputs:
+                values[step] = getattr(operation_point, name)
+            self.elapsed_physical_time += self.refresh_rate_physical
+
+        return results
+
+    def start_simulation(self, control_parameters):
         """
-        Run the simulation loop, adapting parameters dynamically.
+        Run the simulation on a background thread, or update the targets of the running one.
+
+        The worker steps at real_time_factor (as fast as possible if it is None) and
+        publishes a snapshot frame_rate times per second; the GUI polls take_snapshot and
+        redraws from it, so painting never limits the simulation speed.
 
         Args:
             control_parameters (dict): Target values and adjustment rates for control.
-            axs (list): List of matplotlib axes for live plotting.
-            log_callback (callable): Optional callback for logging status updates.
         """
-        if axs is None:
-            raise ValueError("axs parameter is required for plotting.")
+        self.control_parameters = dict(control_parameters)
+        self.continue_simulation = True
+        if self.is_simulation_running():
+            return
+
+        self.simulation_error = None
+        self.simulation_thread = threading.Thread(target=self.simulation_worker, name="control-simulation", daemon=True)
+        self.simulation_thread.start()
+
+    def stop_simulation(self, timeout=5):
+        """
+        Stop the background simulation and wait for the worker to finish its step.
 
-        # Run simulation continuously
-        while self.continue_simulation:  # Replace this with a termination condition as needed
+        Args:
+            timeout (float): Maximum number of seconds to wait for the worker.
+        """
+        self.continue_simulation = False
+        thread = self.simulation_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def is_simulation_running(self):
+        """Return True while the background simulation thread is alive."""
+        return self.simulation_thread is not None and self.simulation_thread.is_alive()
+
+    def simulation_worker(self):
+        """Step the simulation until stopped, publishing snapshots at the frame rate."""
+        frame_interval = 1 / self.frame_rate
+        next_frame = time.perf_counter()
+        start_wall_time = time.perf_counter()
+        start_physical_time = self.elapsed_physical_time
+        try:
+            while self.continue_simulation:
+                current_control_parameters = self.ramp_control_parameters(self.control_parameters)
+                self.step_simulation(current_control_parameters, self.settings)
+                self.elapsed_physical_time += self.refresh_rate_physical
+
+                now = time.perf_counter()
+                if now >= next_frame:
+                    self.publish_snapshot()
+                    next_frame = now + frame_interval
+
+                # Optional pacing to a multiple of real time
+                if self.real_time_factor:
+                    ahead = (self.elapsed_physical_time - start_physical_time) / self.real_time_factor - (now - start_wall_time)
+                    if ahead > 0:
+                        time.sleep(ahead)
+        except Exception as e:
+            self.simulation_error = e
+            self.continue_simulation = False
+        finally:
+            self.publish_snapshot()
+
+    def publish_snapshot(self):
+        """Publish the current state of the simulation for the GUI."""
+        operation_point = self.simulator.operation_point
+        sample_count = self.sample_count
+        if self.simulation_error is not None:
+            status = f"Error during simulation: {self.simulation_error}"
+        else:
+            status = self.status_message()
+        # Replacing the reference is atomic, so readers always see a complete snapshot
+        self.snapshot = {
+            "sample_count": sample_count,
+            "elapsed_physical_time": self.elapsed_physical_time,
+            "Q": operation_point.Q,
+            "H": operation_point.H,
+            "n": operation_point.n,
+            "blade_angle": operation_point.blade_angle,
+            "power": operation_point.power,
+            "running": self.continue_simulation,
+            "status": status,
+        }
 
-            # Adjust control parameters dynamically
-            for param, value in control_parameters.items():
-                if not param.endswith("_rate"):  # Skip rate-related parameters
-                    rate_param = f"{param}_rate"
-                    target_value = value
-                    rate_value = control_parameters.get(rate_param)
+    def take_snapshot(self):
+        """
+        Return the latest snapshot if it was not taken before.
 
-                    if target_value is not None and rate_value is not None:
-                        # Initialize the current value if not already set
-                        if self.current_values[param] is None:
-                            self.current_values[param] = target_value
+        Returns:
+            dict: Latest snapshot, or None if nothing new was published.
+        """
+        snapshot = self.snapshot
+        if snapshot is None or snapshot is self.snapshot_taken:
+            return None
+        self.snapshot_taken = snapshot
+        return snapshot
 
-                        # Increment or decrement the current value towards the target
-                        delta = rate_value * self.refresh_rate_physical
-                        if self.current_values[param] < target_value:
-                            self.current_values[param] = min(self.current_values[param] + delta, target_value)
-                        elif self.current_values[param] > target_value:
-                            self.current_values[param] = max(self.current_values[param] - delta, target_value)
+    def refresh_from_snapshot(self, axs=None, log_callback=None):
+        """
+        Redraw the plots and log the status of the latest snapshot; meant for a GUI timer.
 
-            # Update simulation state based on adjusted parameters
-            current_control_parameters = control_parameters.copy()
-            current_control_parameters.update(self.current_values)
+        Args:
+            axs (list): List of matplotlib axes for live plotting.
+            log_callback (callable): Optional callback for logging the status.
 
+        Returns:
+            dict: The snapshot shown, or None if there was no new one.
+        """
+        snapshot = self.take_snapshot()
+        if snapshot is None:
+            return None
+        if axs is not None:
+            self.update_plot(axs)
+        if log_callback:
+            log_callback(snapshot["status"])
+        return snapshot
 
-            control_settings = self.settings
-            self.update_simulation(current_control_parameters, control_settings, axs, log_callback=log_callback)
+    def set_flow_scenario(self, flow_scenario):
+        """
+        Drive the flow rate (Q) with a flow scenario instead of the Q target.
 
-            # Increment the simulation time
-            self.elapsed_physical_time += self.refresh_rate_physical
+        Args:
+            flow_scenario (FlowScenario): Inflow over time, or None to use the Q target and its ramp rate.
+        """
+        self.flow_scenario = flow_scenario
 
-        
     def Q_function(self, elapsed_physical_time):
         """
-        Compute a sinusoidal fluctuation for flow rate (Q).
+        Compute the flow rate (Q) of the flow scenario.
 
         Args:
             elapsed_physical_time (float): Time elapsed in the simulation.
 
         Returns:
-            float: Computed flow rate (Q).
+            float: Flow rate (Q), or None if no flow scenario is set.
         """
-        # Frequency and rate for sinusoidal fluctuation
-        frequency = 0.25 / 3600  # 0.25 cycles per hour
-        Q_rate = 0.625  # 50% fluctuation per hour
+        if self.flow_scenario is None:
+            return None
+        return self.flow_scenario(elapsed_physical_time)
 
-        # Flow rate is set to a constant value for now
-        Q = 3.375
-        return Q
-
-    def load_data(self, file_name):
+    def load_data(self, file_name, min_efficiency_limit=0.1, grid_resolution=101, adaptive_grid=False):
         """
         Load turbine data into the simulator from a file.
 
         Args:
             file_name (str): Path to the CSV file containing turbine data.
+            min_efficiency_limit (float): Fitted efficiencies below this value are discarded.
+            grid_resolution (int): Number of grid points along each axis of the fitted surfaces.
+            adaptive_grid (bool): Refine the grid near the BEP and high-gradient regions.
 
         Raises:
             FileNotFoundError: If the specified file does not exist.
@@ -198,7 +440,22 @@ class ControlProcessor:
         print(f"Loading data from {filepath}...")
         self.simulator.read_hill_chart_values(filepath)
         self.simulator.filter_for_maximum_efficiency(remove=False)
-        self.simulator.prepare_hill_chart_data(min_efficiency_limit=0.1)
+
+        # Reuse the fitted surface of a known file, refit otherwise; the key holds the
+        # parameters the surface is fitted with, so other settings never get a stale surface
+        fit_parameters = {
+            "min_efficiency_limit": min_efficiency_limit,
+            "grid_resolution": int(grid_resolution),
+            "adaptive_grid": bool(adaptive_grid),
+        }
+        key = None
+        if self.surface_cache is not None:
+            key = cache_key(filepath, extrapolate_n11=False, extrapolate_blade=False, **fit_parameters)
+        if key is None or not self.surface_cache.load_into(key, self.simulator.data):
+            self.simulator.prepare_hill_chart_data(**fit_parameters)
+            if key is not None:
+                self.surface_cache.save(key, self.simulator.data)
+        self.simulator.clear_slice_cache()
         print(f"Data successfully loaded from {filepath}")
 
     def perform_control_step(self, H_t=None, delta_time=1):
@@ -250,10 +507,13 @@ class ControlProcessor:
             "H": self.simulator.operation_point.H
         }
 
-    def compute_outputs(self):
+    def compute_outputs(self, record=True):
         """
         Compute turbine outputs and update live data for plotting.
 
+        Args:
+            record (bool): Append the outputs to the live plot history.
+
         Returns:
             dict: Computed operation point data (Q11, n11, efficiency, H, power).
         """
@@ -261,13 +521,9 @@ class ControlProcessor:
         operation_point = self.simulator.compute_with_slicing()
 
         # Append current physical time and outputs to data storage
-        elapsed_physical_time = self.elapsed_physical_time
-        self.time_data.append(elapsed_physical_time)
-        self.H.append(operation_point.H)
-        self.Q.append(operation_point.Q)
-        self.blade_angle.append(operation_point.blade_angle)
-        self.n.append(operation_point.n)
-        self.power.append(operation_point.power)
+        if record:
+            self.history.append((self.elapsed_physical_time, operation_point.H, operation_point.Q,
+                                 operation_point.blade_angle, operation_point.n, operation_point.power))
 
         # Return the computed data for reference
         return {
@@ -278,19 +534,30 @@ class ControlProcessor:
             "power": operation_point.power
         }
 
-    def update_simulation(self, control_parameters, control_settings, axs, log_callback=None):
+    def status_message(self):
+        """Return a one-line summary of the current operation point."""
+        blade_angle = self.simulator.operation_point.blade_angle
+        n = self.simulator.operation_point.n
+        Q = self.simulator.operation_point.Q
+        H = self.simulator.operation_point.H
+        return f"Physical time = {self.elapsed_physical_time:.1f}  Q= {Q:.2f}  H= {H:.2f}  n= {n:.2f}  blade angle= {blade_angle:.2f}"
+
+    def step_simulation(self, control_parameters, control_settings, record=True):
         """
-        Update the simulation state and refresh plots.
+        Advance the simulation by one time step, without plotting or logging.
 
         Args:
             control_parameters (dict): Control parameters to apply to the simulation.
-            axs (list): List of matplotlib axes for updating plots.
-            log_callback (callable): Optional callback for logging the state.
+            control_settings (dict): Controller limits (blade_angle_min/max, n_min/max).
+            record (bool): Append the outputs to the live plot history.
         """
         # Determine the delta time for simulation updates
         delta_time = self.refresh_rate_physical        
 
-        self.simulator.set_operation_attribute("Q", control_parameters['Q'])
+        # Flow rate from the flow scenario if one is set, otherwise the ramped target
+        Q = self.Q_function(self.elapsed_physical_time)
+        self.simulator.set_operation_attribute("Q", control_parameters['Q'] if Q is None else Q)
+
         # Control head (H) or directly set operational parameters
         head_control = control_parameters['head_control']
         blade_angle_lock = control_parameters['blade_angle_lock']
@@ -337,24 +604,8 @@ class ControlProcessor:
             self.simulator.set_operation_attribute("n", control_parameters['n'])
             self.simulator.set_operation_attribute("blade_angle", control_parameters['blade_angle'])
 
-        # Compute outputs and refresh the plots
-        self.compute_outputs()
-        refresh_rate = self.time_scale_factor
-        if self.elapsed_physical_time % refresh_rate == 0 and axs.any() is not None:
-            self.update_plot(axs)
-
-        # Log the current simulation state
-        blade_angle = self.simulator.operation_point.blade_angle
-        n = self.simulator.operation_point.n
-        Q = self.simulator.operation_point.Q
-        H = self.simulator.operation_point.H
-        status = f"Physical time = {self.elapsed_physical_time:.1f}  Q= {Q:.2f}  H= {H:.2f}  n= {n:.2f}  blade angle= {blade_angle:.2f}"
-
-        # Output log message via callback or default to console
-        if log_callback:
-            log_callback(status)
-        else:
-            print(status)
+        # Compute outputs
+        self.compute_outputs(record=record)
 
     def initialize_plot(self):
         """
@@ -367,53 +618,177 @@ class ControlProcessor:
         plt.subplots_adjust(hspace=0.4)
         return fig, axs
 
+    def setup_plot_lines(self, axs):
+        """
+        Create the persistent live plot lines on the subplot axes.
+
+        The lines are animated, so a full canvas draw renders only the axes, labels and
+        legends; the lines are then blitted on top of that saved background.
+
+        Args:
+            axs (list): List of subplot axes, one per series of PLOT_SERIES.
+        """
+        self.plot_lines = []
+        for ax, (attribute, label) in zip(axs, PLOT_SERIES):
+            ax.clear()
+            line, = ax.plot([], [], label=label, animated=True)
+            ax.set_ylabel(label)
+            ax.legend()
+            self.plot_lines.append(line)
+
+        self.plot_background = None
+        self.plot_limits = None
+        self.plot_time_unit = None
+        self.plot_envelope = None
+        self.plot_extremes = None
+
+        # One draw handler at a time, also when the lines move to another figure
+        if self.plot_draw_connection is not None:
+            canvas, connection_id = self.plot_draw_connection
+            canvas.mpl_disconnect(connection_id)
+        canvas = axs[0].figure.canvas
+        self.plot_draw_connection = (canvas, canvas.mpl_connect("draw_event", self.on_plot_draw))
+
+    def on_plot_draw(self, event):
+        """Save the freshly drawn background for blitting and draw the lines on top of it."""
+        if not self.plot_lines or event.canvas.figure is not self.plot_lines[0].figure:
+            return
+        if event.canvas.supports_blit:
+            self.plot_background = event.canvas.copy_from_bbox(event.canvas.figure.bbox)
+        for line in self.plot_lines:
+            line.axes.draw_artist(line)
+
+    def get_plot_arrays(self):
+        """
+        Return views of the latest history for plotting, without copying.
+
+        All series are taken at the same sample count, so they have equal lengths even
+        while the simulation thread keeps appending.
+
+        Returns:
+            dict: {attribute: read-only 1D array} for the columns of HISTORY_COLUMNS.
+        """
+        rows = self.history.view()
+        return {name: rows[:, index] for index, name in enumerate(HISTORY_COLUMNS)}
+
+    def update_plot_cache(self, count, x_range, num_bins):
+        """
+        Bring the plot envelope and the series extremes up to a sample count.
+
+        Only the samples added since the previous call are binned and scanned, so the
+        cost of a refresh does not grow with the history; the history is rebinned only
+        when the x range or the number of bins changes. The extremes cover every sample
+        since the plot was set up, including those already dropped from the history.
+
+        Args:
+            count (int): Sample count of the history to plot.
+            x_range (tuple): (min, max) physical time covered by the envelope (s).
+            num_bins (int): Number of envelope bins, e.g. the axes width in pixels.
+        """
+        rows = self.history.view(count)
+        if self.plot_envelope is None or not self.plot_envelope.matches(*x_range, num_bins):
+            self.plot_envelope = PlotEnvelope(*x_range, num_bins, len(PLOT_SERIES))
+            new_rows = rows
+        else:
+            new_rows = rows[max(len(rows) - (count - self.plot_sample_count), 0):]
+        self.plot_sample_count = count
+        if len(new_rows) == 0:
+            return
+
+        self.plot_envelope.add(new_rows[:, 0], new_rows[:, 1:])
+
+        # Rescanning samples after a rebin leaves the extremes unchanged
+        if self.plot_extremes is None:
+            self.plot_extremes = np.full((2, len(PLOT_SERIES)), np.nan)
+        with np.errstate(invalid='ignore'), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # All-NaN new samples leave the extremes unchanged
+            self.plot_extremes[0] = np.fmin(self.plot_extremes[0], np.nanmin(new_rows[:, 1:], axis=0))
+            self.plot_extremes[1] = np.fmax(self.plot_extremes[1], np.nanmax(new_rows[:, 1:], axis=0))
+
+    @staticmethod
+    def data_span(low, high):
+        """Return the width of a data range, with a small minimum so constant data gets visible limits."""
+        return max(high - low, abs(high) * 1e-3, 1e-9)
+
+    def limits_outdated(self, limits, low, high):
+        """Return True if the data range [low, high] leaves the limits or fills less than a third of them."""
+        if limits is None:
+            return True
+        return low < limits[0] or high > limits[1] or self.data_span(low, high) < (limits[1] - limits[0]) / 3
+
+    def padded_limits(self, low, high, headroom=0.25):
+        """Return axis limits around [low, high] with headroom above, so they rarely need to change."""
+        span = self.data_span(low, high)
+        return low - 0.05 * span, high + headroom * span
+
     def update_plot(self, axs):
         """
         Update the matplotlib plots with the latest simulation data.
 
+        Each line draws at most two points per pixel column of its axes: while the history
+        is short the samples themselves, then the min/max envelope of each pixel column
+        (see update_plot_cache). Only new samples are binned and scanned for the axis
+        limits, so neither the update nor the rendering grows with the history. Axis
+        limits grow with headroom, so most refreshes only blit the lines onto the saved
+        background; the figure is fully redrawn only when limits or the time unit change.
+
         Args:
             axs (list): List of subplot axes.
         """
+        if self.plot_lines is None or self.plot_lines[0].axes is not axs[0]:
+            self.setup_plot_lines(axs)
+
+        count = self.history.count
+        rows = self.history.view(count)
+        if len(rows) == 0:
+            return
+
         # Determine the appropriate time scale for plotting
-        max_physical_time = max(self.time_data) if self.time_data else 0
-
-        if max_physical_time > 300 * 60:  # If time exceeds 5 hours
-            time_unit = "Hours"
-            time_data_scaled = [t / 3600 for t in self.time_data]  # Convert seconds to hours
-        elif max_physical_time > 300:  # If time exceeds 5 minutes
-            time_unit = "Minutes"
-            time_data_scaled = [t / 60 for t in self.time_data]  # Convert seconds to minutes
+        first_time, last_time = rows[0, 0], rows[-1, 0]
+        time_unit, seconds_per_unit = next((name, seconds) for name, seconds, threshold in PLOT_TIME_UNITS
+                                           if last_time > threshold)
+
+        redraw = time_unit != self.plot_time_unit
+        if redraw:
+            self.plot_time_unit = time_unit
+            axs[len(PLOT_SERIES) - 1].set_xlabel(f"Physical Time [{time_unit}]")
+            self.plot_limits = None
+
+        limits = self.plot_limits or [None] * (len(PLOT_SERIES) + 1)
+        if self.limits_outdated(limits[0], first_time / seconds_per_unit, last_time / seconds_per_unit):
+            limits[0] = self.padded_limits(first_time / seconds_per_unit, last_time / seconds_per_unit)
+            for ax in axs[:len(PLOT_SERIES)]:
+                ax.set_xlim(*limits[0])
+            redraw = True
+
+        # One envelope bin per pixel column of the axes
+        num_bins = max(int(axs[0].bbox.width), 1)
+        self.update_plot_cache(count, (limits[0][0] * seconds_per_unit, limits[0][1] * seconds_per_unit), num_bins)
+        thin = len(rows) > 2 * num_bins
+        if not thin:
+            time_data_scaled = rows[:, 0] / seconds_per_unit
+
+        # Update each line, and the axis limits if the data outgrew them
+        for index, line in enumerate(self.plot_lines, start=1):
+            if thin:
+                x, y = self.plot_envelope.line(index - 1, x_start=first_time)
+                line.set_data(x / seconds_per_unit, y)
+            else:
+                line.set_data(time_data_scaled, rows[:, index])
+            low, high = self.plot_extremes[:, index - 1]
+            if np.isfinite(low) and self.limits_outdated(limits[index], low, high):
+                limits[index] = self.padded_limits(low, high, headroom=0.1)
+                line.axes.set_ylim(*limits[index])
+                redraw = True
+        self.plot_limits = limits
+
+        # Refresh the figure: blit the lines, or redraw everything when the axes changed
+        canvas = axs[0].figure.canvas
+        if redraw or self.plot_background is None:
+            canvas.draw()
         else:
-            time_unit = "Seconds"
-            time_data_scaled = self.time_data  # Keep time in seconds
-
-        # Update each subplot with the respective data
-        axs[0].clear()
-        axs[0].plot(time_data_scaled, self.H, label="H [m]")
-        axs[0].set_ylabel("H [m]")
-        axs[0].legend()
-
-        axs[1].clear()
-        axs[1].plot(time_data_scaled, self.Q, label="Q [m³/s]")
-        axs[1].set_ylabel("Q [m³/s]")
-        axs[1].legend()
-
-        axs[2].clear()
-        axs[2].plot(time_data_scaled, self.blade_angle, label="Blade Angle [°]")
-        axs[2].set_ylabel("Blade Angle [°]")
-        axs[2].legend()
-
-        axs[3].clear()
-        axs[3].plot(time_data_scaled, self.n, label="n [rpm]")
-        axs[3].set_ylabel("n [rpm]")
-        axs[3].legend()
-
-        axs[4].clear()
-        axs[4].plot(time_data_scaled, self.power, label="Power [W]")
-        axs[4].set_ylabel("Power [W]")
-        axs[4].legend()
-        axs[4].set_xlabel(f"Physical Time [{time_unit}]")
-
-        # Refresh the figure to display updated plots
-        axs[0].figure.canvas.draw()
-        axs[0].figure.canvas.flush_events()
+            canvas.restore_region(self.plot_background)
+            for line in self.plot_lines:
+                line.axes.draw_artist(line)
+            canvas.blit(canvas.figure.bbox)
+        canvas.flush_events()
@@ -2,14 +2,61 @@ import numpy as np
 from scipy.interpolate import PchipInterpolator
 from HillChart import HillChart
 from PerformanceCurve import PerformanceCurve
-import copy
 from turbine_data import TurbineData
 import pandas as pd
-import copy
 import time
-import matplotlib.pyplot as plt
+import os
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, wait
 from control_rule_based import ControlRuleBased
-from PyQt6.QtCore import QCoreApplication
+from hill_surface import HillSurface
+
+
+# Fields of the max power row returned by ControlSimulator.maximize_output
+MAX_POWER_FIELDS = ('H', 'Q', 'n', 'D', 'blade_angle', 'Q11', 'n11', 'efficiency', 'power')
+
+# Simulator of a pool worker process, built once from a HillSurface snapshot
+pool_worker_simulator = None
+
+
+def initialize_pool_worker(surface, D):
+    """
+    Build the simulator of a pool worker process.
+
+    Args:
+        surface (HillSurface): Snapshot of the fitted hill chart surface.
+        D (float): Runner diameter of the operation point.
+    """
+    global pool_worker_simulator
+    pool_worker_simulator = ControlSimulator.from_surface(surface)
+    pool_worker_simulator.operation_point.D = D
+    pool_worker_simulator.process_gui_events = False
+    pool_worker_simulator.set_message_callback(lambda message, overwrite=False: None)
+
+
+def maximize_output_task(Q, H_range, n_range, blade_angle_range):
+    """
+    Find the max power point of one flow rate over a chunk of blade angles in a pool worker.
+
+    Args:
+        Q (float): Flow rate.
+        H_range (tuple): Allowed head range (min, max).
+        n_range (array): Rotational speeds.
+        blade_angle_range (array): Blade angles of this chunk.
+
+    Returns:
+        tuple: (max power row as returned by ControlSimulator.maximize_output or None,
+        number of operating points without an n11 solution).
+    """
+    simulator = pool_worker_simulator
+    simulator.set_ranges(Q_range=[Q], H_range=H_range, n_range=n_range, blade_angle_range=blade_angle_range)
+    simulator.Q_counter = 1
+    simulator.operation_point.Q = Q
+    simulator.unsolved_count = 0
+    return simulator.maximize_output(*H_range), simulator.unsolved_count
+
 
 class ControlSimulator(HillChart):
     """Class for simulating turbine control."""    
@@ -29,12 +76,63 @@ class ControlSimulator(HillChart):
         self.n_range = None
         self.blade_angle_range = None   
 
+        # LRU cache of blade-angle slices, keyed by blade angle
+        self.slice_cache = OrderedDict()
+        self.slice_interpolators = {}          # Interpolators of cached slices, built on first use
+        self.slice_keys = {}                   # id of a cached n11 slice -> its cache key
+        self.slice_cache_size = 256            # Maximum number of cached slices
+        self.slice_cache_resolution = None     # Opt-in blade angle rounding step [degree], None keeps exact angles
+
         self.message_callback = None  # To store the callback function
+        self.progress_callback = None  # Called with (completed, total) during parallel runs
+        self.process_gui_events = True  # Let the Qt event loop run between blade angles
+        self.solver_info = None  # Convergence status and iteration counts of the latest n11 solve
+        self.n11_tolerance = 1e-3  # Default relative Q11 mismatch of the n11 solve; lower it for tighter solutions
+        self.unsolved_count = 0  # Operating points without an n11 solution (NaN results) since the last reset
+
+    @classmethod
+    def from_surface(cls, surface):
+        """
+        Create a simulator from a hill surface snapshot.
+
+        Args:
+            surface (HillSurface): Snapshot of the fitted hill chart surface.
+
+        Returns:
+            ControlSimulator: Simulator loaded with the surface and its BEP data.
+        """
+        simulator = cls()
+        simulator.get_data(surface.to_data())
+        simulator.get_BEP_data(surface.BEP_data)
+        return simulator
+
+    def surface_snapshot(self):
+        """Return a compact, picklable HillSurface snapshot of the loaded hill chart."""
+        return HillSurface.from_data(self.data, self.BEP_data)
+
+    def set_progress_callback(self, callback):
+        """
+        Set a callback for progress of parallel runs.
+
+        The callback is called as callback(completed, total) from a pool helper
+        thread, so GUI code should forward it to the GUI thread (e.g. via a Qt signal).
+        """
+        self.progress_callback = callback
 
     def set_message_callback(self, callback):
         """Set a callback for logging messages."""
         self.message_callback = callback
 
+    def process_events(self):
+        """
+        Let the Qt event loop run, so the GUI updates during long computations.
+
+        Qt is only imported here, so pool workers and headless runs never load it.
+        """
+        if self.process_gui_events:
+            from PyQt6.QtCore import QCoreApplication
+            QCoreApplication.processEvents()
+
     def emit_message(self, message, overwrite=False):
         """
         Emit a message to the GUI or console.
@@ -53,6 +151,51 @@ class ControlSimulator(HillChart):
 
 
 
+    def get_data(self, data):
+        """
+        Load hill chart data and invalidate slices cut from any previous surface.
+
+        Args:
+            data (TurbineData): Fitted hill chart data.
+        """
+        super().get_data(data)
+        self.clear_slice_cache()
+
+    def clear_slice_cache(self):
+        """Discard all cached blade-angle slices and their interpolators."""
+        self.slice_cache.clear()
+        self.slice_interpolators.clear()
+        self.slice_keys.clear()
+
+    def prewarm_slice_cache(self, blade_angles):
+        """
+        Slice the hill chart at blade angles ahead of use and build their interpolators.
+
+        Args:
+            blade_angles (iterable): Blade angles to cache.
+        """
+        for blade_angle in blade_angles:
+            self.prepare_slice_interpolators(*self.slice_data_for_blade_angle(blade_angle))
+
+    def quantize_blade_angle(self, blade_angle):
+        """
+        Round a blade angle to the slice cache resolution.
+
+        Rounding is opt-in: with a resolution set, nearby angles share one slice, cut at
+        the rounded angle, so the results move by up to half a step in blade angle.
+
+        Args:
+            blade_angle (float): Blade angle to quantize.
+
+        Returns:
+            float: Blade angle used both as cache key and as the slicing angle; the exact
+            angle if slice_cache_resolution is None.
+        """
+        if not self.slice_cache_resolution:
+            return float(blade_angle)
+        steps = round(float(blade_angle) / self.slice_cache_resolution)
+        return round(steps * self.slice_cache_resolution, 10)
+
     def set_operation_attribute(self, attribute_name, value):
         """
         Set an attribute in the operation_point data structure.
@@ -62,10 +205,12 @@ class ControlSimulator(HillChart):
             value (any): The value to assign to the specified attribute.
         """
 
-        # If value is a single-element list, extract the value
-        if isinstance(value, list) and len(value) == 1:
+        # If value is a single-element list or array, extract the value
+        if isinstance(value, np.ndarray) and value.size == 1:
+            value = value.item()
+        elif isinstance(value, list) and len(value) == 1:
             value = value[0]
-        elif isinstance(value, list):
+        elif isinstance(value, (list, np.ndarray)):
             raise ValueError(f"Invalid value for attribute: Expected a float or a single-element list, got {value}")
         elif not isinstance(value, (float, int)):
             raise TypeError(f"Invalid type for attribute: Expected float, got {type(value).__name__}")
@@ -88,86 +233,266 @@ class ControlSimulator(HillChart):
         self.blade_angle_range = blade_angle_range if blade_angle_range is not None else np.arange(9, 21, 2)
 
 
-    def compute_n11_iteratively(self, n11_guess, n11_slice, Q11_slice, efficiency_slice, tolerance=1e-3, max_iter=1000):
+    def compute_n11_iteratively(self, n11_guess, n11_slice, Q11_slice, efficiency_slice, tolerance=None, max_iter=50):
         """
-        Iteratively solve for n11, Q11, and head (H) values until a solution converges within tolerance.
+        Solve for n11, Q11, and head (H) at the rotational speed of self.operation_point.
+
+        Scalar wrapper around solve_n11; the convergence status and iteration count
+        of the solve are kept in self.solver_info.
 
         Args:
             n11_guess (float): Initial guess for n11.
             n11_slice (array): Array of n11 values for interpolation.
             Q11_slice (array): Array of Q11 values for interpolation.
             efficiency_slice (array): Array of efficiency values for interpolation.
-            tolerance (float): Convergence threshold for the iterative solution.
-            max_iter (int): Maximum number of iterations before stopping.
+            tolerance (float, optional): Convergence threshold on the relative Q11 mismatch.
+                Defaults to n11_tolerance.
+            max_iter (int): Maximum number of solver iterations.
 
         Returns:
-            tuple: (n11, H, Q11, efficiency) - calculated values for n11, head, Q11, and efficiency.
+            tuple: (n11, H, Q11, efficiency) - calculated values for n11, head, Q11, and efficiency,
+            NaN if no solution exists within the slice.
 
         Raises:
-            ValueError: If solution does not converge or data is insufficient.
+            ValueError: If data is insufficient.
         """
-        Q = self.operation_point.Q
-        D = self.operation_point.D
-        n = self.operation_point.n    
-
         try:
-            finite_mask = np.isfinite(efficiency_slice) & np.isfinite(n11_slice) & np.isfinite(Q11_slice)
-
-            # Filter out non-finite values
-            n11_clean = n11_slice[finite_mask]
-            Q11_clean = Q11_slice[finite_mask]
-            efficiency_clean = efficiency_slice[finite_mask]
-
-            if len(n11_clean) < 2 or len(Q11_clean) < 2 or len(efficiency_clean) < 2:
-                raise ValueError("Insufficient valid data points after filtering non-finite values.")
-
-            # Define min and max bounds for n11 based on the data range
-            min_n11 = n11_clean.min()
-            max_n11 = n11_clean.max()
-
-            try:
-                Q11_interpolator = PchipInterpolator(n11_clean, Q11_clean)
-            except Exception as e:
-                self.emit_message(
-                    f"Error creating Q11 interpolator in class '{self.__class__.__name__}', method 'compute_n11_iteratively': {e}"
-                )
-                self.plot_debug_data(n11_clean, Q11_clean, "n11_clean", "Q11_clean")
-                raise
-
-            try:
-                efficiency_interpolator = PchipInterpolator(n11_clean, efficiency_clean)
-            except Exception as e:
-                self.emit_message(
-                    f"Error creating efficiency interpolator in class '{self.__class__.__name__}', method 'compute_n11_iteratively': {e}"
-                )
-                self.plot_debug_data(n11_clean, efficiency_clean, "n11_clean", "efficiency_clean")
-                raise
-
-            # Iteratively solve for n11, Q11, and H using the initial guess
-            for iter_count in range(max_iter):
-                # Cap n11_guess within the bounds
-                n11_guess = np.clip(n11_guess, min_n11, max_n11)
-
-                H = (n * D / n11_guess) ** 2
-                Q11_calculated = Q / (D**2 * np.sqrt(H))
-
-                Q11_lookup = Q11_interpolator(n11_guess)
-                efficiency = efficiency_interpolator(n11_guess)
-
-                if abs(Q11_calculated - Q11_lookup) / abs(Q11_lookup) < tolerance:
-                    return n11_guess, H, Q11_calculated, efficiency
-                elif iter_count == max_iter - 1:
-                    return np.nan, np.nan, np.nan, np.nan
-
-                damping_factor = 0.1
-                n11_guess *= 1 + damping_factor * ((Q11_lookup / Q11_calculated) - 1)
-
-            raise ValueError("Solution did not converge within the specified number of iterations.")
-
-        except Exception as e:            
+            solution = self.solve_n11([self.operation_point.n], n11_guess, n11_slice, Q11_slice, efficiency_slice,
+                                      tolerance=tolerance, max_iter=max_iter)
+        except Exception as e:
             self.emit_message(f"Error in iterative solution in class '{self.__class__.__name__}': {e}")
             raise
 
+        return solution['n11'][0], solution['H'][0], solution['Q11'][0], solution['efficiency'][0]
+
+    def prepare_slice_interpolators(self, n11_slice, Q11_slice, efficiency_slice):
+        """
+        Return the interpolators of a blade-angle slice.
+
+        Interpolators of slices served by slice_data_for_blade_angle are built once
+        and memoized next to the cached slice; other slices are interpolated afresh.
+
+        Args:
+            n11_slice (array): Array of n11 values for interpolation.
+            Q11_slice (array): Array of Q11 values for interpolation.
+            efficiency_slice (array): Array of efficiency values for interpolation.
+
+        Returns:
+            tuple: (Q11_interpolator, Q11_derivative, efficiency_interpolator, min_n11, max_n11)
+
+        Raises:
+            ValueError: If fewer than two finite points remain after filtering, or the
+                interpolators cannot be built (e.g. repeated n11 values).
+        """
+        key = self.slice_keys.get(id(n11_slice))
+        cached_slice = self.slice_cache.get(key) if key is not None else None
+        if cached_slice is None or any(cached is not array for cached, array in
+                                       zip(cached_slice, (n11_slice, Q11_slice, efficiency_slice))):
+            return self.build_slice_interpolators(n11_slice, Q11_slice, efficiency_slice)
+
+        interpolators = self.slice_interpolators.get(key)
+        if interpolators is None:
+            interpolators = self.build_slice_interpolators(n11_slice, Q11_slice, efficiency_slice)
+            self.slice_interpolators[key] = interpolators
+        return interpolators
+
+    def build_slice_interpolators(self, n11_slice, Q11_slice, efficiency_slice):
+        """
+        Filter a blade-angle slice and build its Q11 and efficiency interpolators.
+
+        Args:
+            n11_slice (array): Array of n11 values for interpolation.
+            Q11_slice (array): Array of Q11 values for interpolation.
+            efficiency_slice (array): Array of efficiency values for interpolation.
+
+        Returns:
+            tuple: (Q11_interpolator, Q11_derivative, efficiency_interpolator, min_n11, max_n11)
+
+        Raises:
+            ValueError: If fewer than two finite points remain after filtering, or the
+                interpolators cannot be built (e.g. repeated n11 values).
+        """
+        finite_mask = np.isfinite(efficiency_slice) & np.isfinite(n11_slice) & np.isfinite(Q11_slice)
+
+        # Filter out non-finite values
+        n11_clean = n11_slice[finite_mask]
+        Q11_clean = Q11_slice[finite_mask]
+        efficiency_clean = efficiency_slice[finite_mask]
+
+        if len(n11_clean) < 2 or len(Q11_clean) < 2 or len(efficiency_clean) < 2:
+            raise ValueError("Insufficient valid data points after filtering non-finite values.")
+
+        # Raise instead of plotting the data: this also runs on the simulation worker thread
+        try:
+            Q11_interpolator = PchipInterpolator(n11_clean, Q11_clean)
+        except ValueError as e:
+            raise ValueError(
+                f"Error creating Q11 interpolator in class '{self.__class__.__name__}', method 'build_slice_interpolators': {e}"
+            ) from e
+
+        try:
+            efficiency_interpolator = PchipInterpolator(n11_clean, efficiency_clean)
+        except ValueError as e:
+            raise ValueError(
+                f"Error creating efficiency interpolator in class '{self.__class__.__name__}', method 'build_slice_interpolators': {e}"
+            ) from e
+
+        # Define min and max bounds for n11 based on the data range
+        return Q11_interpolator, Q11_interpolator.derivative(), efficiency_interpolator, n11_clean.min(), n11_clean.max()
+
+    def compute_n11_vectorized(self, n_values, n11_guess, n11_slice, Q11_slice, efficiency_slice, tolerance=None, max_iter=50):
+        """
+        Solve the operating point for a whole vector of rotational speeds at once.
+
+        Array wrapper around solve_n11; the convergence status and iteration counts
+        of the solve are kept in self.solver_info.
+
+        Args:
+            n_values (array): Rotational speeds to solve for.
+            n11_guess (float): Initial guess for n11, shared by all speeds.
+            n11_slice, Q11_slice, efficiency_slice (arrays): Slice data for interpolation.
+            tolerance (float, optional): Convergence threshold on the relative Q11 mismatch.
+                Defaults to n11_tolerance.
+            max_iter (int): Maximum number of solver iterations.
+
+        Returns:
+            tuple: (n11, H, Q11, efficiency) arrays shaped like n_values,
+            NaN where no solution exists within the slice.
+        """
+        solution = self.solve_n11(n_values, n11_guess, n11_slice, Q11_slice, efficiency_slice,
+                                  tolerance=tolerance, max_iter=max_iter)
+        return solution['n11'], solution['H'], solution['Q11'], solution['efficiency']
+
+    def solve_n11(self, n_values, n11_guess, n11_slice, Q11_slice, efficiency_slice, tolerance=None, max_iter=50):
+        """
+        Find the n11 of each rotational speed at which the flow matches the slice.
+
+        With H = (n * D / n11)^2 the flow condition Q / (D^2 * sqrt(H)) = Q11(n11) becomes
+        f(n11) = Q * n11 / (D^3 * n) - Q11(n11) = 0. Sign changes of f at the PCHIP nodes
+        bracket its roots; the bracket nearest to n11_guess is kept and solved with a
+        safeguarded Newton iteration (bisection whenever a Newton step leaves the bracket).
+        Without a sign change, a slice end that already satisfies the tolerance is accepted.
+        Uses the Q and D stored in self.operation_point. Speeds left without a solution
+        are added to unsolved_count.
+
+        The default tolerance (n11_tolerance, 1e-3) is the one of the former fixed-point
+        iteration, so results stay within the same accuracy; lower it for tighter solutions.
+
+        Args:
+            n_values (array-like): Rotational speeds to solve for.
+            n11_guess (float): Initial guess for n11, used to pick among several roots.
+            n11_slice, Q11_slice, efficiency_slice (arrays): Slice data for interpolation.
+            tolerance (float, optional): Convergence threshold on the relative Q11 mismatch.
+                Defaults to n11_tolerance.
+            max_iter (int): Maximum number of Newton/bisection iterations.
+
+        Returns:
+            dict: 'n11', 'H', 'Q11' and 'efficiency' arrays shaped like n_values (NaN where
+            not converged), 'converged' and 'bracketed' (bool arrays, bracketed is False where
+            the slice holds no root) and 'iterations' (int array).
+        """
+        if tolerance is None:
+            tolerance = self.n11_tolerance
+        Q = self.operation_point.Q
+        D = self.operation_point.D
+        n_values = np.asarray(n_values, dtype=float)
+        n_flat = n_values.ravel()
+        size = n_flat.size
+
+        Q11_interpolator, dQ11_interpolator, efficiency_interpolator, min_n11, max_n11 = self.prepare_slice_interpolators(
+            n11_slice, Q11_slice, efficiency_slice)
+
+        # f(n11) = slope * n11 - Q11(n11), one slope per speed
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = Q / (D**3 * n_flat)
+
+        # Residual at every interpolation node; a sign change brackets a root
+        nodes = Q11_interpolator.x
+        residual_nodes = slope[:, None] * nodes[None, :] - Q11_interpolator(nodes)[None, :]
+        with np.errstate(invalid='ignore'):
+            bracketing = residual_nodes[:, :-1] * residual_nodes[:, 1:] <= 0
+
+        # Pick the bracket nearest to the initial guess
+        guess = float(np.clip(n11_guess, min_n11, max_n11))
+        distance = np.maximum(nodes[:-1] - guess, 0) + np.maximum(guess - nodes[1:], 0)
+        bracket = np.argmin(np.where(bracketing, distance[None, :], np.inf), axis=1)
+        has_bracket = bracketing[np.arange(size), bracket]
+
+        n11_result = np.full(size, np.nan)
+        converged = np.zeros(size, dtype=bool)
+        iterations = np.zeros(size, dtype=int)
+
+        def relative_error(n11, slope):
+            Q11_lookup = Q11_interpolator(n11)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return np.abs(slope * n11 - Q11_lookup) / np.abs(Q11_lookup)
+
+        # Without a bracket, accept a slice end that is already within tolerance (nearest end first)
+        ends = (min_n11, max_n11) if guess - min_n11 <= max_n11 - guess else (max_n11, min_n11)
+        for end in ends:
+            at_end = ~has_bracket & ~converged & (relative_error(end, slope) < tolerance)
+            n11_result[at_end] = end
+            converged[at_end] = True
+
+        active = np.flatnonzero(has_bracket)
+        lower = nodes[bracket[active]]
+        upper = nodes[bracket[active] + 1]
+        residual_lower = residual_nodes[active, bracket[active]]
+        residual_upper = residual_nodes[active, bracket[active] + 1]
+
+        # Start from the secant point of the bracket
+        with np.errstate(divide='ignore', invalid='ignore'):
+            n11 = lower - residual_lower * (upper - lower) / (residual_upper - residual_lower)
+        n11 = np.where(np.isfinite(n11), n11, 0.5 * (lower + upper))
+
+        for iter_count in range(1, max_iter + 1):
+            slope_active = slope[active]
+            Q11_lookup = Q11_interpolator(n11)
+            residual = slope_active * n11 - Q11_lookup
+            iterations[active] = iter_count
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                done = (np.abs(residual) / np.abs(Q11_lookup) < tolerance) | (upper - lower <= 1e-12 * np.abs(n11))
+            n11_result[active[done]] = n11[done]
+            converged[active[done]] = True
+
+            keep = ~done
+            if not keep.any():
+                break
+            active, n11, residual, slope_active = active[keep], n11[keep], residual[keep], slope_active[keep]
+            lower, upper, residual_lower = lower[keep], upper[keep], residual_lower[keep]
+
+            # Shrink the bracket around the root
+            same_side = np.sign(residual) == np.sign(residual_lower)
+            lower = np.where(same_side, n11, lower)
+            residual_lower = np.where(same_side, residual, residual_lower)
+            upper = np.where(same_side, upper, n11)
+
+            # Newton step, replaced by bisection when it would leave the bracket
+            with np.errstate(divide='ignore', invalid='ignore'):
+                newton = n11 - residual / (slope_active - dQ11_interpolator(n11))
+            outside = ~np.isfinite(newton) | (newton <= lower) | (newton >= upper)
+            n11 = np.where(outside, 0.5 * (lower + upper), newton)
+
+        H_result = (n_flat * D / n11_result) ** 2
+        Q11_result = Q / (D**2 * np.sqrt(H_result))
+        efficiency_result = np.full(size, np.nan)
+        efficiency_result[converged] = efficiency_interpolator(n11_result[converged])
+
+        self.unsolved_count += int(size - np.count_nonzero(converged))
+        self.solver_info = {
+            'converged': converged.reshape(n_values.shape),
+            'bracketed': has_bracket.reshape(n_values.shape),
+            'iterations': iterations.reshape(n_values.shape)
+        }
+        return {
+            'n11': n11_result.reshape(n_values.shape),
+            'H': H_result.reshape(n_values.shape),
+            'Q11': Q11_result.reshape(n_values.shape),
+            'efficiency': efficiency_result.reshape(n_values.shape),
+            **self.solver_info
+        }
+
     def plot_debug_data(self, x, y, xlabel, ylabel):
         """
         Plot debug data to help locate the issue.
@@ -210,6 +535,10 @@ class ControlSimulator(HillChart):
     def slice_data_for_blade_angle(self, blade_angle):
         """
         Perform slicing based on blade_angle and return the slices.
+
+        Slices are served from an LRU cache keyed by the blade angle (rounded only if
+        slice_cache_resolution is set), so repeated requests for the same angle skip the
+        contouring step entirely.
         
         Args:
             blade_angle (float): Blade angle to use for slicing.
@@ -217,15 +546,31 @@ class ControlSimulator(HillChart):
         Returns:
             tuple: n11_slice, Q11_slice, efficiency_slice
         """
-        # Initialize the performance curve and create a deep copy for slicing
+        key = self.quantize_blade_angle(blade_angle)
+        cached_slice = self.slice_cache.get(key)
+        if cached_slice is not None:
+            self.slice_cache.move_to_end(key)
+            return cached_slice
+
+        # Slice a view of the data so the simulator's own grids are left untouched
         performance_curve = PerformanceCurve(self)
-        simulator_copy = copy.deepcopy(performance_curve)
-        n11_slice, Q11_slice, efficiency_slice, _ = simulator_copy.slice_hill_chart_data(selected_blade_angle=blade_angle)
+        performance_curve.data = self.data.view()
+        n11_slice, Q11_slice, efficiency_slice, _ = performance_curve.slice_hill_chart_data(selected_blade_angle=key)
 
         # Verify that there’s sufficient data to proceed
         if len(Q11_slice) < 2 or len(n11_slice) < 2:
              raise ValueError(f"Blade angle {blade_angle}° is outside of the available hill chart data range.")
-            
+
+        # Cached arrays are shared between callers, so protect them from in-place edits
+        for array in (n11_slice, Q11_slice, efficiency_slice):
+            array.flags.writeable = False
+
+        self.slice_cache[key] = (n11_slice, Q11_slice, efficiency_slice)
+        self.slice_keys[id(n11_slice)] = key
+        if len(self.slice_cache) > self.slice_cache_size:
+            evicted_key, (evicted_n11, _, _) = self.slice_cache.popitem(last=False)
+            self.slice_interpolators.pop(evicted_key, None)
+            self.slice_keys.pop(id(evicted_n11), None)
 
         # Return slices if sufficient data is available
         return n11_slice, Q11_slice, efficiency_slice
@@ -263,33 +608,49 @@ class ControlSimulator(HillChart):
         return self.operation_point
 
     
-    def maximize_output_in_flow_range(self):
+    def maximize_output_in_flow_range(self, vectorized=True, parallel=False, max_workers=None):
         """
         Calculate and maximize power output within the specified ranges.
 
+        Args:
+            vectorized (bool): Solve all speeds of a blade angle at once (see maximize_output).
+            parallel (bool): Spread the flow rates over a pool of worker processes
+                (see maximize_output_in_parallel for when this pays off). Ignores `vectorized`.
+            max_workers (int, optional): Number of worker processes for a parallel run.
+
+        Returns:
+            dict: Max power row (or None) for each Q, in Q_range order.
+
         Raises:
-            ValueError: If any required range is still unset (None).
+            ValueError: If any required range is still unset (None), or Q_range repeats a value.
         """
         # Ensure that all ranges have been set
         if any(x is None for x in (self.Q_range, self.H_range, self.n_range, self.blade_angle_range)):
             raise ValueError("Ranges for Q, H, n, and blade_angle must be set before calling this method.")
+        self.check_unique_Q_range()
 
         min_H, max_H = self.H_range
         max_power_results = {}        
         self.Q_counter = 0
+        self.unsolved_count = 0
 
         # Start timing the operation
         start_time = time.time()
 
-        # Iterate over Q_range and calculate maximum power for each Q
-        for Q in self.Q_range:            
-            self.Q_counter += 1            
-            self.operation_point.Q = Q
-            max_power_row = self.maximize_output(min_H, max_H)
-            max_power_results[Q] = max_power_row
-            
-        
+        if parallel:
+            max_power_results = self.maximize_output_in_parallel(max_workers)
+        else:
+            # Iterate over Q_range and calculate maximum power for each Q
+            for Q in self.Q_range:
+                self.Q_counter += 1
+                self.operation_point.Q = Q
+                max_power_row = self.maximize_output(min_H, max_H, vectorized=vectorized)
+                max_power_results[Q] = max_power_row
+
         self.emit_message("\nComplete")        
+        if self.unsolved_count:
+            self.emit_message(f"\n{self.unsolved_count} operating point(s) had no n11 solution within their "
+                              "blade angle slice and were left out")
 
         # End timing the operation
         end_time = time.time()
@@ -302,8 +663,162 @@ class ControlSimulator(HillChart):
         self.plot_results(max_power_results)
         return max_power_results
 
-    def maximize_output(self, min_H, max_H):
-        """Iterate through n_range and blade_angle_range to find max power within head constraints."""
+    def check_unique_Q_range(self):
+        """
+        Make sure that Q_range has no repeated values, as results are keyed by Q.
+
+        Raises:
+            ValueError: If a flow rate appears more than once.
+        """
+        Q_values, counts = np.unique(np.asarray(self.Q_range, dtype=float), return_counts=True)
+        if np.any(counts > 1):
+            raise ValueError(f"Q_range repeats the flow rate(s) {', '.join(f'{Q:g}' for Q in Q_values[counts > 1])}.")
+
+    def maximize_output_in_parallel(self, max_workers=None):
+        """
+        Run maximize_output for every Q of Q_range in a pool of worker processes.
+
+        Each worker receives a HillSurface snapshot once, when it starts. The work is
+        split into (Q, blade angle chunk) tasks so that short Q ranges still keep all
+        workers busy, and the best point of each chunk is merged back per Q here.
+        Results are identical to the serial vectorized run. Meant to be run through
+        maximize_output_in_flow_range, which validates the ranges.
+
+        Starting the pool costs a few seconds (spawned interpreters import scipy and
+        pandas, and each worker rebuilds its own slice cache), while the serial
+        vectorized run takes well under a second for typical sweeps (e.g. ~0.2 s against
+        ~5 s for the default MaximisedOutputProcessor ranges). The pool only pays off for
+        sweeps that take the serial run tens of seconds or more, on several cores; the
+        serial run stays the default.
+
+        Args:
+            max_workers (int, optional): Number of worker processes. Defaults to the CPU count.
+
+        Returns:
+            dict: Max power row (or None) for each Q, in Q_range order.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        min_H, max_H = self.H_range
+        n_values = np.asarray(self.n_range, dtype=float)
+        blade_angles = np.asarray(self.blade_angle_range, dtype=float)
+
+        # Split the blade angles so that there are at least as many tasks as workers
+        n_chunks = min(len(blade_angles), max(1, -(-max_workers // len(self.Q_range))))
+        blade_angle_chunks = np.array_split(blade_angles, n_chunks)
+
+        total = len(self.Q_range) * len(blade_angle_chunks)
+        completed = 0
+        lock = threading.Lock()
+
+        def report_progress(future):
+            # Runs on the executor's helper thread
+            nonlocal completed
+            with lock:
+                completed += 1
+                if self.progress_callback:
+                    self.progress_callback(completed, total)
+
+        # Spawned workers avoid forking a process that holds Qt and plotting state
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=initialize_pool_worker,
+                                 initargs=(self.surface_snapshot(), self.operation_point.D)) as executor:
+            futures = {}
+            for Q in self.Q_range:
+                futures[Q] = [executor.submit(maximize_output_task, Q, (min_H, max_H), n_values, chunk)
+                              for chunk in blade_angle_chunks]
+                for future in futures[Q]:
+                    future.add_done_callback(report_progress)
+            wait([future for chunk_futures in futures.values() for future in chunk_futures])
+
+        # Keep the first of equal maxima, like the serial argmax over blade angles
+        max_power_results = {}
+        for Q, chunk_futures in futures.items():
+            max_power_row = None
+            for future in chunk_futures:
+                row, unsolved_count = future.result()
+                self.unsolved_count += unsolved_count
+                if row is not None and (max_power_row is None or row['power'] > max_power_row['power']):
+                    max_power_row = row
+            max_power_results[Q] = max_power_row
+        self.Q_counter = len(self.Q_range)
+
+        return max_power_results
+
+    def maximize_output(self, min_H, max_H, vectorized=True):
+        """
+        Iterate through n_range and blade_angle_range to find max power within head constraints.
+
+        Args:
+            min_H, max_H (float): Allowed head range.
+            vectorized (bool): If True, solve the whole n_range of each blade angle at once
+                with NumPy arrays; otherwise evaluate every (blade angle, n) pair separately.
+
+        Returns:
+            dict: Operating point of maximum power, one entry per field of MAX_POWER_FIELDS,
+            or None if no point satisfies the head limits. Both methods return the same type.
+        """
+        if not vectorized:
+            return self.maximize_output_loop(min_H, max_H)
+
+        Q = self.operation_point.Q
+        D = self.operation_point.D
+        n_values = np.asarray(self.n_range, dtype=float)
+        blade_angles = np.asarray(self.blade_angle_range, dtype=float)
+
+        # Preallocated results, one row per blade angle and one column per speed
+        shape = (len(blade_angles), len(n_values))
+        n11_grid = np.full(shape, np.nan)
+        H_grid = np.full(shape, np.nan)
+        Q11_grid = np.full(shape, np.nan)
+        efficiency_grid = np.full(shape, np.nan)
+
+        # Start timing the operation
+        start_time = time.time()
+
+        for index, blade_angle in enumerate(blade_angles):
+            # Slice data based on the blade angle
+            n11_slice, Q11_slice, efficiency_slice = self.slice_data_for_blade_angle(blade_angle)
+            n11_grid[index], H_grid[index], Q11_grid[index], efficiency_grid[index] = self.compute_n11_vectorized(
+                n_values, self.BEP_data.n11[0], n11_slice, Q11_slice, efficiency_slice)
+
+            self.emit_message(f"Total progress = {self.Q_counter} / {len(self.Q_range)}, Progress for current Q = {(index + 1) * len(n_values)}/{n11_grid.size}")
+            self.process_events()
+
+        power_grid = 9.8 * 1000 * Q * H_grid * efficiency_grid
+
+        # End timing the operation
+        elapsed_time = time.time() - start_time
+
+        # Emit elapsed time
+        self.emit_message(f"Elapsed time: {elapsed_time:.0f} seconds", overwrite=False)
+
+        # Take the maximum power among points within the head limits
+        with np.errstate(invalid='ignore'):
+            valid = np.isfinite(power_grid) & (H_grid >= min_H) & (H_grid <= max_H)
+        if not valid.any():
+            return None
+        row, col = np.unravel_index(np.argmax(np.where(valid, power_grid, -np.inf)), shape)
+
+        return {
+            'H': H_grid[row, col],
+            'Q': Q,
+            'n': n_values[col],
+            'D': D,
+            'blade_angle': blade_angles[row],
+            'Q11': Q11_grid[row, col],
+            'n11': n11_grid[row, col],
+            'efficiency': efficiency_grid[row, col],
+            'power': power_grid[row, col]
+        }
+
+    def maximize_output_loop(self, min_H, max_H):
+        """
+        Evaluate every (blade angle, n) pair separately and return the max power row within head constraints.
+
+        Returns:
+            dict: Operating point of maximum power as returned by maximize_output, or None.
+        """
         all_outputs = []
         counter = 0
         total = len(self.n_range) * len(self.blade_angle_range)
@@ -319,12 +834,12 @@ class ControlSimulator(HillChart):
 
                 # Emit progress messages with overwrite=True
                 self.emit_message(f"Total progress = {self.Q_counter} / {len(self.Q_range)}, Progress for current Q = {counter}/{total}")                
-                QCoreApplication.processEvents()  # Allow the GUI to update
+                self.process_events()
 
                 self.operation_point.n = n
                 self.operation_point.blade_angle = blade_angle
                 output = self.calculate_results_from_slice(n11_slice, Q11_slice, efficiency_slice)
-                all_outputs.append(copy.deepcopy(vars(output)))
+                all_outputs.append(output.as_dict())
 
         # End timing the operation
         end_time = time.time()
@@ -336,12 +851,16 @@ class ControlSimulator(HillChart):
         # Process the collected outputs
         df = pd.DataFrame(all_outputs).dropna(subset=['power'])
         df_capped_H = df[(df['H'] >= min_H) & (df['H'] <= max_H)]
-        max_power_row = df_capped_H.loc[df_capped_H['power'].idxmax()] if not df_capped_H.empty else None
+        if df_capped_H.empty:
+            return None
+        max_power_row = df_capped_H.loc[df_capped_H['power'].idxmax()]
 
-        return max_power_row
+        return {name: max_power_row[name] for name in MAX_POWER_FIELDS}
 
     def plot_results(self, max_power_results):
         """Generate plots and return them as figures to be displayed in GUI tabs."""
+        import matplotlib.pyplot as plt
+
         Q_values, power_values, n_values, blade_angle_values, efficiency_values, head_values = [], [], [], [], [], []
         for Q, result in max_power_results.items():
             if result is not None:
@@ -0,0 +1,195 @@
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+
+class FlowScenario:
+    """
+    Inflow Q(t) of a control simulation, precomputed into a lookup table.
+
+    The flow is tabulated at a fixed time step from the start time, so sampling it
+    is O(1) per tick: the two neighbouring entries are found by index and linearly
+    interpolated. Before the start and after the end the first and last values hold.
+
+    Scenarios are built with the class methods (constant, sinusoidal, stochastic,
+    from_csv) and combined with step events through with_steps.
+    """
+
+    def __init__(self, Q, time_step=1.0, start_time=0.0):
+        """
+        Create a scenario from tabulated flow values.
+
+        Args:
+            Q (array): Flow rate at start_time, start_time + time_step, ... (m³/s).
+            time_step (float): Time between the tabulated values (s).
+            start_time (float): Time of the first value (s).
+
+        Raises:
+            ValueError: If the table is empty, contains non-finite values or the time step is not positive.
+        """
+        self.Q = np.array(Q, dtype=float).ravel()
+        if len(self.Q) == 0 or not np.all(np.isfinite(self.Q)):
+            raise ValueError("A flow scenario needs at least one value, and all values must be finite.")
+        if time_step <= 0:
+            raise ValueError("The time step of a flow scenario must be positive.")
+        self.Q.flags.writeable = False
+        self.time_step = float(time_step)
+        self.start_time = float(start_time)
+        self.last_index = len(self.Q) - 1
+
+    @property
+    def time(self):
+        """Times of the tabulated values (s)."""
+        return self.start_time + self.time_step * np.arange(len(self.Q))
+
+    @property
+    def duration(self):
+        """Time covered by the table (s)."""
+        return self.last_index * self.time_step
+
+    def __call__(self, t):
+        """
+        Sample the flow at one time.
+
+        Args:
+            t (float): Elapsed physical time (s).
+
+        Returns:
+            float: Flow rate (m³/s).
+        """
+        position = (t - self.start_time) / self.time_step
+        if position <= 0:
+            return float(self.Q[0])
+        index = int(position)
+        if index >= self.last_index:
+            return float(self.Q[-1])
+        fraction = position - index
+        return float(self.Q[index] + fraction * (self.Q[index + 1] - self.Q[index]))
+
+    def sample(self, times):
+        """
+        Sample the flow at many times.
+
+        Args:
+            times (array): Elapsed physical times (s).
+
+        Returns:
+            np.ndarray: Flow rates (m³/s).
+        """
+        return np.interp(times, self.time, self.Q)
+
+    @classmethod
+    def constant(cls, Q, duration, time_step=1.0):
+        """
+        Constant flow.
+
+        Args:
+            Q (float): Flow rate (m³/s).
+            duration (float): Time covered (s).
+            time_step (float): Time between the tabulated values (s).
+
+        Returns:
+            FlowScenario: The scenario.
+        """
+        return cls(np.full(cls.num_steps(duration, time_step), float(Q)), time_step)
+
+    @classmethod
+    def sinusoidal(cls, mean, amplitude, period, duration, time_step=1.0, phase=0.0):
+        """
+        Flow oscillating around a mean, e.g. a daily or tidal cycle.
+
+        Args:
+            mean (float): Mean flow rate (m³/s).
+            amplitude (float): Amplitude of the oscillation (m³/s).
+            period (float): Period of the oscillation (s).
+            duration (float): Time covered (s).
+            time_step (float): Time between the tabulated values (s).
+            phase (float): Phase at time zero (rad).
+
+        Returns:
+            FlowScenario: The scenario.
+        """
+        t = time_step * np.arange(cls.num_steps(duration, time_step))
+        return cls(mean + amplitude * np.sin(2 * np.pi * t / period + phase), time_step)
+
+    @classmethod
+    def stochastic(cls, mean, std, correlation_time, duration, time_step=1.0, seed=None, min_Q=0.0):
+        """
+        Randomly fluctuating flow: an Ornstein-Uhlenbeck process around a mean.
+
+        The process is sampled exactly at the time step, x[k+1] = a x[k] + sqrt(1 - a²) std e[k]
+        with a = exp(-time_step / correlation_time), and generated in one vectorized filter pass.
+
+        Args:
+            mean (float): Mean flow rate (m³/s).
+            std (float): Standard deviation of the fluctuation (m³/s).
+            correlation_time (float): Time over which the fluctuation stays correlated (s).
+            duration (float): Time covered (s).
+            time_step (float): Time between the tabulated values (s).
+            seed (int, optional): Seed of the random generator, for reproducible scenarios.
+            min_Q (float): Lower limit of the flow rate (m³/s).
+
+        Returns:
+            FlowScenario: The scenario.
+        """
+        rng = np.random.default_rng(seed)
+        noise = rng.standard_normal(cls.num_steps(duration, time_step))
+
+        # Stationary start, then the AR(1) recursion as a linear filter
+        a = np.exp(-time_step / correlation_time)
+        noise[1:] *= np.sqrt(1 - a**2)
+        fluctuation = lfilter([1.0], [1.0, -a], noise) * std
+        return cls(np.maximum(mean + fluctuation, min_Q), time_step)
+
+    @classmethod
+    def from_csv(cls, file_path, time_column="Time", flow_column="Q", time_step=1.0):
+        """
+        Replay a recorded flow series, resampled linearly onto a fixed time step.
+
+        Args:
+            file_path (str): Path of a CSV file with a time column (s) and a flow column (m³/s).
+            time_column (str): Header of the time column.
+            flow_column (str): Header of the flow column.
+            time_step (float): Time between the tabulated values (s).
+
+        Returns:
+            FlowScenario: The scenario, starting at the first recorded time.
+
+        Raises:
+            ValueError: If a column is missing or the times are not increasing.
+        """
+        frame = pd.read_csv(file_path, encoding='utf-8-sig', skipinitialspace=True)
+        frame.columns = [str(name).strip() for name in frame.columns]
+        missing = [name for name in (time_column, flow_column) if name not in frame.columns]
+        if missing:
+            raise ValueError(f"Missing column(s) {', '.join(missing)} in '{file_path}'. Found: {', '.join(frame.columns)}")
+
+        frame = frame[[time_column, flow_column]].dropna()
+        times = frame[time_column].to_numpy(dtype=float)
+        flows = frame[flow_column].to_numpy(dtype=float)
+        if len(times) == 0 or np.any(np.diff(times) <= 0):
+            raise ValueError(f"The times in '{file_path}' must be increasing.")
+
+        grid = times[0] + time_step * np.arange(cls.num_steps(times[-1] - times[0], time_step))
+        return cls(np.interp(grid, times, flows), time_step, start_time=times[0])
+
+    @staticmethod
+    def num_steps(duration, time_step):
+        """Return the number of table entries covering a duration, both ends included."""
+        return int(np.floor(duration / time_step + 1e-9)) + 1
+
+    def with_steps(self, events):
+        """
+        Add step events, e.g. a gate opening or a sudden change of inflow.
+
+        Args:
+            events (list): (time, change) pairs; the flow changes by change (m³/s) from time (s) onwards.
+
+        Returns:
+            FlowScenario: New scenario with the steps added to this one.
+        """
+        Q = np.array(self.Q)
+        time = self.time
+        for event_time, change in events:
+            Q[time >= event_time] += change
+        return FlowScenario(Q, self.time_step, self.start_time)
@@ -0,0 +1,132 @@
+import numpy as np
+
+
+def edge_slopes(h0, h1, m0, m1):
+    """
+    One-sided three-point end slopes of a PCHIP interpolant (shape preserving, as in SciPy).
+
+    Args:
+        h0, h1 (array): Widths of the end interval and of its neighbour.
+        m0, m1 (array): Secant slopes of the end interval and of its neighbour.
+
+    Returns:
+        np.ndarray: Derivatives at the end points.
+    """
+    d = ((2 * h0 + h1) * m0 - h0 * m1) / (h0 + h1)
+    wrong_sign = np.sign(d) != np.sign(m0)
+    overshoot = (np.sign(m0) != np.sign(m1)) & (np.abs(d) > 3 * np.abs(m0))
+    d = np.where(overshoot, 3 * m0, d)
+    return np.where(wrong_sign, 0.0, d)
+
+
+class GroupedPchip:
+    """
+    PCHIP interpolants of many groups of points, built and evaluated in one pass.
+
+    Points are grouped by a key (e.g. blade angle) with a single sort and laid out in
+    a padded (groups, points) array, so the slopes and evaluations of all groups are
+    vectorized. Each group gives the same result as scipy's PchipInterpolator over its
+    points, including extrapolation with the end polynomials.
+    """
+
+    def __init__(self, keys, x, *fields):
+        """
+        Group the points and compute the PCHIP slopes of every field.
+
+        Args:
+            keys (array): Group key of each point.
+            x (array): Interpolation coordinate of each point.
+            *fields (array): Values to interpolate at each point (e.g. Q11, efficiency).
+
+        Raises:
+            ValueError: If a group has fewer than two points or repeated x values.
+        """
+        keys = np.asarray(keys, dtype=float).ravel()
+        x = np.asarray(x, dtype=float).ravel()
+        fields = np.array([np.asarray(field, dtype=float).ravel() for field in fields])
+
+        # Sort by key, then by x within each key
+        order = np.lexsort((x, keys))
+        self.keys, starts, self.counts = np.unique(keys[order], return_index=True, return_counts=True)
+        if np.any(self.counts < 2):
+            raise ValueError(f"At least two points are needed per group, got one for {self.keys[self.counts < 2]}")
+
+        # Padded layout: one row per group, NaN after the last point of a row
+        rows = np.repeat(np.arange(len(self.keys)), self.counts)
+        columns = np.arange(len(order)) - np.repeat(starts, self.counts)
+        shape = (len(self.keys), self.counts.max())
+        self.x = np.full(shape, np.nan)
+        self.x[rows, columns] = x[order]
+        self.y = np.full((len(fields),) + shape, np.nan)
+        self.y[:, rows, columns] = fields[:, order]
+
+        h = np.diff(self.x, axis=-1)
+        if np.any(h[~np.isnan(h)] <= 0):
+            raise ValueError("x values must be unique within each group")
+        self.slopes = self.compute_slopes(h, np.diff(self.y, axis=-1) / h)
+
+    def compute_slopes(self, h, m):
+        """
+        Compute the PCHIP derivatives at every point.
+
+        Args:
+            h (array): Interval widths, (groups, points - 1).
+            m (array): Secant slopes, (fields, groups, points - 1).
+
+        Returns:
+            np.ndarray: Derivatives, (fields, groups, points).
+        """
+        slopes = np.zeros(self.y.shape)
+
+        # Interior points: weighted harmonic mean of the neighbouring secants, zero at extrema
+        with np.errstate(divide='ignore', invalid='ignore'):
+            w1 = 2 * h[:, 1:] + h[:, :-1]
+            w2 = h[:, 1:] + 2 * h[:, :-1]
+            harmonic_mean = (w1 / m[..., :-1] + w2 / m[..., 1:]) / (w1 + w2)
+            flat = (np.sign(m[..., 1:]) != np.sign(m[..., :-1])) | (m[..., 1:] == 0) | (m[..., :-1] == 0)
+            slopes[..., 1:-1] = np.where(flat, 0.0, 1.0 / harmonic_mean)
+
+        # End points: three-point formula, or the secant for two-point groups
+        groups = np.arange(len(self.keys))
+        last = self.counts - 1
+        before_last = np.maximum(self.counts - 3, 0)
+        h_first, h_second = h[:, 0], h[:, min(1, h.shape[1] - 1)]
+        h_last, h_before_last = h[groups, last - 1], h[groups, before_last]
+        m_first, m_second = m[..., 0], m[..., min(1, h.shape[1] - 1)]
+        m_last, m_before_last = m[:, groups, last - 1], m[:, groups, before_last]
+
+        two_points = self.counts == 2
+        with np.errstate(invalid='ignore'):
+            slopes[..., 0] = np.where(two_points, m_first, edge_slopes(h_first, h_second, m_first, m_second))
+            slopes[:, groups, last] = np.where(two_points, m_last, edge_slopes(h_last, h_before_last, m_last, m_before_last))
+        return slopes
+
+    def __call__(self, x_new):
+        """
+        Evaluate every group at the same coordinates.
+
+        Args:
+            x_new (array): 1D coordinates to evaluate.
+
+        Returns:
+            np.ndarray: Values, (fields, groups, len(x_new)).
+        """
+        x_new = np.asarray(x_new, dtype=float).ravel()
+
+        # Interval of each coordinate in each group, end intervals extended outwards
+        with np.errstate(invalid='ignore'):
+            below = (self.x[:, None, :] <= x_new[None, :, None]).sum(axis=-1)
+        interval = np.clip(below - 1, 0, (self.counts - 2)[:, None])
+        rows = np.arange(len(self.keys))[:, None]
+
+        x0, x1 = self.x[rows, interval], self.x[rows, interval + 1]
+        y0, y1 = self.y[:, rows, interval], self.y[:, rows, interval + 1]
+        d0, d1 = self.slopes[:, rows, interval], self.slopes[:, rows, interval + 1]
+
+        # Cubic Hermite polynomial of the interval
+        h = x1 - x0
+        secant = (y1 - y0) / h
+        c1 = (3 * secant - 2 * d0 - d1) / h
+        c0 = (d0 + d1 - 2 * secant) / h**2
+        t = x_new - x0
+        return ((c0 * t + c1) * t + d0) * t + y0
@@ -0,0 +1,187 @@
+import csv
+import os
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+# CSV column header -> TurbineData field, in the order stored in binary sidecars
+HILL_CHART_COLUMNS = {
+    "Blade Angle": "blade_angle",
+    "Q11": "Q11",
+    "n11": "n11",
+    "Efficiency": "efficiency",
+}
+
+
+def read_header(file_path):
+    """
+    Read the column names of a CSV file.
+
+    Args:
+        file_path (str): Path of the CSV file.
+
+    Returns:
+        list: Column names with surrounding spaces removed.
+    """
+    with open(file_path, newline='', encoding='utf-8-sig') as csvfile:
+        header = next(csv.reader(csvfile), [])
+    return [name.strip() for name in header]
+
+
+def sidecar_path(file_path):
+    """Return the path of the binary sidecar of a CSV file."""
+    return f"{file_path}.npy"
+
+
+def read_hill_chart_csv(file_path, use_sidecar=False):
+    """
+    Read the hill chart columns of a CSV file straight into float64 arrays.
+
+    The header is validated once, only the hill chart columns are parsed, and
+    unnamed trailing columns or rows left empty by spreadsheet exports are ignored.
+    With use_sidecar, the columns are also stored in a binary .npy file next to
+    the CSV and memory-mapped on later loads while the CSV is unchanged.
+
+    Args:
+        file_path (str): Path of the CSV file.
+        use_sidecar (bool): Read from / write to the binary sidecar.
+
+    Returns:
+        dict: {TurbineData field: 1D float64 array} for the columns of HILL_CHART_COLUMNS.
+
+    Raises:
+        ValueError: If a column is missing, a value is not numeric or a row is incomplete.
+    """
+    if use_sidecar:
+        columns = load_sidecar(file_path)
+        if columns is not None:
+            return columns
+
+    header = read_header(file_path)
+    missing = [name for name in HILL_CHART_COLUMNS if name not in header]
+    if missing:
+        raise ValueError(f"Missing column(s) {', '.join(missing)} in '{file_path}'. Found: {', '.join(name for name in header if name)}")
+    positions = [header.index(name) for name in HILL_CHART_COLUMNS]
+
+    frame = pd.read_csv(file_path, header=None, skiprows=1, usecols=positions, dtype=np.float64,
+                        encoding='utf-8-sig', skipinitialspace=True)
+    values = frame[positions].to_numpy(dtype=np.float64)
+
+    # Drop rows that are empty in every hill chart column, reject partially filled ones
+    empty_rows = np.isnan(values).all(axis=1)
+    values = values[~empty_rows]
+    incomplete_rows = np.flatnonzero(np.isnan(values).any(axis=1))
+    if incomplete_rows.size:
+        line_numbers = np.flatnonzero(~empty_rows)[incomplete_rows] + 2
+        raise ValueError(f"Missing values in '{file_path}' on line(s) {', '.join(map(str, line_numbers[:10]))}")
+
+    stacked = np.ascontiguousarray(values.T)
+    if use_sidecar:
+        save_sidecar(file_path, stacked)
+    return dict(zip(HILL_CHART_COLUMNS.values(), stacked))
+
+
+def load_sidecar(file_path):
+    """
+    Memory-map the binary sidecar of a CSV file if it is newer than the CSV.
+
+    Args:
+        file_path (str): Path of the CSV file.
+
+    Returns:
+        dict: {TurbineData field: 1D float64 array}, or None if there is no valid sidecar.
+    """
+    path = sidecar_path(file_path)
+    try:
+        if os.stat(path).st_mtime_ns < os.stat(file_path).st_mtime_ns:
+            return None
+        stacked = np.load(path, mmap_mode='c')
+    except (OSError, ValueError):
+        return None
+    if stacked.ndim != 2 or stacked.shape[0] != len(HILL_CHART_COLUMNS):
+        return None
+    return dict(zip(HILL_CHART_COLUMNS.values(), np.asarray(stacked)))
+
+
+def save_sidecar(file_path, stacked):
+    """
+    Write the binary sidecar of a CSV file, replacing any previous one atomically.
+
+    Args:
+        file_path (str): Path of the CSV file.
+        stacked (array): Columns of HILL_CHART_COLUMNS stacked into a 2D array.
+
+    Returns:
+        bool: True if the sidecar was written.
+    """
+    try:
+        file_descriptor, temp_path = tempfile.mkstemp(suffix='.npy', dir=os.path.dirname(os.path.abspath(file_path)))
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                np.save(file, stacked)
+            os.replace(temp_path, sidecar_path(file_path))
+        except OSError:
+            os.remove(temp_path)
+            raise
+    except OSError:
+        return False
+    return True
+
+
+class DatasetRegistry:
+    """
+    Parsed hill chart CSV files, kept in memory while the files are unchanged on disk.
+
+    Entries are keyed by absolute path and validated against the file's
+    modification time and size, so a file is only parsed again after it changes.
+    """
+
+    def __init__(self):
+        self.datasets = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def signature(file_path):
+        """Return the (mtime, size) signature of a file."""
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self, file_path, use_sidecar=False):
+        """
+        Return the hill chart columns of a CSV file, parsing it only if it changed.
+
+        Args:
+            file_path (str): Path of the CSV file.
+            use_sidecar (bool): Passed to read_hill_chart_csv() when the file is parsed.
+
+        Returns:
+            dict: {TurbineData field: read-only 1D float64 array}, shared between callers.
+        """
+        path = os.path.abspath(file_path)
+        signature = self.signature(path)
+        with self.lock:
+            entry = self.datasets.get(path)
+        if entry is not None and entry[0] == signature:
+            return dict(entry[1])
+
+        columns = read_hill_chart_csv(path, use_sidecar=use_sidecar)
+        for values in columns.values():
+            values.flags.writeable = False
+        with self.lock:
+            self.datasets[path] = (signature, columns)
+        return dict(columns)
+
+    def clear(self, file_path=None):
+        """Forget one file, or every file if none is given."""
+        with self.lock:
+            if file_path is None:
+                self.datasets.clear()
+            else:
+                self.datasets.pop(os.path.abspath(file_path), None)
+
+
+# Registry shared by all hill charts of the process
+dataset_registry = DatasetRegistry()
@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from turbine_data import TurbineData
+
+
+@dataclass
+class HillSurface:
+    """
+    Compact, picklable snapshot of a fitted hill chart surface.
+
+    Holds only the fitted n11/Q11 grids with their efficiency and blade angle
+    fields plus the BEP data, which is all a worker process needs to evaluate
+    operating points without receiving a whole simulator.
+    """
+    n11: np.ndarray
+    Q11: np.ndarray
+    efficiency: np.ndarray
+    blade_angle: np.ndarray
+    BEP_data: TurbineData
+
+    @classmethod
+    def from_data(cls, data, BEP_data):
+        """
+        Create a snapshot from fitted hill chart data.
+
+        Args:
+            data (TurbineData): Fitted hill chart data (2D n11, Q11, efficiency and blade angle grids).
+            BEP_data (TurbineData): Best efficiency point data.
+
+        Returns:
+            HillSurface: The snapshot.
+        """
+        return cls(
+            n11=np.ascontiguousarray(data.n11, dtype=float),
+            Q11=np.ascontiguousarray(data.Q11, dtype=float),
+            efficiency=np.ascontiguousarray(data.efficiency, dtype=float),
+            blade_angle=np.ascontiguousarray(data.blade_angle, dtype=float),
+            BEP_data=BEP_data,
+        )
+
+    def to_data(self):
+        """
+        Rebuild the hill chart data of the snapshot.
+
+        Returns:
+            TurbineData: Data holding the fitted grids.
+        """
+        data = TurbineData()
+        data.n11 = self.n11
+        data.Q11 = self.Q11
+        data.efficiency = self.efficiency
+        data.blade_angle = self.blade_angle
+        return data
@@ -1,20 +1,28 @@
-from PyQt6.QtWidgets import (QFileDialog, QMessageBox)
-
-from HillChartProcessor import HillChartProcessor  # Processing logic
-from control_processor import ControlProcessor
-from maximised_output_processor import MaximisedOutputProcessor
 from itertools import product
+import importlib
 
 import os
 
-class MainProcessor():
 
-    def __init__(self):
-        # Initialize the processors
-        self.processor = HillChartProcessor()
-        self.control_processor = ControlProcessor()
-        self.maximised_output_processor = MaximisedOutputProcessor()
+# Processors created on first use, so that matplotlib, scipy and pandas stay off
+# the startup path: attribute -> (module, class)
+LAZY_PROCESSORS = {
+    "processor": ("HillChartProcessor", "HillChartProcessor"),
+    "control_processor": ("control_processor", "ControlProcessor"),
+    "maximised_output_processor": ("maximised_output_processor", "MaximisedOutputProcessor"),
+}
+
+
+class MainProcessor():
 
+    def __init__(self, surface_cache=None):
+        """
+        Args:
+            surface_cache (SurfaceCache, optional): On-disk cache of fitted surfaces, handed to
+                the hill chart and control processors; None always refits.
+        """
+        # The processors (see LAZY_PROCESSORS) are imported and created on first access
+        self.surface_cache = surface_cache
               
         # Initialize simulation state
         self.simulation_initialized = False        
@@ -27,13 +35,31 @@ class MainProcessor():
 
         # Initialise empty BEP data
         self.BEP_data = None
+
+        # Inflow scenario of the control simulation (None uses the Q target)
+        self.flow_scenario = None
         
 
+    def __getattr__(self, name):
+        """Import and create a processor of LAZY_PROCESSORS on first access."""
+        if name not in LAZY_PROCESSORS:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        module_name, class_name = LAZY_PROCESSORS[name]
+        processor = getattr(importlib.import_module(module_name), class_name)()
+        setattr(self, name, processor)
+        if name in ("processor", "control_processor"):
+            processor.surface_cache = self.surface_cache
+        if name != "control_processor" and self.__dict__.get("message_callback"):
+            processor.set_message_callback(self.message_callback)
+        return processor
+
     def set_message_callback(self, callback):
-        """Pass the callback to all processors."""
+        """Pass the callback to all processors (created ones now, the others when they are created)."""
         self.message_callback = callback
-        self.maximised_output_processor.set_message_callback(callback)
-        self.processor.set_message_callback(callback)
+        for name in ("maximised_output_processor", "processor"):
+            if name in self.__dict__:
+                self.__dict__[name].set_message_callback(callback)
 
 
     def emit_message(self, message):
@@ -191,6 +217,7 @@ class MainProcessor():
             if not self.simulation_initialized:
                 # Initialize the simulation with BEP data
                 self.control_processor.initialize_simulation(self.hill_values.data, self.BEP_data)
+                self.control_processor.set_flow_scenario(self.flow_scenario)
 
                 # Initialize the plots
                 fig, axs = self.control_processor.initialize_plot()
@@ -203,38 +230,49 @@ class MainProcessor():
             self.emit_message(f"Error during simulation initialization: {str(e)}")
             raise
 
+    def set_flow_scenario(self, flow_scenario):
+        """
+        Set the inflow scenario of the control simulation; it is kept across simulation resets.
+
+        Args:
+            flow_scenario (FlowScenario): Inflow over time, or None to use the Q target.
+        """
+        self.flow_scenario = flow_scenario
+        if "control_processor" in self.__dict__:
+            self.control_processor.set_flow_scenario(flow_scenario)
+
+    def start_simulation(self, control_parameters):
+        """
+        Run the simulation in the background, or pass new targets to the running one.
+
+        Args:
+            control_parameters (dict): Parameters for the simulation.
+        """
+        self.control_processor.start_simulation(control_parameters)
+
     def stop_simulation(self):
         """Stop the simulation through the control processor."""
         self.control_processor.stop_simulation()
 
-    def reset_simulation(self):
-        # Initialize simulation state
-        self.control_processor = ControlProcessor()
-        self.simulation_initialized = False        
-        self.control_processor.continue_simulation = False        
-
-    def run_simulation(self, control_parameters, axs, log_callback=None):
+    def refresh_simulation(self, axs, log_callback=None):
         """
-        Run the simulation loop with live plot updates.
+        Show the latest state of the background simulation.
+
         Args:
-            control_parameters (dict): Parameters for the simulation.
-            axs: Plot axes for updating live plots.
+            axs: Plot axes for the live plots.
             log_callback (callable, optional): Callback for logging status messages.
+
+        Returns:
+            dict: The snapshot shown, or None if nothing new was published.
         """
-        try:
-            
-            self.control_processor.run_simulation(
-                control_parameters,                
-                axs=axs,  # Pass the plot axes for updates
-                log_callback=log_callback
-            )
-            self.emit_message("Stopped. Press Start to Continue")
-        except RuntimeError as e:
-            self.emit_message(f"Error during simulation: {str(e)}")
-            raise
-    
-    
+        return self.control_processor.refresh_from_snapshot(axs, log_callback=log_callback)
 
+    def reset_simulation(self):
+        # Initialize simulation state with a new control processor (created on next access)
+        if "control_processor" in self.__dict__:
+            self.control_processor.stop_simulation()
+        self.__dict__.pop("control_processor", None)
+        self.simulation_initialized = False        
 
     """
     Development mode methods start here
@@ -0,0 +1,237 @@
+import numpy as np
+
+
+# Crossed cell edges for each marching-squares case.
+# Corner bits: 1 - bottom-left, 2 - bottom-right, 4 - top-right, 8 - top-left.
+# Edge codes: 0 - bottom, 1 - right, 2 - top, 3 - left,
+#             4 - bottom-left/top-right diagonal, 5 - bottom-right/top-left diagonal.
+CASE_SEGMENTS = {
+    1: [(3, 0)], 14: [(3, 0)],
+    2: [(0, 1)], 13: [(0, 1)],
+    3: [(3, 1)], 12: [(3, 1)],
+    4: [(1, 2)], 11: [(1, 2)],
+    6: [(0, 2)], 9: [(0, 2)],
+    7: [(3, 2)], 8: [(3, 2)],
+}
+
+# Saddle cases, resolved with the average of the four corner values
+SADDLE_SEGMENTS = {
+    # (case, centre above level): segments
+    (5, True): [(3, 2), (0, 1)],
+    (5, False): [(3, 0), (1, 2)],
+    (10, True): [(3, 0), (1, 2)],
+    (10, False): [(0, 1), (3, 2)],
+}
+
+# Cells with a single non-finite corner are contoured on the triangle of the
+# other three corners, like matplotlib's default corner_mask=True.
+# Missing corner bit: [((corner, corner), edge code)] for the three triangle sides
+TRIANGLE_SIDES = {
+    1: [((2, 4), 1), ((4, 8), 2), ((8, 2), 5)],
+    2: [((4, 8), 2), ((8, 1), 3), ((1, 4), 4)],
+    4: [((8, 1), 3), ((1, 2), 0), ((2, 8), 5)],
+    8: [((1, 2), 0), ((2, 4), 1), ((4, 1), 4)],
+}
+
+
+def find_iso_lines(x, y, z, levels):
+    """
+    Extract iso-lines of a gridded field with the marching squares algorithm.
+
+    All levels are processed in a single vectorized pass over the grid; only the
+    final joining of cell segments into polylines is done per level. Non-finite
+    values are treated like masked data in matplotlib's contour: cells with one
+    missing corner are contoured on the remaining triangle, others are skipped.
+
+    Args:
+        x (array): 2D grid of x coordinates (or 1D axis of length z.shape[1]).
+        y (array): 2D grid of y coordinates (or 1D axis of length z.shape[0]).
+        z (array): 2D grid of values to contour.
+        levels (array-like): Iso-values to extract.
+
+    Returns:
+        dict: {level: list of (N, 2) vertex arrays}, one array per connected line.
+    """
+    z = np.asarray(z, dtype=float)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.ndim == 1 and y.ndim == 1:
+        x, y = np.meshgrid(x, y)
+    if z.ndim != 2 or x.shape != z.shape or y.shape != z.shape:
+        raise ValueError("x, y and z must describe the same 2D grid.")
+
+    levels = np.atleast_1d(np.asarray(levels, dtype=float))
+    lines = {level: [] for level in levels.tolist()}
+    ny, nx = z.shape
+    n_levels = len(levels)
+    if ny < 2 or nx < 2 or n_levels == 0:
+        return lines
+
+    finite = np.isfinite(z) & np.isfinite(x) & np.isfinite(y)
+    L = levels[:, None, None]
+    above = np.where(finite, z, -np.inf)[None, :, :] >= L
+
+    # Grid point pairs for horizontal edges, vertical edges and both cell diagonals
+    edge_ends = [
+        ((slice(None), slice(None, -1)), (slice(None), slice(1, None))),
+        ((slice(None, -1), slice(None)), (slice(1, None), slice(None))),
+        ((slice(None, -1), slice(None, -1)), (slice(1, None), slice(1, None))),
+        ((slice(None, -1), slice(1, None)), (slice(1, None), slice(None, -1))),
+    ]
+
+    # Linearly interpolated crossing point on every edge, at every level
+    vertices_x, vertices_y = [], []
+    for start, end in edge_ends:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = (L - z[start][None]) / (z[end][None] - z[start][None])
+        t = np.nan_to_num(t, nan=0.5, posinf=0.5, neginf=0.5)
+        vertices_x.append((x[start][None] + t * (x[end][None] - x[start][None])).reshape(n_levels, -1))
+        vertices_y.append((y[start][None] + t * (y[end][None] - y[start][None])).reshape(n_levels, -1))
+    vertices_x = np.concatenate(vertices_x, axis=1)
+    vertices_y = np.concatenate(vertices_y, axis=1)
+
+    # Marching-squares case of every cell at every level
+    corner_slices = {
+        1: (slice(None, -1), slice(None, -1)),
+        2: (slice(None, -1), slice(1, None)),
+        4: (slice(1, None), slice(1, None)),
+        8: (slice(1, None), slice(None, -1)),
+    }
+    corner_above = {bit: above[(slice(None),) + corner] for bit, corner in corner_slices.items()}
+    corner_finite = {bit: finite[corner] for bit, corner in corner_slices.items()}
+    case = sum(corner_above[bit].astype(np.uint8) * np.uint8(bit) for bit in corner_slices)
+    n_finite = sum(corner_finite[bit].astype(np.uint8) for bit in corner_slices)
+    case = np.where(n_finite[None, :, :] == 4, case, 0)
+
+    with np.errstate(invalid='ignore'):
+        centre = 0.25 * (z[:-1, :-1] + z[:-1, 1:] + z[1:, 1:] + z[1:, :-1])
+    centre_above = centre[None, :, :] >= L
+
+    # Vertex ids of every cell edge, indexed by edge code
+    n_h = ny * (nx - 1)
+    n_v = (ny - 1) * nx
+    n_cells = (ny - 1) * (nx - 1)
+    j, i = np.mgrid[0:ny - 1, 0:nx - 1]
+    cell = j * (nx - 1) + i
+    cell_edges = np.stack([
+        j * (nx - 1) + i,              # bottom
+        n_h + j * nx + i + 1,          # right
+        (j + 1) * (nx - 1) + i,        # top
+        n_h + j * nx + i,              # left
+        n_h + n_v + cell,              # bottom-left to top-right diagonal
+        n_h + n_v + n_cells + cell,    # bottom-right to top-left diagonal
+    ])
+
+    # Only cells crossed by some level or holding a corner-masked triangle need work
+    in_triangle_cell = n_finite == 3
+    candidates = ((case != 0) & (case != 15)) | in_triangle_cell[None, :, :]
+    level_index, row, col = np.nonzero(candidates)
+    case = case[level_index, row, col]
+    centre_above = centre_above[level_index, row, col]
+    in_triangle_cell = in_triangle_cell[row, col]
+    corner_above = {bit: flags[level_index, row, col] for bit, flags in corner_above.items()}
+    corner_finite = {bit: flags[row, col] for bit, flags in corner_finite.items()}
+
+    segment_level, segment_start, segment_end = [], [], []
+
+    def add_segments(mask, segments):
+        for edge_a, edge_b in segments:
+            segment_level.append(level_index[mask])
+            segment_start.append(cell_edges[edge_a, row[mask], col[mask]])
+            segment_end.append(cell_edges[edge_b, row[mask], col[mask]])
+
+    for case_index, segments in CASE_SEGMENTS.items():
+        add_segments(case == case_index, segments)
+    for (case_index, centre_is_above), segments in SADDLE_SEGMENTS.items():
+        add_segments((case == case_index) & (centre_above == centre_is_above), segments)
+
+    # Triangles left in cells with exactly one missing corner
+    for missing_bit, sides in TRIANGLE_SIDES.items():
+        in_triangle = in_triangle_cell & ~corner_finite[missing_bit]
+        crossed = [corner_above[a] != corner_above[b] for (a, b), _ in sides]
+        for first, second in ((0, 1), (1, 2), (2, 0)):
+            add_segments(in_triangle & crossed[first] & crossed[second],
+                         [(sides[first][1], sides[second][1])])
+
+    segment_level = np.concatenate(segment_level)
+    segment_start = np.concatenate(segment_start)
+    segment_end = np.concatenate(segment_end)
+
+    for level_index, level in enumerate(levels.tolist()):
+        in_level = segment_level == level_index
+        if not in_level.any():
+            continue
+        chains = join_segments(segment_start[in_level], segment_end[in_level])
+        for chain in chains:
+            line = np.column_stack((vertices_x[level_index, chain], vertices_y[level_index, chain]))
+            lines[level].append(orient_line(line))
+
+        lines[level].sort(key=lambda line: line[0, 0])
+
+    return lines
+
+
+def join_segments(start, end):
+    """
+    Join cell segments that share an edge into chains of edge ids.
+
+    Args:
+        start (array): First edge id of each segment.
+        end (array): Second edge id of each segment.
+
+    Returns:
+        list: One array of edge ids per connected chain.
+    """
+    n_segments = len(start)
+    endpoints = np.concatenate([start, end])
+    owners = np.concatenate([np.arange(n_segments), np.arange(n_segments)])
+
+    # Every edge is shared by at most two segments
+    neighbours = {}
+    for edge, owner in zip(endpoints.tolist(), owners.tolist()):
+        neighbours.setdefault(edge, []).append(owner)
+
+    start = start.tolist()
+    end = end.tolist()
+    used = [False] * n_segments
+
+    def walk(segment, edge):
+        # Follow the chain from `segment`, entering it through `edge`
+        chain = [edge]
+        while segment is not None and not used[segment]:
+            used[segment] = True
+            edge = end[segment] if start[segment] == edge else start[segment]
+            chain.append(edge)
+            segment = next((s for s in neighbours[edge] if not used[s]), None)
+        return chain
+
+    chains = []
+    # Open lines start at an edge used by a single segment (grid or NaN boundary)
+    for edge, owners_of_edge in neighbours.items():
+        if len(owners_of_edge) == 1 and not used[owners_of_edge[0]]:
+            chains.append(walk(owners_of_edge[0], edge))
+
+    # Whatever is left forms closed loops
+    for segment in range(n_segments):
+        if not used[segment]:
+            chains.append(walk(segment, start[segment]))
+
+    return [np.asarray(chain) for chain in chains]
+
+
+def orient_line(line):
+    """
+    Drop repeated vertices and orient a polyline so that x increases along it.
+
+    Args:
+        line (array): (N, 2) array of vertices.
+
+    Returns:
+        array: The cleaned, oriented vertices.
+    """
+    if len(line) > 1:
+        repeated = np.all(np.diff(line, axis=0) == 0, axis=1)
+        line = line[np.concatenate(([True], ~repeated))]
+    if line[-1, 0] < line[0, 0]:
+        line = line[::-1]
+    return line
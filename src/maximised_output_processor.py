@@ -19,7 +19,9 @@ class MaximisedOutputProcessor:
         n_step=1,
         blade_start=16.2,
         blade_stop=16.2,
-        blade_step=1
+        blade_step=1,
+        parallel=False,
+        max_workers=None
     ):
         """
         Initialize the processor with configurable ranges for simulation.
@@ -29,6 +31,10 @@ class MaximisedOutputProcessor:
             H_min, H_max (float): Minimum and maximum head values.
             n_start, n_stop, n_step (int): Range and step size for speed.
             blade_start, blade_stop, blade_step (float): Range and step size for blade angles.
+            parallel (bool): Run the maximisation in a pool of worker processes. Off by default:
+                starting the pool costs seconds, so it only pays off for large sweeps on
+                several cores (see ControlSimulator.maximize_output_in_parallel).
+            max_workers (int, optional): Number of worker processes (defaults to the CPU count).
         """
         self.simulator = ControlSimulator()
         self.Q_start = Q_start
@@ -42,6 +48,8 @@ class MaximisedOutputProcessor:
         self.blade_start = blade_start
         self.blade_stop = blade_stop
         self.blade_step = blade_step
+        self.parallel = parallel
+        self.max_workers = max_workers
 
         self.simulator.set_message_callback(self.emit_message)
 
@@ -149,7 +157,7 @@ class MaximisedOutputProcessor:
         Returns:
             max_power_results (list): The results of the maximization process.
         """
-        max_power_results = self.simulator.maximize_output_in_flow_range()
+        max_power_results = self.simulator.maximize_output_in_flow_range(parallel=self.parallel, max_workers=self.max_workers)
         return max_power_results
 
     def maximised_output(self, hill_data, BEP_data, ranges=None):
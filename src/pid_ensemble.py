@@ -0,0 +1,281 @@
+import itertools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+
+from control_processor import ControlProcessor, DEFAULT_CONTROL_SETTINGS
+
+
+# PID parameters varied by an ensemble, overriding the same keys of DEFAULT_CONTROL_SETTINGS
+PID_PARAMETERS = ("Kp", "Ki", "Kd", "H_tolerance")
+
+# Performance metrics of a run: (column, description)
+PERFORMANCE_METRICS = (
+    ("IAE", "Integral of the absolute head error [m·s]"),
+    ("energy", "Energy produced [kWh]"),
+    ("blade_angle_travel", "Total blade angle movement [°]"),
+    ("n_travel", "Total rotational speed change [rpm]"),
+)
+
+# Pool worker state, built once per process from the shared hill surface
+ensemble_worker_processor = None
+ensemble_worker_scenarios = None
+
+
+def create_ensemble_processor(surface, refresh_rate_physical=1):
+    """
+    Create a ControlProcessor loaded with a hill surface, for headless runs.
+
+    Args:
+        surface (HillSurface): Snapshot of the fitted hill chart surface.
+        refresh_rate_physical (float): Time step of the simulation (s).
+
+    Returns:
+        ControlProcessor: Processor ready for restart_simulation() and simulate().
+    """
+    processor = ControlProcessor(refresh_rate_physical=refresh_rate_physical, max_duration=refresh_rate_physical)
+    processor.simulator.process_gui_events = False
+    processor.simulator.set_message_callback(lambda message, overwrite=False: None)
+    processor.initialize_simulation(surface.to_data(), surface.BEP_data)
+    return processor
+
+
+def initialize_ensemble_worker(surface, flow_scenarios, refresh_rate_physical):
+    """
+    Build the processor of a pool worker process.
+
+    Args:
+        surface (HillSurface): Snapshot of the fitted hill chart surface.
+        flow_scenarios (list): FlowScenario of each scenario index.
+        refresh_rate_physical (float): Time step of the simulation (s).
+    """
+    global ensemble_worker_processor, ensemble_worker_scenarios
+    ensemble_worker_processor = create_ensemble_processor(surface, refresh_rate_physical)
+    ensemble_worker_scenarios = flow_scenarios
+
+
+def ensemble_member_task(settings, scenario_index, control_parameters, duration):
+    """
+    Simulate one parameter set with one flow scenario in a pool worker.
+
+    Returns:
+        dict: Performance metrics, see simulate_member.
+    """
+    return simulate_member(ensemble_worker_processor, ensemble_worker_scenarios[scenario_index],
+                           settings, control_parameters, duration)
+
+
+def simulate_member(processor, flow_scenario, settings, control_parameters, duration):
+    """
+    Run one ensemble member from the start of the simulation with a fresh controller.
+
+    Args:
+        processor (ControlProcessor): Processor loaded with the hill surface.
+        flow_scenario (FlowScenario): Inflow of the run, or None to use the Q target.
+        settings (dict): Controller settings, including the PID parameters.
+        control_parameters (dict): Targets and rates, as for ControlProcessor.simulate.
+        duration (float): Simulated time (s).
+
+    Returns:
+        dict: Value of each metric of PERFORMANCE_METRICS, and 'error' (None, or the message
+        of a failed run, whose metrics are NaN).
+    """
+    processor.update_control_settings(settings)
+    processor.reset_controller()
+    processor.set_flow_scenario(flow_scenario)
+    processor.restart_simulation()
+    try:
+        results = processor.simulate(duration, control_parameters)
+    except (ValueError, RuntimeError) as e:
+        # E.g. the controller drove the blade angle outside of the hill chart data
+        metrics = dict.fromkeys((name for name, _ in PERFORMANCE_METRICS), np.nan)
+        metrics["error"] = str(e)
+        return metrics
+
+    metrics = performance_metrics(results, control_parameters["H_t"], processor.refresh_rate_physical)
+    metrics["error"] = None
+    return metrics
+
+
+def performance_metrics(results, H_t, time_step):
+    """
+    Compute the performance metrics of a simulated time series.
+
+    Args:
+        results (dict): Time series returned by ControlProcessor.simulate.
+        H_t (float): Target head (m).
+        time_step (float): Time step of the series (s).
+
+    Returns:
+        dict: Value of each metric of PERFORMANCE_METRICS.
+    """
+    return {
+        "IAE": np.abs(results["H"] - H_t).sum() * time_step,
+        "energy": results["power"].sum() * time_step / 3.6e6,
+        "blade_angle_travel": np.abs(np.diff(results["blade_angle"])).sum(),
+        "n_travel": np.abs(np.diff(results["n"])).sum(),
+    }
+
+
+def pid_parameter_grid(Kp, Ki, Kd, H_tolerance):
+    """
+    Every combination of the given PID parameter values.
+
+    Args:
+        Kp, Ki, Kd, H_tolerance (list): Values of each parameter.
+
+    Returns:
+        list: One {parameter: value} dict per combination.
+    """
+    return [dict(zip(PID_PARAMETERS, values)) for values in itertools.product(Kp, Ki, Kd, H_tolerance)]
+
+
+def pid_parameter_sample(ranges, count, seed=None):
+    """
+    Random PID parameter sets, uniformly distributed within ranges.
+
+    Args:
+        ranges (dict): (min, max) of each parameter of PID_PARAMETERS.
+        count (int): Number of parameter sets.
+        seed (int, optional): Seed of the random generator.
+
+    Returns:
+        list: One {parameter: value} dict per parameter set.
+    """
+    rng = np.random.default_rng(seed)
+    samples = {name: rng.uniform(*ranges[name], size=count) for name in PID_PARAMETERS}
+    return [{name: float(samples[name][index]) for name in PID_PARAMETERS} for index in range(count)]
+
+
+class PIDEnsemble:
+    """
+    Monte Carlo ensemble of control simulations for PID tuning.
+
+    Every PID parameter set is simulated with every flow scenario by the headless
+    ControlProcessor.simulate, in a pool of worker processes. Each worker receives the
+    hill surface and the scenarios once, when it starts, and reuses one processor (and
+    its slice cache) for all of its runs.
+    """
+
+    def __init__(self, surface, control_parameters, flow_scenarios, duration=14400, refresh_rate_physical=1, settings=None):
+        """
+        Args:
+            surface (HillSurface): Snapshot of the fitted hill chart surface, e.g. from
+                ControlSimulator.surface_snapshot().
+            control_parameters (dict): Targets and rates of every run, as for ControlProcessor.simulate.
+            flow_scenarios (list): FlowScenario of each scenario (None entries use the Q target).
+            duration (float): Simulated time of each run (s).
+            refresh_rate_physical (float): Time step of the simulation (s).
+            settings (dict, optional): Controller settings that the PID parameters override.
+                Defaults to DEFAULT_CONTROL_SETTINGS.
+        """
+        self.surface = surface
+        self.control_parameters = dict(control_parameters)
+        self.flow_scenarios = list(flow_scenarios)
+        self.duration = duration
+        self.refresh_rate_physical = refresh_rate_physical
+        self.settings = dict(settings) if settings else None
+        self.progress_callback = None
+
+    def set_progress_callback(self, callback):
+        """
+        Set a callback for progress of the runs.
+
+        Args:
+            callback (callable): Called with (completed, total) after each run.
+        """
+        self.progress_callback = callback
+
+    def run(self, pid_parameters, max_workers=None):
+        """
+        Simulate every parameter set with every flow scenario.
+
+        Args:
+            pid_parameters (list): {parameter: value} dicts, e.g. from pid_parameter_grid
+                or pid_parameter_sample.
+            max_workers (int, optional): Number of worker processes. Defaults to the CPU
+                count; 1 runs the ensemble in this process.
+
+        Returns:
+            pd.DataFrame: One row per run, with the PID parameters, the scenario index,
+            the metrics of PERFORMANCE_METRICS and the error of failed runs.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        settings = self.settings or DEFAULT_CONTROL_SETTINGS
+        members = [(dict(settings, **parameters), scenario_index)
+                   for parameters in pid_parameters for scenario_index in range(len(self.flow_scenarios))]
+        total = len(members)
+
+        if max_workers == 1:
+            processor = create_ensemble_processor(self.surface, self.refresh_rate_physical)
+            metrics = []
+            for completed, (member_settings, scenario_index) in enumerate(members, start=1):
+                metrics.append(simulate_member(processor, self.flow_scenarios[scenario_index], member_settings,
+                                               self.control_parameters, self.duration))
+                if self.progress_callback:
+                    self.progress_callback(completed, total)
+        else:
+            metrics = self.run_in_parallel(members, max_workers)
+
+        rows = [dict({name: member_settings[name] for name in PID_PARAMETERS}, scenario=scenario_index, **member_metrics)
+                for (member_settings, scenario_index), member_metrics in zip(members, metrics)]
+        return pd.DataFrame(rows, columns=list(PID_PARAMETERS) + ["scenario"]
+                            + [name for name, _ in PERFORMANCE_METRICS] + ["error"])
+
+    def run_in_parallel(self, members, max_workers):
+        """
+        Simulate the members in a pool of worker processes.
+
+        Args:
+            members (list): (settings, scenario index) of each run.
+            max_workers (int): Number of worker processes.
+
+        Returns:
+            list: Metrics of each member, in order.
+        """
+        total = len(members)
+        completed = 0
+        lock = threading.Lock()
+
+        def report_progress(future):
+            # Runs on the executor's helper thread
+            nonlocal completed
+            with lock:
+                completed += 1
+                if self.progress_callback:
+                    self.progress_callback(completed, total)
+
+        # Spawned workers avoid forking a process that holds Qt and plotting state
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=initialize_ensemble_worker,
+                                 initargs=(self.surface, self.flow_scenarios, self.refresh_rate_physical)) as executor:
+            futures = [executor.submit(ensemble_member_task, member_settings, scenario_index,
+                                       self.control_parameters, self.duration)
+                       for member_settings, scenario_index in members]
+            for future in futures:
+                future.add_done_callback(report_progress)
+            wait(futures)
+
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def summarize(results):
+        """
+        Average the metrics of each parameter set over the flow scenarios.
+
+        Args:
+            results (pd.DataFrame): Runs returned by run().
+
+        Returns:
+            pd.DataFrame: One row per parameter set with the mean metrics and the number
+            of failed runs, best (lowest) IAE first.
+        """
+        grouped = results.groupby(list(PID_PARAMETERS), sort=False)
+        summary = grouped[[name for name, _ in PERFORMANCE_METRICS]].mean()
+        summary["failed_runs"] = grouped["error"].count()
+        return summary.sort_values("IAE").reset_index()
@@ -0,0 +1,75 @@
+import numpy as np
+
+
+class PlotEnvelope:
+    """
+    Min/max envelope of several series over fixed x bins, e.g. one bin per pixel column of an axes.
+
+    A line drawn through the low and high value of each bin shows every peak of the
+    series, but renders at most two points per bin however many samples it covers.
+    Samples are added in increasing x order, and each call only reduces the new ones.
+    """
+
+    def __init__(self, x_min, x_max, num_bins, num_series):
+        """
+        Allocate empty bins.
+
+        Args:
+            x_min (float): Lower end of the first bin.
+            x_max (float): Upper end of the last bin.
+            num_bins (int): Number of bins.
+            num_series (int): Number of series, one low and high column each.
+        """
+        self.x_min = float(x_min)
+        self.x_max = float(x_max)
+        self.num_bins = max(int(num_bins), 1)
+        self.bin_width = max(self.x_max - self.x_min, 1e-12) / self.num_bins
+        self.centers = self.x_min + (np.arange(self.num_bins) + 0.5) * self.bin_width
+        self.low = np.full((self.num_bins, num_series), np.nan)
+        self.high = np.full((self.num_bins, num_series), np.nan)
+
+    def matches(self, x_min, x_max, num_bins):
+        """Return True if the envelope was built for this x range and number of bins."""
+        return (self.x_min, self.x_max, self.num_bins) == (float(x_min), float(x_max), max(int(num_bins), 1))
+
+    def bin_index(self, x):
+        """Return the bin of each x value; values outside of the range go to the first or last bin."""
+        position = (np.asarray(x, dtype=float) - self.x_min) / self.bin_width
+        return np.clip(np.floor(position), 0, self.num_bins - 1).astype(int)
+
+    def add(self, x, values):
+        """
+        Fold samples into their bins.
+
+        Args:
+            x (array): Increasing x value of each sample.
+            values (array): (samples, series) values; NaN values are ignored.
+        """
+        if len(x) == 0:
+            return
+        bins = self.bin_index(x)
+
+        # x is increasing, so the samples of a bin are consecutive
+        starts = np.flatnonzero(np.diff(bins, prepend=-1))
+        index = bins[starts]
+        self.low[index] = np.fmin(self.low[index], np.fmin.reduceat(values, starts, axis=0))
+        self.high[index] = np.fmax(self.high[index], np.fmax.reduceat(values, starts, axis=0))
+
+    def line(self, series, x_start=None):
+        """
+        Return the points of the envelope of one series.
+
+        Args:
+            series (int): Column of the series.
+            x_start (float, optional): Bins before the bin of this x value are left out,
+                e.g. those of samples already dropped from a history.
+
+        Returns:
+            tuple: (x, y) arrays with the low and high value of each non-empty bin at its center.
+        """
+        first = 0 if x_start is None else int(self.bin_index(x_start))
+        low = self.low[first:, series]
+        filled = ~np.isnan(low)
+        x = np.repeat(self.centers[first:][filled], 2)
+        y = np.column_stack((low[filled], self.high[first:, series][filled])).ravel()
+        return x, y
@@ -5,8 +5,6 @@ from PyQt6.QtWidgets import (
     QPushButton, QSizePolicy 
     )
 
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-
 class PlotManager:
     def __init__(self, tab_widget: QTabWidget):
         """
@@ -51,6 +49,9 @@ class PlotManager:
         Returns:
             FigureCanvas: The canvas object for the embedded plot.
         """
+        # Imported here so matplotlib only loads once there is a figure to show
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+
         canvas = FigureCanvas(fig)
         new_tab = QWidget()
         layout = QVBoxLayout(new_tab)
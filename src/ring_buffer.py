@@ -0,0 +1,90 @@
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Preallocated history of fixed-width rows: one row per sample, one column per channel.
+
+    Every row is written twice, at index % capacity and capacity rows further, so the
+    latest maxlen rows always form one slice of the storage: views for plotting or
+    export are returned without copying, and each channel column is contiguous.
+
+    The buffer is meant for one producer thread (appending) and one consumer thread
+    (viewing) without a lock. A row is published by advancing count only after both
+    copies are written, so views never contain a partly written row. The storage holds
+    headroom rows beyond maxlen, so the rows of a view stay intact while the producer
+    appends up to headroom more rows; consumers that keep data longer should copy it.
+    """
+
+    def __init__(self, columns, maxlen, headroom=None):
+        """
+        Allocate the buffer.
+
+        Args:
+            columns (tuple): Channel names, one per column.
+            maxlen (int): Number of latest rows kept and returned by view().
+            headroom (int, optional): Rows the producer may append before the rows of an
+                earlier view are reused. Defaults to maxlen, at most 4096.
+        """
+        if maxlen < 1:
+            raise ValueError("A ring buffer needs room for at least one row.")
+        self.columns = tuple(columns)
+        self.column_index = {name: index for index, name in enumerate(self.columns)}
+        self.maxlen = int(maxlen)
+        self.headroom = int(min(self.maxlen, 4096) if headroom is None else headroom)
+        self.capacity = self.maxlen + self.headroom
+
+        # Column-major storage, so every channel of a view is a contiguous 1D array
+        self.data = np.full((2 * self.capacity, len(self.columns)), np.nan, order='F')
+        self.count = 0  # Rows appended so far, including those dropped from the buffer
+
+    def __len__(self):
+        return min(self.count, self.maxlen)
+
+    def append(self, row):
+        """
+        Append one row; the oldest row is dropped once the buffer holds maxlen rows.
+
+        Args:
+            row (sequence): One value per column.
+        """
+        count = self.count
+        index = count % self.capacity
+        self.data[index] = row
+        self.data[index + self.capacity] = row
+        self.count = count + 1  # Publish the row
+
+    def view(self, count=None):
+        """
+        Return the latest rows without copying.
+
+        Args:
+            count (int, optional): Value of count to view the buffer at, so that several
+                calls see the same rows. Defaults to the current count.
+
+        Returns:
+            np.ndarray: Read-only (rows, columns) view, oldest row first.
+        """
+        count = self.count if count is None else count
+        length = min(count, self.maxlen)
+        start = (count - length) % self.capacity
+        rows = self.data[start:start + length]
+        rows.flags.writeable = False
+        return rows
+
+    def column(self, name, count=None):
+        """
+        Return the latest values of one channel without copying.
+
+        Args:
+            name (str): Channel name.
+            count (int, optional): Value of count to view the buffer at, see view().
+
+        Returns:
+            np.ndarray: Read-only contiguous 1D view, oldest value first.
+        """
+        return self.view(count)[:, self.column_index[name]]
+
+    def clear(self):
+        """Drop all rows."""
+        self.count = 0
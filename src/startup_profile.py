@@ -0,0 +1,129 @@
+"""
+Startup timing of the Turbine Simulator.
+
+In the application, pass --profile-startup (or set TURBINE_SIMULATOR_PROFILE_STARTUP=1)
+to print a timeline of the startup once the main window is shown.
+
+Run this module to measure the import cost of the startup path with -X importtime:
+
+    python src/startup_profile.py [module] [--budget-ms 500]
+
+It prints the import time per top-level package and exits with status 1 when the
+total exceeds the budget or a deferred module is imported at startup.
+"""
+import argparse
+import collections
+import os
+import re
+import subprocess
+import sys
+import time
+
+
+# Import time budget of the startup path, in milliseconds
+STARTUP_BUDGET_MS = 500
+
+# Heavy modules kept off the startup path; they load with the first processor that needs them
+DEFERRED_MODULES = ("matplotlib", "mpl_toolkits", "scipy", "pandas", "tkinter", "simple_pid")
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)")
+
+
+def profiling_requested(argv=None):
+    """Return True if startup profiling was requested on the command line or in the environment."""
+    argv = sys.argv if argv is None else argv
+    return "--profile-startup" in argv or os.environ.get("TURBINE_SIMULATOR_PROFILE_STARTUP", "") not in ("", "0")
+
+
+def loaded_deferred_modules():
+    """Return the modules of DEFERRED_MODULES that are already imported."""
+    return [name for name in DEFERRED_MODULES if name in sys.modules]
+
+
+class StartupProfile:
+    """Timeline of the application startup, measured from the creation of the profile."""
+
+    def __init__(self, budget_ms=STARTUP_BUDGET_MS):
+        """
+        Start the timeline.
+
+        Args:
+            budget_ms (float): Time budget until the last mark, in milliseconds.
+        """
+        self.budget_ms = budget_ms
+        self.start = time.perf_counter()
+        self.marks = []
+
+    def mark(self, label):
+        """Record the time elapsed until a startup step, e.g. 'main window shown'."""
+        self.marks.append((label, self.elapsed_ms()))
+
+    def elapsed_ms(self):
+        """Return the milliseconds since the start of the timeline."""
+        return (time.perf_counter() - self.start) * 1000
+
+    def report(self):
+        """
+        Format the timeline with the budget check.
+
+        Returns:
+            str: One line per mark, the deferred modules already loaded and the verdict.
+        """
+        lines = ["Startup profile:"]
+        previous = 0.0
+        for label, elapsed in self.marks:
+            lines.append(f"  {elapsed:8.1f} ms  (+{elapsed - previous:7.1f} ms)  {label}")
+            previous = elapsed
+
+        deferred = loaded_deferred_modules()
+        lines.append(f"  Deferred modules loaded: {', '.join(deferred) if deferred else 'none'}")
+
+        total = self.marks[-1][1] if self.marks else self.elapsed_ms()
+        verdict = "within budget" if total <= self.budget_ms else "OVER BUDGET"
+        lines.append(f"  Total {total:.1f} ms, budget {self.budget_ms:.0f} ms: {verdict}")
+        return "\n".join(lines)
+
+
+def measure_imports(module="turbine_simulator_main"):
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Args:
+        module (str): Module to import, looked up next to this file.
+
+    Returns:
+        collections.Counter: Self import time in microseconds per top-level package.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+
+    times = collections.Counter()
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            times[match.group(3).split(".")[0]] += int(match.group(1))
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the import time of the Turbine Simulator startup path.")
+    parser.add_argument("module", nargs="?", default="turbine_simulator_main", help="module to import")
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS, help="import time budget")
+    parser.add_argument("--top", type=int, default=15, help="number of packages listed")
+    args = parser.parse_args(argv)
+
+    times = measure_imports(args.module)
+    total_ms = sum(times.values()) / 1000
+    for package, microseconds in times.most_common(args.top):
+        print(f"{microseconds / 1000:9.1f} ms  {package}")
+
+    deferred = [name for name in DEFERRED_MODULES if name in times]
+    print(f"Total import time of {args.module}: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"Deferred modules imported at startup: {', '.join(deferred) if deferred else 'none'}")
+    return 0 if total_ms <= args.budget_ms and not deferred else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
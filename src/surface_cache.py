@@ -0,0 +1,163 @@
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+
+# Bump when the surface fitting changes so that stale cache entries are ignored
+SURFACE_FIT_VERSION = 1
+
+# Fitted grids stored in a cache entry, in stacking order
+SURFACE_FIELDS = ("n11", "Q11", "efficiency", "blade_angle")
+
+
+def default_cache_dir():
+    """
+    Return the directory used for fitted surface caches.
+
+    The HILL_CHART_CACHE_DIR environment variable overrides the per-user default.
+    """
+    cache_dir = os.environ.get("HILL_CHART_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+    base_dir = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base_dir, "hill_chart_calculator", "surfaces")
+
+
+def file_digest(file_path, chunk_size=1 << 20):
+    """
+    Compute the SHA-256 digest of a file's contents.
+
+    Args:
+        file_path (str): Path of the file.
+        chunk_size (int): Number of bytes read at a time.
+
+    Returns:
+        str: Hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(file_path, **parameters):
+    """
+    Build the cache key of a fitted surface.
+
+    Args:
+        file_path (str): Source CSV file of the hill chart.
+        **parameters: Fit and extrapolation parameters that affect the surface.
+
+    Returns:
+        str: Hexadecimal key, unique to the file contents and parameters.
+    """
+    description = json.dumps(
+        {"version": SURFACE_FIT_VERSION, "source": file_digest(file_path), "parameters": parameters},
+        sort_keys=True, default=float)
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+
+class SurfaceCache:
+    """On-disk cache of fitted hill chart surfaces, stored as memory-mappable .npy files."""
+
+    def __init__(self, cache_dir=None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (str, optional): Directory holding the cache files. Defaults to default_cache_dir().
+        """
+        self.cache_dir = cache_dir or default_cache_dir()
+
+    def path(self, key):
+        """Return the file path of a cache entry."""
+        return os.path.join(self.cache_dir, f"{key}.npy")
+
+    def load(self, key):
+        """
+        Load a fitted surface from the cache.
+
+        The grids are memory-mapped copy-on-write, so nothing is read until used
+        and in-place edits never reach the cache file.
+
+        Args:
+            key (str): Cache key from cache_key().
+
+        Returns:
+            dict: {field: 2D array} for SURFACE_FIELDS, or None if the entry is missing or unreadable.
+        """
+        path = self.path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            stacked = np.load(path, mmap_mode="c")
+        except (OSError, ValueError):
+            self.remove(key)
+            return None
+        if stacked.ndim != 3 or stacked.shape[0] != len(SURFACE_FIELDS):
+            self.remove(key)
+            return None
+        # Plain ndarray views of the mapping, so results of arithmetic are ordinary arrays
+        return dict(zip(SURFACE_FIELDS, np.asarray(stacked)))
+
+    def save(self, key, data):
+        """
+        Store the fitted grids of a hill chart.
+
+        The file is written under a temporary name and renamed into place, so readers
+        never see a partial entry.
+
+        Args:
+            key (str): Cache key from cache_key().
+            data (TurbineData): Data holding the fitted 2D grids.
+
+        Returns:
+            bool: True if the entry was written.
+        """
+        try:
+            stacked = np.stack([np.asarray(getattr(data, field), dtype=float) for field in SURFACE_FIELDS])
+        except ValueError:
+            return False
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(suffix=".npy", dir=self.cache_dir)
+            try:
+                with os.fdopen(file_descriptor, "wb") as file:
+                    np.save(file, stacked)
+                os.replace(temp_path, self.path(key))
+            except OSError:
+                os.remove(temp_path)
+                raise
+        except OSError:
+            return False
+        return True
+
+    def load_into(self, key, data):
+        """
+        Load a cached surface into a TurbineData instance.
+
+        Args:
+            key (str): Cache key from cache_key().
+            data (TurbineData): Data whose fitted grids are replaced on a cache hit.
+
+        Returns:
+            bool: True on a cache hit.
+        """
+        surface = self.load(key)
+        if surface is None:
+            return False
+        for field, grid in surface.items():
+            setattr(data, field, grid)
+        return True
+
+    def remove(self, key):
+        """Delete a cache entry if present."""
+        try:
+            os.remove(self.path(key))
+        except OSError:
+            pass
@@ -0,0 +1,143 @@
+import numpy as np
+from scipy.interpolate import CloughTocher2DInterpolator
+from scipy.spatial import Delaunay
+
+
+# Adaptive grids: weights of the BEP and gradient refinement relative to a uniform
+# spacing, width of the BEP region as a fraction of the axis range, and the largest
+# allowed ratio between the coarsest and finest spacing
+BEP_REFINEMENT = 2.0
+GRADIENT_REFINEMENT = 2.0
+BEP_WIDTH = 0.15
+MAX_SPACING_RATIO = 5.0
+
+
+def adaptive_axis(coordinates, density, num):
+    """
+    Place grid points along an axis with a spacing inversely proportional to a density.
+
+    Args:
+        coordinates (array): Increasing coordinates at which the density is known.
+        density (array): Positive point density at the coordinates.
+        num (int): Number of grid points, including both ends of the axis.
+
+    Returns:
+        np.ndarray: Increasing grid coordinates from coordinates[0] to coordinates[-1].
+    """
+    density = np.clip(density, density.max() / MAX_SPACING_RATIO, None)
+    cumulative = np.concatenate(([0.0], np.cumsum(0.5 * (density[1:] + density[:-1]) * np.diff(coordinates))))
+    return np.interp(np.linspace(0.0, cumulative[-1], num), cumulative, coordinates)
+
+
+class SurfaceFitter:
+    """
+    Fits value fields measured at scattered (x, y) points onto a rectilinear grid.
+
+    The Delaunay triangulation of the points is built once and shared by every
+    fitted field (efficiency, blade angle, power, ...). Each fit is the same
+    piecewise cubic Clough-Tocher interpolation as griddata(..., method='cubic').
+    """
+
+    def __init__(self, x, y, num=101, adaptive=False, values=None):
+        """
+        Triangulate the scattered points and create the grid that covers them.
+
+        Args:
+            x (array): x coordinates of the scattered points (e.g. n11).
+            y (array): y coordinates of the scattered points (e.g. Q11).
+            num (int): Number of grid points along each axis.
+            adaptive (bool): Concentrate the grid lines around the maximum of values and
+                where values change quickly, instead of spacing them uniformly.
+            values (array, optional): Values at the points that guide an adaptive grid (e.g. efficiency).
+        """
+        self.x = np.array(x, dtype=float).ravel()
+        self.y = np.array(y, dtype=float).ravel()
+        self.num = num
+        self.adaptive = adaptive
+        self.values = None  # Values that guided an adaptive grid
+        self.triangulation = Delaunay(np.column_stack((self.x, self.y)))
+
+        # Create grid coordinates for the surface
+        x_grid = np.linspace(self.x.min(), self.x.max(), num=num)
+        y_grid = np.linspace(self.y.min(), self.y.max(), num=num)
+        if adaptive:
+            if values is None:
+                raise ValueError("An adaptive grid needs the values that guide the refinement.")
+            self.values = np.array(values, dtype=float).ravel()
+            x_grid, y_grid = self.refine_axes(x_grid, y_grid, self.values)
+        self.x_grid, self.y_grid = np.meshgrid(x_grid, y_grid)
+
+    def refine_axes(self, x_grid, y_grid, values):
+        """
+        Redistribute the grid lines of both axes towards the BEP and high-gradient regions.
+
+        The values are first fitted on the uniform grid; the point density along each
+        axis then combines a bump around the maximum of the values with the mean
+        gradient magnitude across the other axis. The grid stays rectilinear.
+
+        Args:
+            x_grid (array): Uniform x axis.
+            y_grid (array): Uniform y axis.
+            values (array): Values at the scattered points.
+
+        Returns:
+            tuple: (x_axis, y_axis) of the adaptive grid.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        pilot = CloughTocher2DInterpolator(self.triangulation, values)(*np.meshgrid(x_grid, y_grid))
+
+        # Gradient magnitudes scaled to the axis ranges, so both axes are comparable;
+        # the area outside the data (NaN) gets no refinement
+        x_range, y_range = x_grid[-1] - x_grid[0], y_grid[-1] - y_grid[0]
+        dz_dy, dz_dx = np.gradient(pilot, y_grid, x_grid)
+        x_gradient = np.nan_to_num(np.abs(dz_dx) * x_range).mean(axis=0)
+        y_gradient = np.nan_to_num(np.abs(dz_dy) * y_range).mean(axis=1)
+
+        # Best efficiency point of the scattered data
+        best = np.nanargmax(values)
+        axes = []
+        for axis, gradient, centre, axis_range in ((x_grid, x_gradient, self.x[best], x_range),
+                                                   (y_grid, y_gradient, self.y[best], y_range)):
+            density = 1.0 + BEP_REFINEMENT * np.exp(-0.5 * ((axis - centre) / (BEP_WIDTH * axis_range)) ** 2)
+            if gradient.max() > 0:
+                density += GRADIENT_REFINEMENT * gradient / gradient.max()
+            axes.append(adaptive_axis(axis, density, len(axis)))
+        return tuple(axes)
+
+    def matches(self, x, y, num=101, adaptive=False, values=None):
+        """
+        Return True if the fitter was built for these points and grid options.
+
+        Args:
+            x (array): x coordinates of the scattered points.
+            y (array): y coordinates of the scattered points.
+            num (int): Number of grid points along each axis.
+            adaptive (bool): Adaptive grid.
+            values (array, optional): Values guiding an adaptive grid; if given, an adaptive
+                fitter only matches if it was refined from the same values.
+
+        Returns:
+            bool: True if the fitter can be reused.
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if not (self.num == num and self.adaptive == adaptive
+                and np.array_equal(self.x, x) and np.array_equal(self.y, y)):
+            return False
+        if adaptive and values is not None:
+            return np.array_equal(self.values, np.asarray(values, dtype=float).ravel(), equal_nan=True)
+        return True
+
+    def fit(self, values):
+        """
+        Interpolate a value field onto the grid.
+
+        Args:
+            values (array): Values at the scattered points.
+
+        Returns:
+            np.ndarray: 2D grid of fitted values, NaN outside the convex hull of the points.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        interpolator = CloughTocher2DInterpolator(self.triangulation, values)
+        return interpolator(self.x_grid, self.y_grid)
@@ -1,19 +1,49 @@
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass, field, fields
+import copy
+import numpy as np
 
-@dataclass
+
+def empty_column():
+    """Return an empty float64 column."""
+    return np.empty(0, dtype=np.float64)
+
+
+@dataclass(slots=True)
 class TurbineData:
-    H: List[float] = field(default_factory=list)
-    Q: List[float] = field(default_factory=list)
-    n: List[float] = field(default_factory=list)
-    D: List[float] = field(default_factory=list)
-    blade_angle: List[float] = field(default_factory=list)
-    Q11: List[float] = field(default_factory=list)
-    n11: List[float] = field(default_factory=list)
-    efficiency: List[float] = field(default_factory=list)
-    power: List[float] = field(default_factory=list)
-    Ns: List[float] = field(default_factory=list)
-    
+    """
+    Columnar turbine data.
+
+    Every field holds a contiguous float64 array: 1D for measured or sliced points,
+    2D for fitted grids. Single operating points (e.g. a simulator's operation_point)
+    may hold plain floats instead. Build whole columns at once with from_columns.
+    """
+    H: np.ndarray = field(default_factory=empty_column)
+    Q: np.ndarray = field(default_factory=empty_column)
+    n: np.ndarray = field(default_factory=empty_column)
+    D: np.ndarray = field(default_factory=empty_column)
+    blade_angle: np.ndarray = field(default_factory=empty_column)
+    Q11: np.ndarray = field(default_factory=empty_column)
+    n11: np.ndarray = field(default_factory=empty_column)
+    efficiency: np.ndarray = field(default_factory=empty_column)
+    power: np.ndarray = field(default_factory=empty_column)
+    Ns: np.ndarray = field(default_factory=empty_column)
+
+    @classmethod
+    def from_columns(cls, **columns):
+        """
+        Build data from whole columns in one step.
+
+        Args:
+            **columns: Field name to values (sequence or array); missing fields stay empty.
+
+        Returns:
+            TurbineData: Data with each given column as a contiguous float64 array.
+        """
+        return cls(**{name: np.ascontiguousarray(values, dtype=np.float64) for name, values in columns.items()})
+
+    def as_dict(self):
+        """Return a {field name: value} dictionary of the data (values are not copied)."""
+        return {data_field.name: getattr(self, data_field.name) for data_field in fields(self)}
 
     def __str__(self):
         return (f"TurbineData(H={self.H:.2f}, Q={self.Q:.2f}, n={self.n:.2f}, D={self.D:.2f}, "
@@ -49,6 +79,26 @@ class TurbineData:
         }
     
     def clear_data(self):
-        #Clears all data by resetting each attribute to an empty list.
-        for attr in vars(self):
-            setattr(self, attr, [])
\ No newline at end of file
+        """Reset every field to an empty column."""
+        for data_field in fields(self):
+            setattr(self, data_field.name, empty_column())
+
+    def view(self):
+        """
+        Return a lightweight copy-on-write view of the data.
+
+        Array fields are shared as read-only views and any list fields are shallow-copied,
+        so slicing, normalizing or case calculations on the view (which rebind or
+        append to fields) leave this instance untouched without cloning its grids.
+        In-place writes to a shared grid raise instead of corrupting the original.
+        """
+        view = copy.copy(self)
+        for data_field in fields(self):
+            value = getattr(self, data_field.name)
+            if isinstance(value, np.ndarray):
+                value = value.view()
+                value.flags.writeable = False
+            elif isinstance(value, list):
+                value = list(value)
+            setattr(view, data_field.name, value)
+        return view
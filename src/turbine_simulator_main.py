@@ -2,7 +2,11 @@
 #pyinstaller --onefile --name Turbine_Simulator_1.1.1 --icon=src/icon.ico --noconsole --add-data "src/logo.png;src/" src/turbine_simulator_main.py
 #fixed
 
+from startup_profile import StartupProfile, profiling_requested
+startup_profile = StartupProfile()  # Started before the imports below, which are part of the startup
+
 from main_processor import MainProcessor
+from surface_cache import SurfaceCache
 
 from turbine_simulator_gui import ( # Generated GUI files
     Ui_MainWindow
@@ -27,8 +31,12 @@ from PyQt6.QtWidgets import (
     )
 
 from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QTimer
 
 import os
+import sys
+
+startup_profile.mark("modules imported")
 
 
 
@@ -85,8 +93,8 @@ class MainWindow(QMainWindow):
         self.ui.CoverImage.setPixmap(QPixmap(logo_path))
         self.ui.CoverImage.setScaledContents(True)  # Ensure the image scales to fit QLabel        
 
-        # Initialize main processor
-        self.main_processor = MainProcessor()
+        # Initialize main processor, keeping fitted surfaces on disk between sessions
+        self.main_processor = MainProcessor(surface_cache=SurfaceCache())
         self.main_processor.set_message_callback(self.update_status)  # Set the callback for messages
         self.main_processor.standalone_figures = False
 
@@ -108,6 +116,10 @@ class MainWindow(QMainWindow):
         # Initialize simulation state
         self.simulation_initialized = False
 
+        # Redraws the simulation results from the snapshots of the background simulation
+        self.simulation_timer = QTimer(self)
+        self.simulation_timer.timeout.connect(self.refresh_simulation_view)
+
         self.update_status(f"Program has started successfully.") 
 
     
@@ -400,7 +412,7 @@ class MainWindow(QMainWindow):
         Cleanup actions for the 'Simulation Results' tab.
         """        
         self.update_status(f"Cleaning up resources for Simulation Results tab.")
-        self.main_processor.control_processor.continue_simulation = False
+        self.simulation_timer.stop()
         self.main_processor.reset_simulation()
         self.close_widget("control_widget")
     
@@ -410,7 +422,18 @@ class MainWindow(QMainWindow):
         self.manage_control_simulation(control_parameters)        
 
     def stop_control(self):
-        self.main_processor.control_processor.continue_simulation = False
+        self.main_processor.stop_simulation()
+        self.refresh_simulation_view()
+
+    def refresh_simulation_view(self):
+        """
+        Show the latest snapshot of the background simulation (called by the simulation timer).
+        """
+        running = self.main_processor.control_processor.is_simulation_running()
+        self.main_processor.refresh_simulation(self.plot_axs, log_callback=self.update_status)
+        if not running:
+            self.simulation_timer.stop()
+            self.update_status("Stopped. Press Start to Continue")
 
     def apply_control_parameter_changes(self):
         """
@@ -448,20 +471,19 @@ class MainWindow(QMainWindow):
         
     def manage_control_simulation(self, control_parameters):
         """
-        Run the simulation loop, dynamically adapting to live updates of control parameters.
+        Run the simulation in the background, or pass updated control parameters to the running one.
         Args:
-            control_parameters (dict): Parameters for the simulation. If None, initializes simulation.
+            control_parameters (dict): Parameters for the simulation.
         """
         try:
-            # Use ControlProcessor to run the simulation
-            self.main_processor.run_simulation(
-                control_parameters,                
-                axs=self.plot_axs,  # Pass the plot axes
-                log_callback=self.update_status
-            )
-
-            # Finalize
-            #self.update_status("Stopped. Press Start to Continue")            
+            if not self.main_processor.control_processor.continue_simulation:
+                self.update_status("Stopped. Press Start to Continue")
+                return
+
+            # Step the simulation on its worker thread; the timer redraws from its snapshots
+            self.main_processor.start_simulation(control_parameters)
+            frame_rate = self.main_processor.control_processor.frame_rate
+            self.simulation_timer.start(int(1000 / frame_rate))
         except RuntimeError as e:
             self.update_status(f"Error during simulation: {str(e)}")
             print(f"Error: {e}")
@@ -601,9 +623,11 @@ class MainWindow(QMainWindow):
 
 
 if __name__ == "__main__":
-    import sys
+    import multiprocessing
+    multiprocessing.freeze_support()  # Needed by worker processes of the frozen (PyInstaller) build
     app = QApplication(sys.argv)
     window = MainWindow()    
+    startup_profile.mark("main window created")
     """
     window.turbine_hydraulics_action()
     window.main_processor.default_pathname()
@@ -615,6 +639,14 @@ if __name__ == "__main__":
     """
 
     window.show()    
+    startup_profile.mark("main window shown")
+
+    if profiling_requested():
+        def report_startup():
+            startup_profile.mark("event loop running")
+            print(startup_profile.report(), flush=True)
+        QTimer.singleShot(0, report_startup)
+
     sys.exit(app.exec())
 
 
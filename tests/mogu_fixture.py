@@ -0,0 +1,40 @@
+import os
+import sys
+
+# Add src to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from control_simulator import ControlSimulator
+from HillChartProcessor import HillChartProcessor
+
+
+# Hill chart dataset shared by the simulation tests
+MOGU_CSV = os.path.join(os.path.dirname(__file__), '../src/Mogu_Ns_114_rpm_extended_dataset.csv')
+
+
+def load_mogu_hill_chart():
+    """
+    Fit the Mogu hill chart for a 1.65 m runner.
+
+    Returns:
+        tuple: (fitted TurbineData, BEP data)
+    """
+    hill_chart_processor = HillChartProcessor()
+    hill_chart_processor.set_file_path(MOGU_CSV)
+    hill_chart_processor.set_turbine_parameters([1, 4], 2.15, 1.65)
+    hill_chart_processor.set_plot_parameters(25, [0, 0], None, None, min_efficiency_limit=0.2)
+    hill_values = hill_chart_processor.prepare_core_data()
+    return hill_values.data, hill_chart_processor.BEP_data
+
+
+def load_mogu_simulator():
+    """Return a quiet simulator loaded with the fitted Mogu hill chart."""
+    hill_data, BEP_data = load_mogu_hill_chart()
+    simulator = ControlSimulator()
+    simulator.set_message_callback(lambda message, overwrite=False: None)
+    simulator.process_gui_events = False
+    simulator.get_data(hill_data)
+    simulator.get_BEP_data(BEP_data)
+    simulator.operation_point.D = 1.65
+    simulator.Q_counter = 0
+    return simulator
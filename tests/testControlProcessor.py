@@ -0,0 +1,160 @@
+import os
+import sys
+import time
+import unittest
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+# Add src to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from control_processor import ControlProcessor
+from flow_scenarios import FlowScenario
+from mogu_fixture import load_mogu_hill_chart
+
+
+class TestLivePlot(unittest.TestCase):
+    def setUp(self):
+        self.processor = ControlProcessor(max_duration=50)
+        self.fig, self.axs = self.processor.initialize_plot()
+
+    def append_samples(self, count):
+        for _ in range(count):
+            t = float(self.processor.sample_count)
+            self.processor.history.append([t] + [np.sin(t / 10) + len(attribute) for attribute in ('H', 'Q', 'blade_angle', 'n', 'power')])
+
+    def test_lines_are_reused_and_follow_the_history(self):
+        self.append_samples(30)
+        self.processor.update_plot(self.axs)
+        lines = list(self.processor.plot_lines)
+        self.assertIsNotNone(self.processor.plot_background)
+
+        # More samples than the history holds: old ones are dropped from the plot too
+        for _ in range(4):
+            self.append_samples(20)
+            self.processor.update_plot(self.axs)
+        self.assertEqual(self.processor.plot_lines, lines)
+        self.assertEqual([len(ax.lines) for ax in self.axs], [1] * 5)
+        np.testing.assert_array_equal(lines[0].get_xdata(), np.arange(60.0, 110.0))
+        np.testing.assert_array_equal(lines[4].get_ydata(), self.processor.history.column('power'))
+        self.assertEqual(self.axs[4].get_xlabel(), "Physical Time [Seconds]")
+
+        # Refreshes only binned the new samples, which also updated the running extremes
+        self.assertEqual(self.processor.plot_sample_count, 110)
+        np.testing.assert_allclose(self.processor.plot_extremes[:, 4], [4.0, 6.0], atol=0.01)
+
+    def test_time_unit_change_rescales_once(self):
+        self.append_samples(30)
+        self.processor.update_plot(self.axs)
+        self.processor.history.append([600.0, 1, 1, 1, 1, 1])
+        self.processor.update_plot(self.axs)
+        self.assertEqual(self.axs[4].get_xlabel(), "Physical Time [Minutes]")
+        np.testing.assert_allclose(self.processor.plot_lines[0].get_xdata(), np.append(np.arange(30) / 60, 10))
+
+    def test_long_history_is_drawn_as_an_envelope(self):
+        processor = ControlProcessor(max_duration=100000)
+        for t in np.arange(100000.0):
+            processor.history.append([t] + [np.sin(t / 10) + offset for offset in range(5)])
+        processor.update_plot(self.axs)
+
+        # At most two points per pixel column, still spanning every peak of the series
+        num_bins = int(self.axs[0].bbox.width)
+        for index, line in enumerate(processor.plot_lines):
+            self.assertLessEqual(len(line.get_xdata()), 2 * num_bins)
+            self.assertAlmostEqual(np.min(line.get_ydata()), index - 1, places=6)
+            self.assertAlmostEqual(np.max(line.get_ydata()), index + 1, places=6)
+        self.assertEqual(self.axs[4].get_xlabel(), "Physical Time [Hours]")
+
+        # New samples are folded in without rebinning the history
+        envelope = processor.plot_envelope
+        processor.history.append([100000.0, 10, 0, 0, 0, 0])
+        processor.update_plot(self.axs)
+        self.assertIs(processor.plot_envelope, envelope)
+        self.assertEqual(np.max(processor.plot_lines[0].get_ydata()), 10)
+
+    def test_draw_handler_moves_with_the_lines(self):
+        self.append_samples(10)
+        self.processor.update_plot(self.axs)
+        fig, axs = self.processor.initialize_plot()
+        self.processor.update_plot(axs)
+        self.assertEqual(len(self.fig.canvas.callbacks.callbacks.get("draw_event", {})), 0)
+        self.assertEqual(len(fig.canvas.callbacks.callbacks.get("draw_event", {})), 1)
+
+    def tearDown(self):
+        plt.close('all')
+
+
+class TestSimulation(unittest.TestCase):
+    def setUp(self):
+        self.hill_data, self.BEP_data = load_mogu_hill_chart()
+        self.processor = ControlProcessor()
+        self.processor.initialize_simulation(self.hill_data, self.BEP_data)
+        self.control_parameters = {
+            'Q': 3.3, 'Q_rate': 0.01, 'H_t': 2.15, 'H_t_rate': 0.01, 'n': 110, 'n_rate': 1,
+            'blade_angle': 16, 'blade_angle_rate': 0.1, 'head_control': True, 'blade_angle_lock': False, 'n_lock': False,
+        }
+
+    def test_worker_is_paced_to_real_time_by_default(self):
+        self.processor.start_simulation(self.control_parameters)
+        time.sleep(0.5)
+        self.processor.stop_simulation()
+        self.assertIsNone(self.processor.simulation_error)
+        self.assertLessEqual(self.processor.elapsed_physical_time, 2)
+
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(ControlProcessor(time_scale_factor=5).real_time_factor, 5)
+
+    def test_worker_steps_until_stopped(self):
+        self.processor.real_time_factor = None  # As fast as possible
+        self.processor.start_simulation(self.control_parameters)
+        deadline = time.time() + 10
+        while self.processor.sample_count < 20 and time.time() < deadline:
+            time.sleep(0.01)
+        self.processor.stop_simulation()
+
+        self.assertFalse(self.processor.is_simulation_running())
+        self.assertIsNone(self.processor.simulation_error)
+        self.assertGreaterEqual(self.processor.sample_count, 20)
+
+        # The final snapshot matches the stopped state and is handed out once
+        snapshot = self.processor.refresh_from_snapshot()
+        self.assertFalse(snapshot['running'])
+        self.assertEqual(snapshot['sample_count'], self.processor.sample_count)
+        self.assertEqual(snapshot['elapsed_physical_time'], self.processor.elapsed_physical_time)
+        self.assertIsNone(self.processor.refresh_from_snapshot())
+
+    def test_simulate_matches_the_interactive_steps(self):
+        results = self.processor.simulate(60, self.control_parameters)
+        self.assertEqual(len(results["time"]), 60)
+        np.testing.assert_array_equal(results["time"], np.arange(60.0))
+        self.assertEqual(self.processor.elapsed_physical_time, 60)
+        self.assertEqual(len(self.processor.history), 1)  # Only the initial sample, nothing was plotted
+
+        # Same steps as the live simulation, including the ramp towards the targets
+        reference = ControlProcessor()
+        reference.initialize_simulation(self.hill_data, self.BEP_data)
+        for _ in range(60):
+            reference.step_simulation(reference.ramp_control_parameters(self.control_parameters), reference.settings)
+            reference.elapsed_physical_time += reference.refresh_rate_physical
+        np.testing.assert_allclose(results["H"], reference.history.column('H')[1:])
+        np.testing.assert_allclose(results["blade_angle"], reference.history.column('blade_angle')[1:])
+
+        # A scenario function gets the elapsed physical time
+        times = []
+        self.processor.simulate(5, lambda t: times.append(t) or self.control_parameters)
+        self.assertEqual(times, [60, 61, 62, 63, 64])
+
+    def test_flow_scenario_drives_Q(self):
+        scenario = FlowScenario.constant(3.3, 100).with_steps([(5, -0.2)])
+        self.processor.set_flow_scenario(scenario)
+        results = self.processor.simulate(10, self.control_parameters)
+        np.testing.assert_allclose(results["Q"], scenario.sample(results["time"]))
+        self.assertEqual(results["Q"][4], 3.3)
+        self.assertAlmostEqual(results["Q"][5], 3.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+# Add src to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from control_simulator import ControlSimulator, MAX_POWER_FIELDS
+from hill_surface import HillSurface
+from mogu_fixture import load_mogu_simulator
+
+
+class TestSolveN11(unittest.TestCase):
+    def setUp(self):
+        self.simulator = ControlSimulator()
+        self.simulator.operation_point.Q = 0.5
+        self.simulator.operation_point.D = 1.0
+
+        # Gently curved Q11(n11) slice with a constant efficiency
+        self.n11_slice = np.linspace(60, 160, 41)
+        self.Q11_slice = 0.5 + 0.004 * (self.n11_slice - 60) + 1e-5 * (self.n11_slice - 60) ** 2
+        self.efficiency_slice = np.full(self.n11_slice.shape, 0.8)
+
+    def test_solution_matches_slice(self):
+        n_values = np.arange(20, 200, 5.0)
+        solution = self.simulator.solve_n11(n_values, 120, self.n11_slice, self.Q11_slice, self.efficiency_slice)
+        converged = solution['converged']
+        self.assertTrue(converged.any())
+        self.assertLessEqual(solution['iterations'].max(), 10)
+
+        # Converged points satisfy Q / (D^2 sqrt(H)) = Q11(n11) and H = (n D / n11)^2
+        n11 = solution['n11'][converged]
+        Q11_lookup = np.interp(n11, self.n11_slice, self.Q11_slice)
+        np.testing.assert_allclose(solution['Q11'][converged], Q11_lookup, rtol=1e-3)
+        np.testing.assert_allclose(solution['H'][converged], (n_values[converged] / n11) ** 2)
+        np.testing.assert_allclose(solution['efficiency'][converged], 0.8)
+
+        # Speeds whose root lies outside the slice are reported and counted, not guessed
+        self.assertFalse(converged[0])
+        self.assertFalse(solution['bracketed'][0])
+        self.assertTrue(np.isnan(solution['n11'][~converged]).all())
+        self.assertEqual(self.simulator.unsolved_count, np.count_nonzero(~converged))
+
+    def test_tolerance_defaults_to_the_baseline_and_can_be_tightened(self):
+        n_values = np.arange(60, 200, 5.0)
+
+        Q11_interpolator = self.simulator.prepare_slice_interpolators(self.n11_slice, self.Q11_slice, self.efficiency_slice)[0]
+
+        def mismatch(solution):
+            converged = solution['converged']
+            Q11_lookup = Q11_interpolator(solution['n11'][converged])
+            return np.abs(solution['Q11'][converged] / Q11_lookup - 1).max()
+
+        self.assertEqual(self.simulator.n11_tolerance, 1e-3)
+        default = self.simulator.solve_n11(n_values, 120, self.n11_slice, self.Q11_slice, self.efficiency_slice)
+        self.assertLess(mismatch(default), 1e-3)
+
+        self.simulator.n11_tolerance = 1e-9
+        tight = self.simulator.solve_n11(n_values, 120, self.n11_slice, self.Q11_slice, self.efficiency_slice)
+        np.testing.assert_array_equal(tight['converged'], default['converged'])
+        self.assertLess(mismatch(tight), 1e-8)
+
+    def test_scalar_and_vector_agree(self):
+        n_values = np.array([65.0, 70.0])
+        n11, H, Q11, efficiency = self.simulator.compute_n11_vectorized(
+            n_values, 120, self.n11_slice, self.Q11_slice, self.efficiency_slice)
+        for index, n in enumerate(n_values):
+            self.simulator.operation_point.n = n
+            result = self.simulator.compute_n11_iteratively(120, self.n11_slice, self.Q11_slice, self.efficiency_slice)
+            np.testing.assert_allclose(result, (n11[index], H[index], Q11[index], efficiency[index]))
+            self.assertTrue(self.simulator.solver_info['converged'][0])
+
+
+class TestSliceCache(unittest.TestCase):
+    def setUp(self):
+        x, y = np.meshgrid(np.linspace(-1, 1, 41), np.linspace(-1, 1, 41))
+        self.simulator = ControlSimulator()
+        self.simulator.data.n11 = x * 50 + 100
+        self.simulator.data.Q11 = y * 0.5 + 1
+        self.simulator.data.efficiency = 0.9 - 0.1 * (x**2 + y**2)
+        self.simulator.data.blade_angle = 5 * x + 10 * y + 15
+
+    def test_interpolators_are_memoized_per_slice(self):
+        slices = self.simulator.slice_data_for_blade_angle(16.3)
+        for cached, array in zip(self.simulator.slice_data_for_blade_angle(16.3), slices):
+            self.assertIs(cached, array)
+
+        interpolators = self.simulator.prepare_slice_interpolators(*slices)
+        self.assertIs(self.simulator.prepare_slice_interpolators(*slices), interpolators)
+
+        # Copies of a cached slice are not mistaken for it
+        copies = [array.copy() for array in slices]
+        self.assertIsNot(self.simulator.prepare_slice_interpolators(*copies), interpolators)
+
+        self.simulator.clear_slice_cache()
+        self.assertEqual(self.simulator.slice_interpolators, {})
+        self.assertIsNot(self.simulator.prepare_slice_interpolators(*slices), interpolators)
+
+    def test_exact_angles_by_default(self):
+        self.assertEqual(self.simulator.quantize_blade_angle(16.304), 16.304)
+        slices = self.simulator.slice_data_for_blade_angle(16.3)
+        self.assertIsNot(self.simulator.slice_data_for_blade_angle(16.304)[0], slices[0])
+        self.assertEqual(list(self.simulator.slice_cache), [16.3, 16.304])
+
+    def test_angles_are_quantized_to_the_resolution(self):
+        self.simulator.slice_cache_resolution = 0.01
+        self.assertEqual(self.simulator.quantize_blade_angle(16.304), 16.3)
+        self.assertEqual(self.simulator.quantize_blade_angle(16.306), 16.31)
+        slices = self.simulator.slice_data_for_blade_angle(16.3)
+        self.assertIs(self.simulator.slice_data_for_blade_angle(16.304)[0], slices[0])
+        self.assertIsNot(self.simulator.slice_data_for_blade_angle(16.306)[0], slices[0])
+        self.assertEqual(list(self.simulator.slice_cache), [16.3, 16.31])
+
+    def test_least_recently_used_slice_is_evicted(self):
+        self.simulator.slice_cache_size = 2
+        self.simulator.prewarm_slice_cache([14.0, 15.0])
+        self.assertEqual(set(self.simulator.slice_interpolators), {14.0, 15.0})
+        self.simulator.slice_data_for_blade_angle(14.0)  # Now the most recently used
+        self.simulator.slice_data_for_blade_angle(16.0)
+        self.assertEqual(list(self.simulator.slice_cache), [14.0, 16.0])
+        self.assertEqual(set(self.simulator.slice_interpolators), {14.0})
+
+    def test_new_surface_invalidates_the_cache(self):
+        old_slice = self.simulator.slice_data_for_blade_angle(15.0)
+        data = self.simulator.data
+        data.efficiency = data.efficiency * 0.5
+        self.simulator.get_data(data)
+        self.assertEqual(len(self.simulator.slice_cache), 0)
+        new_slice = self.simulator.slice_data_for_blade_angle(15.0)
+        np.testing.assert_allclose(new_slice[2], old_slice[2] * 0.5)
+
+
+class TestMaximizeOutput(unittest.TestCase):
+    def setUp(self):
+        self.simulator = load_mogu_simulator()
+        self.simulator.set_ranges(Q_range=[2.5, 3.0, 3.3], H_range=(1.5, 2.5),
+                                  n_range=np.arange(80, 141, 10.0), blade_angle_range=np.arange(8, 25, 4.0))
+
+    def test_vectorized_matches_loop(self):
+        for Q in self.simulator.Q_range:
+            self.simulator.operation_point.Q = Q
+            vectorized = self.simulator.maximize_output(*self.simulator.H_range)
+            loop = self.simulator.maximize_output(*self.simulator.H_range, vectorized=False)
+            self.assertIsInstance(vectorized, dict)
+            self.assertIsInstance(loop, dict)
+            self.assertEqual(tuple(vectorized), MAX_POWER_FIELDS)
+            self.assertEqual(tuple(loop), MAX_POWER_FIELDS)
+            for name in MAX_POWER_FIELDS:
+                self.assertAlmostEqual(float(vectorized[name]), float(loop[name]), places=6, msg=f"{name} at Q={Q}")
+
+        # No point within the head limits
+        self.assertIsNone(self.simulator.maximize_output(10, 11))
+        self.assertIsNone(self.simulator.maximize_output(10, 11, vectorized=False))
+
+
+class TestParallelMaximizeOutput(unittest.TestCase):
+    def setUp(self):
+        self.simulator = load_mogu_simulator()
+        self.simulator.set_ranges(Q_range=[2.5, 3.0, 3.3], H_range=(1.5, 2.5),
+                                  n_range=np.arange(80, 141, 10.0), blade_angle_range=np.arange(8, 25, 4.0))
+
+    def tearDown(self):
+        plt.close('all')
+
+    def test_surface_snapshot_round_trip(self):
+        surface = self.simulator.surface_snapshot()
+        self.assertIsInstance(surface, HillSurface)
+        simulator = ControlSimulator.from_surface(surface)
+        for name in ('n11', 'Q11', 'efficiency', 'blade_angle'):
+            np.testing.assert_array_equal(getattr(simulator.data, name), getattr(self.simulator.data, name))
+        self.assertEqual(simulator.BEP_data.n11[0], self.simulator.BEP_data.n11[0])
+
+    def test_pool_matches_serial(self):
+        serial = self.simulator.maximize_output_in_flow_range()
+        unsolved_count = self.simulator.unsolved_count
+        progress = []
+        self.simulator.set_progress_callback(lambda completed, total: progress.append((completed, total)))
+        parallel = self.simulator.maximize_output_in_flow_range(parallel=True, max_workers=2)
+
+        self.assertEqual(list(parallel), list(serial))
+        for Q in serial:
+            self.assertEqual(parallel[Q].keys(), serial[Q].keys())
+            for name in MAX_POWER_FIELDS:
+                self.assertAlmostEqual(float(parallel[Q][name]), float(serial[Q][name]), places=9)
+        self.assertEqual(self.simulator.unsolved_count, unsolved_count)
+        self.assertEqual(len(progress), progress[-1][1])
+        self.assertEqual(sorted(completed for completed, _ in progress), list(range(1, len(progress) + 1)))
+
+    def test_worker_import_path_skips_qt_and_pyplot(self):
+        code = (
+            "import sys\n"
+            "import control_simulator\n"
+            "print(sorted(name for name in ('matplotlib.pyplot', 'PyQt6') if name in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                cwd=os.path.join(os.path.dirname(__file__), '../src'))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), '[]')
+
+    def test_repeated_flow_rates_are_rejected(self):
+        self.simulator.Q_range = [2.5, 3.0, 2.5]
+        with self.assertRaisesRegex(ValueError, "repeats the flow rate"):
+            self.simulator.maximize_output_in_flow_range()
+        with self.assertRaisesRegex(ValueError, "repeats the flow rate"):
+            self.simulator.maximize_output_in_flow_range(parallel=True, max_workers=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
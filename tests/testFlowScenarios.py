@@ -0,0 +1,49 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add src to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from flow_scenarios import FlowScenario
+
+
+class TestFlowScenario(unittest.TestCase):
+    def test_lookup_interpolates_and_holds_the_ends(self):
+        scenario = FlowScenario.sinusoidal(3.0, 0.5, period=3600, duration=7200, time_step=10)
+        self.assertEqual(len(scenario.Q), 721)
+        self.assertAlmostEqual(scenario(900), 3.5)
+        self.assertAlmostEqual(scenario(905), np.mean(scenario.Q[90:92]))
+        self.assertEqual(scenario(-5), scenario.Q[0])
+        self.assertEqual(scenario(1e6), scenario.Q[-1])
+
+        times = np.linspace(-10, 7300, 57)
+        np.testing.assert_allclose(scenario.sample(times), [scenario(t) for t in times])
+
+    def test_stochastic_is_reproducible(self):
+        first = FlowScenario.stochastic(3.0, 0.2, correlation_time=600, duration=200000, seed=1)
+        second = FlowScenario.stochastic(3.0, 0.2, correlation_time=600, duration=200000, seed=1)
+        np.testing.assert_array_equal(first.Q, second.Q)
+        self.assertAlmostEqual(first.Q.mean(), 3.0, delta=0.05)
+        self.assertAlmostEqual(first.Q.std(), 0.2, delta=0.03)
+
+    def test_csv_replay_with_steps(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'flow.csv')
+            with open(file_path, 'w') as file:
+                file.write("Time, Q\n100, 2.0\n160, 3.2\n220, 2.6\n")
+            scenario = FlowScenario.from_csv(file_path, time_step=30)
+
+        np.testing.assert_allclose(scenario.time, [100, 130, 160, 190, 220])
+        np.testing.assert_allclose(scenario.Q, [2.0, 2.6, 3.2, 2.9, 2.6])
+
+        stepped = scenario.with_steps([(160, 0.5), (200, -1.0)])
+        np.testing.assert_allclose(stepped.Q, [2.0, 2.6, 3.7, 3.4, 2.1])
+        np.testing.assert_allclose(scenario.Q, [2.0, 2.6, 3.2, 2.9, 2.6])
+
+
+if __name__ == '__main__':
+    unittest.main()
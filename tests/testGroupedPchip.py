@@ -0,0 +1,43 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+
+# Add src to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from grouped_pchip import GroupedPchip
+
+
+class TestGroupedPchip(unittest.TestCase):
+    def test_matches_scipy_per_group(self):
+        rng = np.random.default_rng(0)
+        keys, x, y = [], [], []
+        for key, count in zip([12.0, 4.0, 8.0, 20.0], [2, 3, 7, 12]):
+            keys.append(np.full(count, key))
+            x.append(rng.permutation(np.sort(rng.uniform(50, 150, count))))
+            y.append(rng.uniform(0.5, 1.5, count))
+        y[2][:3] = 0.7  # flat stretch
+        curves = GroupedPchip(np.concatenate(keys), np.concatenate(x), np.concatenate(y))
+
+        x_new = np.linspace(30, 170, 41)
+        values = curves(x_new)
+        self.assertEqual(values.shape, (1, 4, 41))
+        np.testing.assert_array_equal(curves.keys, [4, 8, 12, 20])
+        for row, key in enumerate(curves.keys):
+            index = [i for i, group in enumerate(keys) if group[0] == key][0]
+            order = np.argsort(x[index])
+            expected = PchipInterpolator(x[index][order], y[index][order])(x_new)
+            np.testing.assert_allclose(values[0, row], expected, rtol=1e-12, atol=1e-12)
+
+    def test_invalid_groups(self):
+        with self.assertRaises(ValueError):
+            GroupedPchip([1, 1, 2], [0, 1, 0], [0, 1, 2])
+        with self.assertRaises(ValueError):
+            GroupedPchip([1, 1, 1], [0, 1, 1], [0, 1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
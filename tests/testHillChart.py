@@ -0,0 +1,94 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add src to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from scipy.interpolate import griddata
+
+from HillChart import HillChart
+
+
+class TestCalculateCases(unittest.TestCase):
+    def setUp(self):
+        self.hill_chart = HillChart()
+        self.hill_chart.data.n11, self.hill_chart.data.Q11 = np.meshgrid(np.linspace(80, 160, 5), np.linspace(0.5, 1.5, 4))
+        self.hill_chart.data.efficiency = np.full((4, 5), 0.8)
+
+    def test_grid_keeps_shape(self):
+        self.hill_chart.calculate_cases([1, 4], 2.0, 1.5)
+        data = self.hill_chart.data
+        for values in (data.H, data.Q, data.n, data.D, data.power, data.Ns):
+            self.assertEqual(values.shape, (4, 5))
+        np.testing.assert_allclose(data.n, 2.0**0.5 * data.n11 / 1.5)
+        np.testing.assert_allclose(data.power, data.Q * 2.0 * 1000 * 9.8 * 0.8)
+
+    def test_all_input_pairs_are_consistent(self):
+        self.hill_chart.calculate_cases([1, 4], 2.0, 1.5)
+        reference = {name: getattr(self.hill_chart.data, name) for name in ('H', 'Q', 'n', 'D')}
+        index = {'H': 1, 'Q': 2, 'n': 3, 'D': 4}
+        for first, second in (('H', 'Q'), ('H', 'n'), ('Q', 'n'), ('Q', 'D'), ('n', 'D'), ('D', 'H')):
+            self.hill_chart.calculate_cases([index[first], index[second]], reference[first], reference[second])
+            for name, values in reference.items():
+                np.testing.assert_allclose(getattr(self.hill_chart.data, name), values, err_msg=f"{first}, {second}: {name}")
+
+    def test_vector_of_heads_for_one_point(self):
+        self.hill_chart.data.n11 = [120.0]
+        self.hill_chart.data.Q11 = [1.0]
+        self.hill_chart.data.efficiency = [0.9]
+        heads = np.array([1.0, 2.0, 4.0])
+        self.hill_chart.calculate_cases([1, 4], heads, 2.0)
+        np.testing.assert_allclose(self.hill_chart.data.n, heads**0.5 * 120 / 2)
+        np.testing.assert_allclose(self.hill_chart.data.D, [2.0, 2.0, 2.0])
+
+
+class TestGetBladeAngle(unittest.TestCase):
+    def setUp(self):
+        self.hill_chart = HillChart()
+        self.hill_chart.data.n11, self.hill_chart.data.Q11 = np.meshgrid(np.linspace(80, 160, 9), np.linspace(0.5, 1.5, 6))
+        self.hill_chart.data.blade_angle = 0.1 * self.hill_chart.data.n11 + 10 * self.hill_chart.data.Q11
+
+    def test_scalar_and_vector_queries(self):
+        self.assertAlmostEqual(self.hill_chart.get_blade_angle(1.0, 100.0), 20.0)
+        interpolator = self.hill_chart.blade_angle_interpolator
+
+        blade_angles = self.hill_chart.get_blade_angle(np.array([0.6, 1.2, 2.0]), np.array([[90.0], [150.0]]))
+        self.assertEqual(blade_angles.shape, (2, 3))
+        np.testing.assert_allclose(blade_angles[:, :2], [[15, 21], [21, 27]])
+        self.assertTrue(np.isnan(blade_angles[:, 2]).all())
+        self.assertIs(self.hill_chart.blade_angle_interpolator, interpolator)
+
+    def test_rebuilt_when_grid_changes(self):
+        self.hill_chart.get_blade_angle(1.0, 100.0)
+        self.hill_chart.data.blade_angle = self.hill_chart.data.blade_angle + 1
+        self.assertAlmostEqual(self.hill_chart.get_blade_angle(1.0, 100.0), 21.0)
+
+    def test_matches_cubic_griddata_inside_and_at_the_edge(self):
+        # Curved field, valid only inside an ellipse like a fitted hill chart
+        n11, Q11 = np.meshgrid(np.linspace(80, 160, 41), np.linspace(0.5, 1.5, 41))
+        inside = ((n11 - 120) / 40) ** 2 + ((Q11 - 1.0) / 0.5) ** 2 <= 1
+        self.hill_chart.data.n11, self.hill_chart.data.Q11 = n11, Q11
+        self.hill_chart.data.blade_angle = np.where(inside, 5 + 0.001 * n11**2 + 8 * Q11**2, np.nan)
+
+        rng = np.random.default_rng(0)
+        Q11_query, n11_query = rng.uniform(0.5, 1.5, 2000), rng.uniform(80, 160, 2000)
+        valid = inside.ravel()
+        old = griddata((Q11.ravel()[valid], n11.ravel()[valid]), self.hill_chart.data.blade_angle.ravel()[valid],
+                       (Q11_query, n11_query), method='cubic')
+        new = self.hill_chart.get_blade_angle(Q11_query, n11_query)
+
+        # Same points resolve as before; the linear lookup stays close to the cubic one
+        np.testing.assert_array_equal(np.isnan(new), np.isnan(old))
+        np.testing.assert_allclose(new[~np.isnan(old)], old[~np.isnan(old)], atol=0.02)
+
+        # Cells with a NaN corner use the cubic fallback, which is the old method
+        edge = np.isnan(self.hill_chart.blade_angle_interpolator(np.column_stack((Q11_query, n11_query)))) & ~np.isnan(old)
+        self.assertTrue(edge.any())
+        np.testing.assert_allclose(new[edge], old[edge])
+
+
+if __name__ == '__main__':
+    unittest.main()
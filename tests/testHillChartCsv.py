@@ -0,0 +1,79 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add src to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from hill_chart_csv import DatasetRegistry, read_hill_chart_csv, sidecar_path
+
+
+class TestReadHillChartCsv(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, 'hill_chart.csv')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, text):
+        with open(self.file_path, 'w', encoding='utf-8-sig') as file:
+            file.write(text)
+
+    def test_trailing_empty_columns_and_rows(self):
+        self.write("Blade Angle,n11,Q11,Efficiency,,,\n"
+                   "10,100,1.0,0.8,,,\n"
+                   "15,110,1.2,0.85,,,\n"
+                   ",,,,,,\n")
+        columns = read_hill_chart_csv(self.file_path)
+        np.testing.assert_array_equal(columns['blade_angle'], [10, 15])
+        np.testing.assert_array_equal(columns['n11'], [100, 110])
+        np.testing.assert_array_equal(columns['Q11'], [1.0, 1.2])
+        np.testing.assert_array_equal(columns['efficiency'], [0.8, 0.85])
+        self.assertEqual(columns['n11'].dtype, np.float64)
+
+    def test_invalid_files(self):
+        self.write("Blade Angle,n11,Efficiency\n10,100,0.8\n")
+        with self.assertRaisesRegex(ValueError, 'Q11'):
+            read_hill_chart_csv(self.file_path)
+
+        self.write("Blade Angle,n11,Q11,Efficiency\n10,100,,0.8\n")
+        with self.assertRaisesRegex(ValueError, 'line'):
+            read_hill_chart_csv(self.file_path)
+
+    def test_sidecar_round_trip(self):
+        self.write("Blade Angle,n11,Q11,Efficiency\n10,100,1.0,0.8\n")
+        columns = read_hill_chart_csv(self.file_path, use_sidecar=True)
+        self.assertTrue(os.path.exists(sidecar_path(self.file_path)))
+        cached = read_hill_chart_csv(self.file_path, use_sidecar=True)
+        for name, values in columns.items():
+            np.testing.assert_array_equal(cached[name], values)
+
+        # A newer CSV invalidates the sidecar
+        self.write("Blade Angle,n11,Q11,Efficiency\n12,105,1.1,0.82\n")
+        os.utime(self.file_path, ns=(os.stat(sidecar_path(self.file_path)).st_mtime_ns + 10**9,) * 2)
+        np.testing.assert_array_equal(read_hill_chart_csv(self.file_path, use_sidecar=True)['n11'], [105])
+
+
+class TestDatasetRegistry(unittest.TestCase):
+    def test_reparses_only_changed_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'hill_chart.csv')
+            with open(file_path, 'w') as file:
+                file.write("Blade Angle,n11,Q11,Efficiency\n10,100,1.0,0.8\n")
+
+            registry = DatasetRegistry()
+            columns = registry.load(file_path)
+            self.assertIs(registry.load(file_path)['n11'], columns['n11'])
+            self.assertFalse(columns['n11'].flags.writeable)
+
+            with open(file_path, 'w') as file:
+                file.write("Blade Angle,n11,Q11,Efficiency\n10,100,1.0,0.8\n12,105,1.1,0.82\n")
+            np.testing.assert_array_equal(registry.load(file_path)['n11'], [100, 105])
+
+
+if __name__ == '__main__':
+    unittest.main()
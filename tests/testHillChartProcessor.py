@@ -66,5 +66,19 @@ class TestHillChartProcessor(unittest.TestCase):
         self.test_instance.generate_outputs()
         print("done")
 
+
+class TestHeadlessHillChartProcessor(unittest.TestCase):
+    def test_core_data_without_gui(self):
+        processor = HillChartProcessor()
+        processor.set_file_path(os.path.join(os.path.dirname(__file__), '../src/Mogu_Ns_114_rpm_extended_dataset.csv'))
+        processor.set_turbine_parameters([1, 4], 2.15, 1.65)
+        processor.set_plot_parameters(25, [0, 0], None, None, min_efficiency_limit=0.2)
+
+        hill_values = processor.prepare_core_data()
+        self.assertIsNone(processor.root_window)
+        self.assertEqual(hill_values.data.efficiency.shape, (101, 101))
+        self.assertIn("Best Efficiency Point", processor.prepare_text_results())
+
+
 if __name__ == '__main__':
     unittest.main()
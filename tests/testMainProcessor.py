@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# Add src to sys.path
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'))
+sys.path.insert(0, SRC_DIR)
+
+from startup_profile import DEFERRED_MODULES
+
+
+class TestLazyProcessors(unittest.TestCase):
+    def run_in_fresh_interpreter(self, code):
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=SRC_DIR)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout.strip()
+
+    def test_startup_does_not_load_deferred_modules(self):
+        code = (
+            "import sys\n"
+            "from main_processor import MainProcessor\n"
+            "main_processor = MainProcessor()\n"
+            "main_processor.set_message_callback(print)\n"
+            f"print(sorted(name for name in {DEFERRED_MODULES!r} if name in sys.modules))\n"
+        )
+        self.assertEqual(self.run_in_fresh_interpreter(code), '[]')
+
+    def test_processor_created_on_first_use(self):
+        code = (
+            "from main_processor import MainProcessor\n"
+            "main_processor = MainProcessor()\n"
+            "main_processor.set_message_callback(print)\n"
+            "processor = main_processor.processor\n"
+            "assert main_processor.processor is processor\n"
+            "processor.emit_message('callback set')\n"
+        )
+        self.assertEqual(self.run_in_fresh_interpreter(code), 'callback set')
+
+    def test_reset_simulation_stays_lazy(self):
+        code = (
+            "import sys\n"
+            "from main_processor import MainProcessor\n"
+            "main_processor = MainProcessor()\n"
+            "main_processor.reset_simulation()\n"
+            "print('control_processor' in vars(main_processor), 'control_processor' in sys.modules)\n"
+        )
+        self.assertEqual(self.run_in_fresh_interpreter(code), 'False False')
+
+
+if __name__ == '__main__':
+    unittest.main()
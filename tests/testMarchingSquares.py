@@ -0,0 +1,61 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add src to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from marching_squares import find_iso_lines
+from HillChart import HillChart
+
+
+class TestMarchingSquares(unittest.TestCase):
+    def setUp(self):
+        self.x, self.y = np.meshgrid(np.linspace(-1, 1, 41), np.linspace(-1, 1, 41))
+
+    def test_plane_gives_straight_line(self):
+        lines = find_iso_lines(self.x, self.y, self.x + 2 * self.y, [0.5])[0.5]
+        self.assertEqual(len(lines), 1)
+        vertices = lines[0]
+        np.testing.assert_allclose(vertices[:, 0] + 2 * vertices[:, 1], 0.5, atol=1e-12)
+        # Lines are oriented along increasing x
+        self.assertTrue(np.all(np.diff(vertices[:, 0]) > 0))
+
+    def test_circle_is_closed_loop(self):
+        z = self.x**2 + self.y**2
+        lines = find_iso_lines(self.x, self.y, z, [0.25, 0.49])
+        for level, radius in ((0.25, 0.5), (0.49, 0.7)):
+            self.assertEqual(len(lines[level]), 1)
+            vertices = lines[level][0]
+            np.testing.assert_allclose(vertices[0], vertices[-1])
+            np.testing.assert_allclose(np.hypot(vertices[:, 0], vertices[:, 1]), radius, atol=2e-3)
+
+    def test_nan_region_splits_line(self):
+        z = self.x.copy()
+        z[np.abs(self.y) < 0.2] = np.nan
+        lines = find_iso_lines(self.x, self.y, z, [0.1])[0.1]
+        self.assertEqual(len(lines), 2)
+        for vertices in lines:
+            np.testing.assert_allclose(vertices[:, 0], 0.1, atol=1e-12)
+
+    def test_level_outside_range(self):
+        lines = find_iso_lines(self.x, self.y, self.x, [5.0])
+        self.assertEqual(lines, {5.0: []})
+
+    def test_find_contours_at_angles(self):
+        hill_chart = HillChart()
+        hill_chart.data.n11 = self.x * 50 + 100
+        hill_chart.data.Q11 = self.y * 0.5 + 1
+        hill_chart.data.blade_angle = 10 * self.x + 15
+
+        contours = hill_chart.find_contours_at_angles(target_angles=12)
+        n11, Q11 = contours[12]
+        np.testing.assert_allclose(n11, 85)
+        self.assertEqual(len(n11), len(Q11))
+        self.assertEqual(set(hill_chart.find_contours_at_angles().keys()), {6, 8, 10, 12, 14, 16, 18, 20, 22, 24})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add src to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from HillChart import HillChart
+from PerformanceCurve import PerformanceCurve
+
+
+class TestPerformanceCurve(unittest.TestCase):
+    def setUp(self):
+        hill_chart = HillChart()
+        hill_chart.data.n11, hill_chart.data.Q11 = np.meshgrid(np.linspace(50, 150, 11), np.linspace(0.5, 1.5, 11))
+        hill_chart.data.efficiency = 0.002 * hill_chart.data.n11 + 0.1 * hill_chart.data.Q11
+        self.curve = PerformanceCurve(hill_chart)
+
+    def test_bilinear_interpolate_is_exact_for_linear_field(self):
+        rng = np.random.default_rng(0)
+        n11 = rng.uniform(50, 150, 1000)
+        Q11 = rng.uniform(0.5, 1.5, 1000)
+        efficiency = self.curve.bilinear_interpolate(self.curve.data.efficiency, n11, Q11)
+        np.testing.assert_allclose(efficiency, 0.002 * n11 + 0.1 * Q11)
+
+    def test_bilinear_interpolate_nan_corners(self):
+        self.curve.data.efficiency[5:, 5:] = np.nan
+        efficiency = self.curve.bilinear_interpolate(self.curve.data.efficiency, [95, 95, 97, 120], [0.8, 0.9, 0.95, 1.2])
+        # Points on the border of the NaN region stay finite, points inside it do not
+        np.testing.assert_allclose(efficiency[:2], [0.002 * 95 + 0.08, 0.002 * 95 + 0.09])
+        self.assertTrue(np.isnan(efficiency[2]))
+        self.assertTrue(np.isnan(efficiency[3]))
+
+    def test_custom_slice_hill_chart_data(self):
+        n11, Q11, efficiency = self.curve.custom_slice_hill_chart_data([60, 70, 80], [0.6, 0.7, 0.8])
+        np.testing.assert_allclose(efficiency, 0.002 * n11 + 0.1 * Q11)
+        self.assertIs(self.curve.data.efficiency, efficiency)
+
+
+if __name__ == '__main__':
+    unittest.main()
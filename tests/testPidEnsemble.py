@@ -0,0 +1,65 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add src to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from flow_scenarios import FlowScenario
+from hill_surface import HillSurface
+from mogu_fixture import load_mogu_hill_chart
+from pid_ensemble import PIDEnsemble, performance_metrics, pid_parameter_grid, pid_parameter_sample
+
+
+class TestPIDEnsemble(unittest.TestCase):
+    def test_parameter_sets(self):
+        grid = pid_parameter_grid([0.6, 1.2], [0.1], [0.0, 0.05], [0.05])
+        self.assertEqual(len(grid), 4)
+        self.assertEqual(grid[1], {'Kp': 0.6, 'Ki': 0.1, 'Kd': 0.05, 'H_tolerance': 0.05})
+
+        ranges = {'Kp': (0.5, 2), 'Ki': (0, 0.2), 'Kd': (0, 0.1), 'H_tolerance': (0.01, 0.1)}
+        sample = pid_parameter_sample(ranges, 20, seed=3)
+        self.assertEqual(sample, pid_parameter_sample(ranges, 20, seed=3))
+        for name, (low, high) in ranges.items():
+            self.assertTrue(all(low <= parameters[name] <= high for parameters in sample))
+
+    def test_metrics(self):
+        results = {'H': np.array([2.0, 2.2, 2.1]), 'power': np.full(3, 1200.0),
+                   'blade_angle': np.array([16.0, 17.0, 16.5]), 'n': np.array([110.0, 110.0, 112.0])}
+        metrics = performance_metrics(results, 2.1, time_step=2)
+        self.assertAlmostEqual(metrics['IAE'], 0.4)
+        self.assertAlmostEqual(metrics['energy'], 0.002)
+        self.assertAlmostEqual(metrics['blade_angle_travel'], 1.5)
+        self.assertAlmostEqual(metrics['n_travel'], 2.0)
+
+    def test_run_every_parameter_set_with_every_scenario(self):
+        surface = HillSurface.from_data(*load_mogu_hill_chart())
+
+        control_parameters = {
+            'Q': 3.3, 'Q_rate': 0.01, 'H_t': 2.15, 'H_t_rate': 0.01, 'n': 110, 'n_rate': 1,
+            'blade_angle': 16, 'blade_angle_rate': 0.1, 'head_control': True, 'blade_angle_lock': False, 'n_lock': False,
+        }
+        scenarios = [FlowScenario.constant(3.3, 60), FlowScenario.sinusoidal(3.3, 0.3, 60, 60)]
+        ensemble = PIDEnsemble(surface, control_parameters, scenarios, duration=60)
+        progress = []
+        ensemble.set_progress_callback(lambda completed, total: progress.append((completed, total)))
+
+        results = ensemble.run(pid_parameter_grid([0.6, 1.2], [0.1], [0.05], [0.05]), max_workers=1)
+        self.assertEqual(list(results['scenario']), [0, 1, 0, 1])
+        self.assertEqual(progress[-1], (4, 4))
+        self.assertTrue(results['error'].isna().all())
+        self.assertTrue((results['energy'] > 0).all())
+
+        # Each run starts afresh: repeating a parameter set gives the same metrics
+        repeated = ensemble.run([{'Kp': 0.6, 'Ki': 0.1, 'Kd': 0.05, 'H_tolerance': 0.05}], max_workers=1)
+        np.testing.assert_allclose(repeated['IAE'], results['IAE'][:2])
+
+        summary = PIDEnsemble.summarize(results)
+        self.assertEqual(len(summary), 2)
+        self.assertTrue(summary['IAE'].is_monotonic_increasing)
+
+
+if __name__ == '__main__':
+    unittest.main()
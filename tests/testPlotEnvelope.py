@@ -0,0 +1,48 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add src to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from plot_envelope import PlotEnvelope
+
+
+class TestPlotEnvelope(unittest.TestCase):
+    def test_bins_hold_the_extremes_of_their_samples(self):
+        x = np.arange(100.0)
+        values = np.column_stack((np.sin(x), x))
+        envelope = PlotEnvelope(0, 100, 10, 2)
+        envelope.add(x[:55], values[:55])
+        envelope.add(x[55:], values[55:])  # Completes the half-filled bin
+
+        np.testing.assert_allclose(envelope.low[:, 1], np.arange(0, 100, 10))
+        np.testing.assert_allclose(envelope.high[:, 1], np.arange(9, 100, 10))
+        np.testing.assert_allclose(envelope.high[:, 0], np.sin(x).reshape(10, 10).max(axis=1))
+
+        line_x, line_y = envelope.line(1)
+        np.testing.assert_allclose(line_x, np.repeat(np.arange(5, 100, 10), 2))
+        np.testing.assert_allclose(line_y[:4], [0, 9, 10, 19])
+
+    def test_empty_bins_and_dropped_samples_are_left_out(self):
+        envelope = PlotEnvelope(0, 10, 10, 1)
+        envelope.add(np.array([0.5, 4.5, 4.7, 9.5]), np.array([[1.0], [2.0], [np.nan], [3.0]]))
+
+        line_x, line_y = envelope.line(0)
+        np.testing.assert_allclose(line_x, [0.5, 0.5, 4.5, 4.5, 9.5, 9.5])
+        np.testing.assert_allclose(line_y, [1, 1, 2, 2, 3, 3])
+
+        line_x, _ = envelope.line(0, x_start=4.2)
+        np.testing.assert_allclose(line_x, [4.5, 4.5, 9.5, 9.5])
+
+    def test_matches(self):
+        envelope = PlotEnvelope(0, 10, 10, 1)
+        self.assertTrue(envelope.matches(0, 10.0, 10))
+        self.assertFalse(envelope.matches(0, 10, 11))
+        self.assertFalse(envelope.matches(1, 10, 10))
+
+
+if __name__ == '__main__':
+    unittest.main()
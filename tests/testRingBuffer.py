@@ -0,0 +1,60 @@
+import os
+import sys
+import threading
+import unittest
+
+import numpy as np
+
+# Add src to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from ring_buffer import RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+    def test_views_follow_the_latest_rows(self):
+        buffer = RingBuffer(('time', 'value'), maxlen=5, headroom=3)
+        self.assertEqual(buffer.view().shape, (0, 2))
+
+        for t in range(23):
+            buffer.append((t, 10 * t))
+            expected = np.arange(max(0, t - 4), t + 1)
+            np.testing.assert_array_equal(buffer.column('time'), expected)
+            np.testing.assert_array_equal(buffer.column('value'), 10 * expected)
+        self.assertEqual(len(buffer), 5)
+        self.assertEqual(buffer.count, 23)
+
+        # Views share the storage and the channels are contiguous
+        view = buffer.column('value')
+        self.assertTrue(np.shares_memory(view, buffer.data))
+        self.assertTrue(view.flags.c_contiguous)
+        self.assertFalse(view.flags.writeable)
+
+        # A view stays valid while the producer appends up to headroom more rows
+        rows = buffer.view()
+        for t in range(23, 26):
+            buffer.append((t, 10 * t))
+        np.testing.assert_array_equal(rows[:, 0], np.arange(18, 23))
+        np.testing.assert_array_equal(buffer.column('time', count=23), np.arange(18, 23))
+
+    def test_consumer_sees_consistent_rows_while_producer_appends(self):
+        buffer = RingBuffer(('time', 'double'), maxlen=100, headroom=100000)
+        done = threading.Event()
+
+        def produce():
+            for t in range(50000):
+                buffer.append((t, 2 * t))
+            done.set()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        while not done.is_set():
+            rows = buffer.view()
+            if len(rows):
+                np.testing.assert_array_equal(rows[:, 1], 2 * rows[:, 0])
+                np.testing.assert_array_equal(np.diff(rows[:, 0]), 1)
+        producer.join()
+
+
+if __name__ == '__main__':
+    unittest.main()
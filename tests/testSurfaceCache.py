@@ -0,0 +1,95 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add src to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from control_processor import ControlProcessor
+from HillChartProcessor import HillChartProcessor
+from surface_cache import SurfaceCache, cache_key
+from turbine_data import TurbineData
+
+
+class TestSurfaceCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = SurfaceCache(os.path.join(self.temp_dir.name, 'cache'))
+        self.csv_path = os.path.join(self.temp_dir.name, 'hill.csv')
+        with open(self.csv_path, 'w') as file:
+            file.write('blade_angle,Q11,n11,efficiency\n10,0.5,100,0.8\n')
+
+        self.data = TurbineData()
+        self.data.n11, self.data.Q11 = np.meshgrid(np.linspace(50, 150, 5), np.linspace(0.5, 1.5, 4))
+        self.data.efficiency = np.full((4, 5), 0.8)
+        self.data.efficiency[0, 0] = np.nan
+        self.data.blade_angle = self.data.n11 / 10
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        key = cache_key(self.csv_path, min_efficiency_limit=0.5)
+        self.assertIsNone(self.cache.load(key))
+        self.assertTrue(self.cache.save(key, self.data))
+
+        loaded = TurbineData()
+        self.assertTrue(self.cache.load_into(key, loaded))
+        for field in ('n11', 'Q11', 'efficiency', 'blade_angle'):
+            np.testing.assert_array_equal(getattr(loaded, field), getattr(self.data, field))
+
+        # Edits of loaded grids stay in memory
+        loaded.efficiency[1, 1] = 0.0
+        self.assertEqual(self.cache.load(key)['efficiency'][1, 1], 0.8)
+
+    def test_key_depends_on_contents_and_parameters(self):
+        key = cache_key(self.csv_path, min_efficiency_limit=0.5)
+        self.assertEqual(cache_key(self.csv_path, min_efficiency_limit=0.5), key)
+        self.assertNotEqual(cache_key(self.csv_path, min_efficiency_limit=0.4), key)
+
+        with open(self.csv_path, 'a') as file:
+            file.write('12,0.6,110,0.82\n')
+        self.assertNotEqual(cache_key(self.csv_path, min_efficiency_limit=0.5), key)
+
+    def test_corrupt_entry_is_discarded(self):
+        key = cache_key(self.csv_path)
+        os.makedirs(self.cache.cache_dir)
+        with open(self.cache.path(key), 'wb') as file:
+            file.write(b'not a numpy file')
+        self.assertIsNone(self.cache.load(key))
+        self.assertFalse(os.path.exists(self.cache.path(key)))
+
+
+class TestSurfaceCacheUse(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = SurfaceCache(self.temp_dir.name)
+        self.csv_path = os.path.join(os.path.dirname(__file__), '../src/Mogu_Ns_114_rpm_extended_dataset.csv')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_cache_is_opt_in(self):
+        self.assertIsNone(HillChartProcessor().surface_cache)
+        self.assertIsNone(ControlProcessor().surface_cache)
+
+    def test_control_processor_keys_the_fit_parameters(self):
+        processor = ControlProcessor(surface_cache=self.cache)
+        processor.load_data(self.csv_path, min_efficiency_limit=0.2, grid_resolution=31)
+        self.assertEqual(processor.simulator.data.efficiency.shape, (31, 31))
+
+        key = cache_key(os.path.abspath(self.csv_path), min_efficiency_limit=0.2, grid_resolution=31, adaptive_grid=False,
+                        extrapolate_n11=False, extrapolate_blade=False)
+        self.assertEqual(os.listdir(self.temp_dir.name), [f"{key}.npy"])
+
+        # Other settings are fitted afresh instead of served the stored surface
+        processor.load_data(self.csv_path, min_efficiency_limit=0.2, grid_resolution=41)
+        self.assertEqual(processor.simulator.data.efficiency.shape, (41, 41))
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+from scipy.interpolate import griddata
+
+# Add src to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from HillChart import HillChart
+from surface_fitting import SurfaceFitter
+
+
+class TestSurfaceFitter(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = rng.uniform(60, 160, 200)
+        self.y = rng.uniform(0.5, 1.5, 200)
+        self.efficiency = 0.9 - 1e-5 * (self.x - 110) ** 2 - 0.2 * (self.y - 1) ** 2
+        self.blade_angle = 0.1 * self.x + 10 * self.y
+
+    def test_matches_cubic_griddata(self):
+        fitter = SurfaceFitter(self.x, self.y)
+        for values in (self.efficiency, self.blade_angle):
+            expected = griddata((self.x, self.y), values, (fitter.x_grid, fitter.y_grid), method='cubic')
+            np.testing.assert_array_equal(fitter.fit(values), expected)
+
+    def test_adaptive_grid_refines_near_maximum(self):
+        fitter = SurfaceFitter(self.x, self.y, num=41, adaptive=True, values=self.efficiency)
+        x_axis, y_axis = fitter.x_grid[0], fitter.y_grid[:, 0]
+        self.assertEqual(fitter.x_grid.shape, (41, 41))
+        self.assertEqual((x_axis[0], x_axis[-1]), (self.x.min(), self.x.max()))
+        self.assertTrue(np.all(np.diff(x_axis) > 0) and np.all(np.diff(y_axis) > 0))
+
+        # Grid lines are closer together around the maximum than at the edges
+        best = np.argmax(self.efficiency)
+        spacing = np.diff(x_axis)
+        self.assertLess(spacing[np.searchsorted(x_axis, self.x[best]) - 1], spacing[0])
+
+    def test_hill_chart_triangulates_once(self):
+        hill_chart = HillChart()
+        hill_chart.data.n11, hill_chart.data.Q11 = self.x, self.y
+        hill_chart.data.efficiency, hill_chart.data.blade_angle = self.efficiency, self.blade_angle
+        hill_chart.prepare_hill_chart_data(min_efficiency_limit=0.5, grid_resolution=51)
+        self.assertEqual(hill_chart.data.efficiency.shape, (51, 51))
+
+        fitter = hill_chart.surface_fitters['fit']
+        self.assertIs(hill_chart.get_surface_fitter(self.x, self.y), fitter)
+        self.assertIsNot(hill_chart.get_surface_fitter(self.x[1:], self.y[1:]), fitter)
+
+    def test_adaptive_grid_follows_its_guiding_values(self):
+        hill_chart = HillChart()
+        hill_chart.data.n11, hill_chart.data.Q11 = self.x, self.y
+        hill_chart.data.efficiency, hill_chart.data.blade_angle = self.efficiency, self.blade_angle
+        hill_chart.prepare_hill_chart_data(min_efficiency_limit=0.5, grid_resolution=41, adaptive_grid=True)
+
+        # Efficiency and blade angle share the grid refined by the efficiency
+        fitter = hill_chart.surface_fitters['fit']
+        np.testing.assert_array_equal(fitter.values, self.efficiency)
+        self.assertIs(hill_chart.get_surface_fitter(self.x, self.y, values=self.efficiency), fitter)
+
+        # A different field at the same points gets its own refinement
+        shifted = 0.9 - 1e-5 * (self.x - 80) ** 2 - 0.2 * (self.y - 1) ** 2
+        refitted = hill_chart.get_surface_fitter(self.x, self.y, values=shifted)
+        self.assertIsNot(refitted, fitter)
+        self.assertFalse(np.array_equal(refitted.x_grid, fitter.x_grid))
+
+
+if __name__ == '__main__':
+    unittest.main()
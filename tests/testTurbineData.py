@@ -0,0 +1,40 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add src to sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from HillChart import HillChart
+
+
+class TestTurbineDataView(unittest.TestCase):
+    def setUp(self):
+        self.hill_chart = HillChart()
+        self.hill_chart.data.n11, self.hill_chart.data.Q11 = np.meshgrid(np.linspace(50, 150, 5), np.linspace(0.5, 1.5, 4))
+        self.hill_chart.data.efficiency = np.full((4, 5), 0.8)
+        self.hill_chart.data.D = [1.5]
+
+    def test_view_shares_grids_read_only(self):
+        view = self.hill_chart.view()
+        self.assertIsInstance(view, HillChart)
+        self.assertTrue(np.shares_memory(view.data.n11, self.hill_chart.data.n11))
+        with self.assertRaises(ValueError):
+            view.data.efficiency[0, 0] = 0.0
+        self.assertTrue(self.hill_chart.data.efficiency.flags.writeable)
+
+    def test_view_operations_leave_original_untouched(self):
+        view = self.hill_chart.view()
+        view.normalize('efficiency', 0.8)
+        view.calculate_cases([1, 4], 2.0, 1.5)
+        np.testing.assert_array_equal(view.data.efficiency, 1.0)
+        np.testing.assert_array_equal(self.hill_chart.data.efficiency, 0.8)
+        self.assertEqual(len(view.data.H), 4)
+        self.assertEqual(len(self.hill_chart.data.H), 0)
+        self.assertEqual(self.hill_chart.data.D, [1.5])
+
+
+if __name__ == '__main__':
+    unittest.main()